@@ -1,7 +1,7 @@
 """Base adapter interface for grant sources."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List
 from models import GrantOpportunity
 
 
@@ -17,6 +17,15 @@ class BaseAdapter(ABC):
         """
         pass
     
+    async def stream_fetch(self) -> AsyncIterator[GrantOpportunity]:
+        """Yield normalized opportunities one at a time.
+        
+        Default implementation wraps fetch_opportunities(); adapters that page
+        through results can override this to yield each page as it arrives.
+        """
+        for opportunity in await self.fetch_opportunities():
+            yield opportunity
+    
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -201,11 +201,11 @@ class GrantsGovAdapter(BaseAdapter):
                 logger.warning(f"Could not parse date: {date_str}")
                 return None
     
-    def _parse_amount(self, amount: Optional[any]) -> Optional[float]:
-        """Parse amount to float."""
+    def _parse_amount(self, amount: Optional[any]) -> Optional[int]:
+        """Parse amount to whole dollars."""
         if amount is None:
             return None
         try:
-            return float(amount)
+            return round(float(amount))
         except (ValueError, TypeError):
             return None
@@ -153,11 +153,11 @@ class SbirGovAdapter(BaseAdapter):
                 logger.warning(f"Could not parse date: {date_str}")
                 return None
 
-    def _parse_amount(self, amount: Optional[any]) -> Optional[float]:
+    def _parse_amount(self, amount: Optional[any]) -> Optional[int]:
         if amount is None:
             return None
         try:
             amount_str = str(amount).replace("$", "").replace(",", "").strip()
-            return float(amount_str) if amount_str else None
+            return round(float(amount_str)) if amount_str else None
         except (ValueError, TypeError):
             return None
@@ -3,8 +3,9 @@
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, AsyncIterable, Dict, List, Optional, Set
 
+from pydantic import TypeAdapter
 from supabase import Client, create_client
 
 from models.grant_opportunity import GrantOpportunity
@@ -12,6 +13,12 @@ from models.eligibility_result import EligibilityResult
 
 logger = logging.getLogger(__name__)
 
+# Rows per insert request when streaming opportunities into the database
+INSERT_BATCH_SIZE = 500
+
+# Validates a full result set of grant rows in one pydantic-core call
+_GRANT_LIST_ADAPTER = TypeAdapter(List[GrantOpportunity])
+
 
 class SupabaseClient:
     """Client for interacting with Supabase grant_opportunities and pipeline_runs tables."""
@@ -66,6 +73,34 @@ class SupabaseClient:
         logger.info("Upserted grant %s", grant.dedup_hash)
         return response.data[0] if response.data else {}
 
+    async def insert_opportunities(
+        self,
+        opportunities: AsyncIterable[GrantOpportunity],
+        batch_size: int = INSERT_BATCH_SIZE,
+    ) -> int:
+        """Insert a stream of grants, buffering into fixed-size batches.
+
+        Only one batch is held in memory at a time, so peak memory is bounded
+        by ``batch_size`` rather than the total number of opportunities.
+
+        Args:
+            opportunities: Async iterable of GrantOpportunity records.
+            batch_size: Maximum rows per insert request.
+
+        Returns:
+            Number of rows inserted.
+        """
+        inserted = 0
+        batch: List[Dict[str, Any]] = []
+        async for grant in opportunities:
+            batch.append(grant.model_dump(mode="json"))
+            if len(batch) >= batch_size:
+                inserted += self._insert_batch(batch)
+                batch = []
+        if batch:
+            inserted += self._insert_batch(batch)
+        return inserted
+
     def save_pipeline_run(
         self,
         started_at: datetime,
@@ -176,4 +211,19 @@ class SupabaseClient:
             .eq("status", status)
             .execute()
         )
-        return [GrantOpportunity(**row) for row in response.data]
+        return _GRANT_LIST_ADAPTER.validate_python(response.data)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _insert_batch(self, records: List[Dict[str, Any]]) -> int:
+        """Insert one batch of grant rows and return the number written."""
+        response = (
+            self._client.table("grant_opportunities")
+            .insert(records)
+            .execute()
+        )
+        count = len(response.data) if response.data else 0
+        logger.info("Inserted batch of %d grants", count)
+        return count
@@ -1,7 +1,7 @@
 """Deduplication logic for grant opportunities."""
 
 import logging
-from typing import List, Set
+from typing import AsyncIterable, AsyncIterator, List, Set
 from models import GrantOpportunity
 
 logger = logging.getLogger(__name__)
@@ -33,18 +33,50 @@ class Deduplicator:
         """
         new_opportunities = []
         duplicate_count = 0
+        existing = self.existing_hashes
         
         for opp in opportunities:
-            if opp.dedup_hash in self.existing_hashes:
+            dedup_hash = opp.dedup_hash
+            if dedup_hash in existing:
                 duplicate_count += 1
-                logger.debug(f"Duplicate found: {opp.source}:{opp.source_opportunity_id}")
+                logger.debug("Duplicate found: %s:%s", opp.source, opp.source_opportunity_id)
             else:
                 new_opportunities.append(opp)
-                self.existing_hashes.add(opp.dedup_hash)
+                existing.add(dedup_hash)
         
         logger.info(f"Deduplication: {len(new_opportunities)} new, {duplicate_count} duplicates")
         return new_opportunities
     
+    async def stream(
+        self, opportunities: AsyncIterable[GrantOpportunity]
+    ) -> AsyncIterator[GrantOpportunity]:
+        """Yield only new opportunities from an async stream.
+        
+        Streaming counterpart of deduplicate(): survivors are yielded as they
+        arrive instead of being collected, so memory stays flat.
+        
+        Args:
+            opportunities: Async iterable of opportunities to deduplicate
+            
+        Yields:
+            New (non-duplicate) opportunities
+        """
+        new_count = 0
+        duplicate_count = 0
+        existing = self.existing_hashes
+        
+        async for opp in opportunities:
+            dedup_hash = opp.dedup_hash
+            if dedup_hash in existing:
+                duplicate_count += 1
+                logger.debug("Duplicate found: %s:%s", opp.source, opp.source_opportunity_id)
+                continue
+            existing.add(dedup_hash)
+            new_count += 1
+            yield opp
+        
+        logger.info(f"Deduplication: {new_count} new, {duplicate_count} duplicates")
+    
     def add_hash(self, dedup_hash: str):
         """Add a hash to the existing set (for after DB insert)."""
         self.existing_hashes.add(dedup_hash)
@@ -16,9 +16,30 @@ logger = logging.getLogger(__name__)
 # Agencies where VTKL typically participates as subawardee (not prime)
 SUB_ONLY_AGENCIES = {"NSF", "NIH", "DOE-SC"}
 
-
-
-def assess_eligibility(opportunity: GrantOpportunity) -> EligibilityResult:
+# NAICS lookup sets, built once from the profile
+_NAICS_PRIMARY = frozenset(VTKL_PROFILE["naics_primary"])
+_NAICS_ALL = _NAICS_PRIMARY | frozenset(VTKL_PROFILE["naics_optional"])
+
+# Lowercase phrases searched for in the opportunity's description + raw_text
+_NONPROFIT_TERMS = ("non-profit only", "nonprofit only", "501(c)(3) required", "charitable organization")
+_ACADEMIC_TERMS = ("university only", "academic institution required", "r1 institution")
+_GOVERNMENT_TERMS = ("government entity only", "federal agency", "state agency only")
+_CLEARANCE_TERMS = ("top secret", "ts/sci", "ts clearance")
+_HAWAII_EXCLUSION_TERMS = ("excluding hawaii", "hawaii not eligible", "continental us only", "conus only")
+_8A_TERMS = ("8(a) only", "8a only", "sba 8(a)", "requires 8(a)", "must be 8(a) certified")
+_HUBZONE_TERMS = ("hubzone only", "hubzone required", "must be hubzone certified")
+_NHO_TERMS = ("native hawaiian organization", "nho set-aside", "nho-owned")
+_SUB_ONLY_TERMS = (
+    "subaward only", "subcontract only", "teaming required",
+    "prime must be university", "prime must be academic",
+    "industry partner", "industry subcontractor",
+)
+
+
+def assess_eligibility(
+    opportunity: GrantOpportunity,
+    evaluated_at: Optional[datetime] = None
+) -> EligibilityResult:
     """Assess opportunity eligibility against VTKL profile.
     
     Performs six constraint checks:
@@ -29,20 +50,35 @@ def assess_eligibility(opportunity: GrantOpportunity) -> EligibilityResult:
     5. Location eligibility
     6. Certification requirements (CRITICAL BLOCKER: 8(a)/HUBZone)
     
+    NAICS is checked first; a mismatch returns immediately with the other
+    five checks marked as not evaluated.
+    
     Args:
         opportunity: Grant opportunity to assess
+        evaluated_at: Assessment timestamp; batch callers pass one shared
+            value. Defaults to now (UTC).
         
     Returns:
         EligibilityResult with detailed check results
     """
     
-    # Run all six constraint checks
-    entity_check = _check_entity_type(opportunity)
-    location_check = _check_location(opportunity)
-    sam_check = _check_sam_registration(opportunity)
+    evaluated_at = evaluated_at or datetime.now(timezone.utc)
+    
+    # NAICS first: it is the most selective check, so most rejects exit here
     naics_check = _check_naics_match(opportunity)
-    security_check = _check_security_posture(opportunity)
-    certification_check = _check_certifications(opportunity)
+    if not naics_check.is_met:
+        return _naics_rejection(opportunity, naics_check, evaluated_at)
+    
+    # Lowercase the free text once; every text-based check reads this copy
+    text_lower = _opportunity_text_lower(opportunity)
+    is_nho = _is_nho_set_aside(opportunity, text_lower)
+    
+    # Run the remaining constraint checks
+    entity_check = _check_entity_type(text_lower)
+    location_check = _check_location(text_lower, is_nho)
+    sam_check = _check_sam_registration(opportunity, evaluated_at)
+    security_check = _check_security_posture(text_lower)
+    certification_check = _check_certifications(opportunity, text_lower)
     
     # Collect all checks
     all_checks = [
@@ -62,7 +98,8 @@ def assess_eligibility(opportunity: GrantOpportunity) -> EligibilityResult:
         is_eligible,
         opportunity,
         naics_check.is_met,
-        certification_check.is_met
+        certification_check.is_met,
+        text_lower
     )
     
     # Categorize findings
@@ -76,7 +113,7 @@ def assess_eligibility(opportunity: GrantOpportunity) -> EligibilityResult:
     
     # Check for favorable factors
     if location_check.is_met and VTKL_PROFILE["location"]["nho_eligible"]:
-        if _is_nho_set_aside(opportunity):
+        if is_nho:
             assets.append("NHO (Native Hawaiian Organization) set-aside eligible")
     
     if naics_check.is_met:
@@ -104,40 +141,29 @@ def assess_eligibility(opportunity: GrantOpportunity) -> EligibilityResult:
         blockers=blockers,
         assets=assets,
         warnings=warnings,
-        evaluated_at=datetime.now(timezone.utc),
+        evaluated_at=evaluated_at,
         vtkl_profile_version="1.0"
     )
 
 
-def _check_entity_type(opportunity: GrantOpportunity) -> ConstraintCheck:
-    """Check if VTKL's entity type matches opportunity requirements."""
+def _opportunity_text_lower(opportunity: GrantOpportunity) -> str:
+    """Lowercased description + raw_text, the text all keyword checks search.
     
-    # VTKL is a for-profit corporation
-    vtkl_type = VTKL_PROFILE["entity_type"]
+    Joins only the segments that are present, so a missing raw_text does not
+    cost an extra copy of the description before lowercasing.
+    """
+    return " ".join(s for s in (opportunity.description, opportunity.raw_text) if s).lower()
+
+
+def _check_entity_type(text_lower: str) -> ConstraintCheck:
+    """Check if VTKL's entity type matches opportunity requirements."""
     
-    # Check opportunity requirements (look in description/raw_text)
-    text = (opportunity.description or "") + " " + (opportunity.raw_text or "")
-    text_lower = text.lower()
+    # VTKL is a for-profit corporation; look for requirements in description/raw_text
     
     # Blockers: requires non-profit, academic, or government entity
-    requires_nonprofit = any(term in text_lower for term in [
-        "non-profit only",
-        "nonprofit only",
-        "501(c)(3) required",
-        "charitable organization"
-    ])
-    
-    requires_academic = any(term in text_lower for term in [
-        "university only",
-        "academic institution required",
-        "r1 institution"
-    ])
-    
-    requires_government = any(term in text_lower for term in [
-        "government entity only",
-        "federal agency",
-        "state agency only"
-    ])
+    requires_nonprofit = any(term in text_lower for term in _NONPROFIT_TERMS)
+    requires_academic = any(term in text_lower for term in _ACADEMIC_TERMS)
+    requires_government = any(term in text_lower for term in _GOVERNMENT_TERMS)
     
     if requires_nonprofit or requires_academic or requires_government:
         return ConstraintCheck(
@@ -153,7 +179,7 @@ def _check_entity_type(opportunity: GrantOpportunity) -> ConstraintCheck:
     )
 
 
-def _check_sam_registration(opportunity: GrantOpportunity) -> ConstraintCheck:
+def _check_sam_registration(opportunity: GrantOpportunity, now: datetime) -> ConstraintCheck:
     """Check if VTKL's SAM registration is active through opportunity deadline."""
     
     sam_expiry = VTKL_PROFILE["sam_registration"]["expiry_date"]
@@ -175,7 +201,7 @@ def _check_sam_registration(opportunity: GrantOpportunity) -> ConstraintCheck:
         )
     
     # No deadline specified, check if currently active
-    if sam_expiry > datetime.now(timezone.utc):
+    if sam_expiry > now:
         return ConstraintCheck(
             constraint_name="SAM Registration",
             is_met=True,
@@ -189,13 +215,37 @@ def _check_sam_registration(opportunity: GrantOpportunity) -> ConstraintCheck:
     )
 
 
+def _naics_rejection(
+    opportunity: GrantOpportunity, naics_check: ConstraintCheck, evaluated_at: datetime
+) -> EligibilityResult:
+    """Build the ineligible result for a NAICS mismatch without running other checks."""
+    
+    def skipped(name: str) -> ConstraintCheck:
+        return ConstraintCheck(
+            constraint_name=name,
+            is_met=None,
+            details="Not evaluated (NAICS mismatch)"
+        )
+    
+    return EligibilityResult(
+        opportunity_id=opportunity.source_opportunity_id,
+        is_eligible=False,
+        participation_path=None,
+        entity_type_check=skipped("Entity Type"),
+        location_check=skipped("Location"),
+        sam_active_check=skipped("SAM Registration"),
+        naics_match_check=naics_check,
+        security_posture_check=skipped("Security Posture"),
+        certification_check=skipped("Certifications"),
+        blockers=[f"{naics_check.constraint_name}: {naics_check.details}"],
+        evaluated_at=evaluated_at,
+        vtkl_profile_version="1.0"
+    )
+
+
 def _check_naics_match(opportunity: GrantOpportunity) -> ConstraintCheck:
     """Check if opportunity allows VTKL's NAICS codes."""
     
-    vtkl_primary = VTKL_PROFILE["naics_primary"]
-    vtkl_optional = VTKL_PROFILE["naics_optional"]
-    all_vtkl_naics = vtkl_primary + vtkl_optional
-    
     opp_naics = opportunity.naics_codes or []
     
     if not opp_naics:
@@ -206,48 +256,37 @@ def _check_naics_match(opportunity: GrantOpportunity) -> ConstraintCheck:
             details="No NAICS restrictions specified"
         )
     
-    # Check for any matches
-    matches = [code for code in opp_naics if code in all_vtkl_naics]
+    # Fast path: no overlap at all with VTKL's codes
+    if _NAICS_ALL.isdisjoint(opp_naics):
+        return ConstraintCheck(
+            constraint_name="NAICS Match",
+            is_met=False,
+            details=f"Required NAICS {', '.join(opp_naics[:3])} not in VTKL profile"
+        )
     
-    if matches:
-        primary_matches = [code for code in matches if code in vtkl_primary]
-        if primary_matches:
-            return ConstraintCheck(
-                constraint_name="NAICS Match",
-                is_met=True,
-                details=f"Primary NAICS match: {', '.join(primary_matches)}"
-            )
-        else:
-            return ConstraintCheck(
-                constraint_name="NAICS Match",
-                is_met=True,
-                details=f"Optional NAICS match: {', '.join(matches)}"
-            )
+    primary_matches = [code for code in opp_naics if code in _NAICS_PRIMARY]
+    if primary_matches:
+        return ConstraintCheck(
+            constraint_name="NAICS Match",
+            is_met=True,
+            details=f"Primary NAICS match: {', '.join(primary_matches)}"
+        )
     
+    matches = [code for code in opp_naics if code in _NAICS_ALL]
     return ConstraintCheck(
         constraint_name="NAICS Match",
-        is_met=False,
-        details=f"Required NAICS {', '.join(opp_naics[:3])} not in VTKL profile"
+        is_met=True,
+        details=f"Optional NAICS match: {', '.join(matches)}"
     )
 
 
-def _check_security_posture(opportunity: GrantOpportunity) -> ConstraintCheck:
-    """Check if VTKL can meet security clearance requirements."""
-    
-    vtkl_posture = VTKL_PROFILE["security_posture"]  # ["IL2", "IL3", "IL4"]
-    
-    # Check opportunity requirements
-    text = (opportunity.description or "") + " " + (opportunity.raw_text or "")
-    text_upper = text.upper()
+def _check_security_posture(text_lower: str) -> ConstraintCheck:
+    """Check if VTKL can meet security clearance requirements (VTKL: IL2-IL4)."""
     
     # Look for security requirements
-    requires_il5 = "IL5" in text_upper or "IMPACT LEVEL 5" in text_upper
-    requires_il6 = "IL6" in text_upper or "IMPACT LEVEL 6" in text_upper
-    requires_ts = any(term in text_upper for term in [
-        "TOP SECRET",
-        "TS/SCI",
-        "TS CLEARANCE"
-    ])
+    requires_il5 = "il5" in text_lower or "impact level 5" in text_lower
+    requires_il6 = "il6" in text_lower or "impact level 6" in text_lower
+    requires_ts = any(term in text_lower for term in _CLEARANCE_TERMS)
     
     if requires_il5 or requires_il6 or requires_ts:
         return ConstraintCheck(
@@ -257,7 +296,7 @@ def _check_security_posture(opportunity: GrantOpportunity) -> ConstraintCheck:
         )
     
     # Check for IL2-IL4 mentions (which VTKL can handle)
-    requires_security = any(f"IL{level}" in text_upper for level in [2, 3, 4])
+    requires_security = any(level in text_lower for level in ("il2", "il3", "il4"))
     
     if requires_security:
         return ConstraintCheck(
@@ -273,22 +312,13 @@ def _check_security_posture(opportunity: GrantOpportunity) -> ConstraintCheck:
     )
 
 
-def _check_location(opportunity: GrantOpportunity) -> ConstraintCheck:
+def _check_location(text_lower: str, is_nho: bool) -> ConstraintCheck:
     """Check if VTKL's Hawaii location is eligible."""
     
-    vtkl_state = VTKL_PROFILE["location"]["state"]
     vtkl_nho = VTKL_PROFILE["location"]["nho_eligible"]
     
-    text = (opportunity.description or "") + " " + (opportunity.raw_text or "")
-    text_lower = text.lower()
-    
     # Check for geographic restrictions
-    excludes_hi = any(term in text_lower for term in [
-        "excluding hawaii",
-        "hawaii not eligible",
-        "continental us only",
-        "conus only"
-    ])
+    excludes_hi = any(term in text_lower for term in _HAWAII_EXCLUSION_TERMS)
     
     if excludes_hi:
         return ConstraintCheck(
@@ -297,9 +327,7 @@ def _check_location(opportunity: GrantOpportunity) -> ConstraintCheck:
             details="Opportunity excludes Hawaii"
         )
     
-    # Check for NHO set-aside (highly favorable)
-    is_nho = _is_nho_set_aside(opportunity)
-    
+    # NHO set-aside is highly favorable
     if is_nho and vtkl_nho:
         return ConstraintCheck(
             constraint_name="Location",
@@ -314,34 +342,20 @@ def _check_location(opportunity: GrantOpportunity) -> ConstraintCheck:
     )
 
 
-def _check_certifications(opportunity: GrantOpportunity) -> ConstraintCheck:
+def _check_certifications(opportunity: GrantOpportunity, text_lower: str) -> ConstraintCheck:
     """Check certification requirements. CRITICAL: 8(a) and HUBZone are HARD BLOCKERS."""
     
     vtkl_certs = VTKL_PROFILE["certifications"]
     
-    # Check set_aside_type field
+    # Check set_aside_type field, then description/raw_text
     set_aside = (opportunity.set_aside_type or "").lower()
     
-    # Also check description/raw_text
-    text = (opportunity.description or "") + " " + (opportunity.raw_text or "")
-    text_lower = text.lower()
-    
     # CRITICAL BLOCKERS
-    requires_8a = any(term in set_aside for term in ["8(a)", "8a"]) or \
-                  any(term in text_lower for term in [
-                      "8(a) only",
-                      "8a only",
-                      "sba 8(a)",
-                      "requires 8(a)",
-                      "must be 8(a) certified"
-                  ])
+    requires_8a = any(term in set_aside for term in ("8(a)", "8a")) or \
+                  any(term in text_lower for term in _8A_TERMS)
     
     requires_hubzone = "hubzone" in set_aside or \
-                       any(term in text_lower for term in [
-                           "hubzone only",
-                           "hubzone required",
-                           "must be hubzone certified"
-                       ])
+                       any(term in text_lower for term in _HUBZONE_TERMS)
     
     if requires_8a and not vtkl_certs.get("8(a)", False):
         return ConstraintCheck(
@@ -392,27 +406,22 @@ def _check_certifications(opportunity: GrantOpportunity) -> ConstraintCheck:
     )
 
 
-def _is_nho_set_aside(opportunity: GrantOpportunity) -> bool:
+def _is_nho_set_aside(opportunity: GrantOpportunity, text_lower: str) -> bool:
     """Check if opportunity is a Native Hawaiian Organization set-aside."""
     
     set_aside = (opportunity.set_aside_type or "").lower()
-    text = (opportunity.description or "") + " " + (opportunity.raw_text or "")
-    text_lower = text.lower()
     
     return "nho" in set_aside or \
            "native hawaiian" in set_aside or \
-           any(term in text_lower for term in [
-               "native hawaiian organization",
-               "nho set-aside",
-               "nho-owned"
-           ])
+           any(term in text_lower for term in _NHO_TERMS)
 
 
 def _determine_participation_path(
     is_eligible: bool,
     opportunity: GrantOpportunity,
     naics_match: bool,
-    cert_check: bool
+    cert_check: bool,
+    text_lower: str
 ) -> Optional[str]:
     """Determine if VTKL can participate as prime or subawardee.
     
@@ -421,6 +430,7 @@ def _determine_participation_path(
         opportunity: Grant opportunity
         naics_match: Whether NAICS codes match
         cert_check: Whether certification check passed
+        text_lower: Lowercased description + raw_text
         
     Returns:
         "prime", "subawardee", or None
@@ -436,13 +446,7 @@ def _determine_participation_path(
         return "subawardee"
     
     # Also check for keywords indicating sub-only
-    text = (opportunity.description or "") + " " + (opportunity.raw_text or "")
-    text_lower = text.lower()
-    if any(term in text_lower for term in [
-        "subaward only", "subcontract only", "teaming required",
-        "prime must be university", "prime must be academic",
-        "industry partner", "industry subcontractor"
-    ]):
+    if any(term in text_lower for term in _SUB_ONLY_TERMS):
         return "subawardee"
     
     # If all checks pass including NAICS, likely prime candidate
@@ -524,10 +528,12 @@ def run_eligibility_batch(*, supabase_client=None) -> list[EligibilityResult]:
     rows = resp.data or []
     logger.info("Found %d grants with status='new'", len(rows))
 
+    # One timestamp for the whole batch
+    evaluated_at = datetime.now(timezone.utc)
     results: list[EligibilityResult] = []
     for row in rows:
         opp = GrantOpportunity(**row)
-        result = assess_eligibility(opp)
+        result = assess_eligibility(opp, evaluated_at)
         persist_result(result, supabase_client=supabase_client)
         results.append(result)
 
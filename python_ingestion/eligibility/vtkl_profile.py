@@ -7,6 +7,11 @@ Environment variable overrides (prefixed VTKL_) take precedence over defaults.
 import os
 from datetime import datetime, timezone
 
+_UTC = timezone.utc
+
+# Default SAM registration expiry when VTKL_SAM_EXPIRY is not set
+_DEFAULT_SAM_EXPIRY = datetime(2026, 11, 11, tzinfo=_UTC)
+
 
 def _env(key: str, default: str) -> str:
     """Read VTKL_ prefixed env var with fallback."""
@@ -43,9 +48,9 @@ def _build_profile() -> dict:
     if sam_expiry_str:
         sam_expiry = datetime.fromisoformat(sam_expiry_str)
         if sam_expiry.tzinfo is None:
-            sam_expiry = sam_expiry.replace(tzinfo=timezone.utc)
+            sam_expiry = sam_expiry.replace(tzinfo=_UTC)
     else:
-        sam_expiry = datetime(2026, 11, 11, tzinfo=timezone.utc)
+        sam_expiry = _DEFAULT_SAM_EXPIRY
 
     return {
         "entity_type": _env("ENTITY_TYPE", "for-profit_corporation"),
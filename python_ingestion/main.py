@@ -11,13 +11,16 @@ import asyncio
 import logging
 import sys
 from datetime import datetime
+from typing import AsyncIterator
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
-from .config import load_config
+from .config import Config, load_config
 from .adapters import GrantsGovAdapter, SamGovAdapter, SbirGovAdapter
+from .adapters.base import BaseAdapter
 from .deduplicator import Deduplicator
 from .database import SupabaseClient
+from .models import GrantOpportunity
 
 # Configure logging
 logging.basicConfig(
@@ -27,77 +30,100 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 60
 
-async def poll_all_sources():
+
+async def _stream_all_sources(adapters) -> AsyncIterator[GrantOpportunity]:
+    """Yield opportunities from each adapter in turn, isolating adapter failures."""
+    total = 0
+    for adapter in adapters:
+        count = 0
+        try:
+            logger.info("Fetching from %s...", adapter.source_name)
+            async for opportunity in adapter.stream_fetch():
+                count += 1
+                yield opportunity
+            logger.info("✓ %s: %d opportunities", adapter.source_name, count)
+        except Exception as e:
+            logger.error("✗ %s failed: %s", adapter.source_name, e, exc_info=True)
+            # Continue with other sources
+        total += count
+    
+    logger.info("Total opportunities fetched: %d", total)
+
+
+def build_pipeline(config: Config) -> tuple[SupabaseClient, list[BaseAdapter], Deduplicator]:
+    """Construct the long-lived database client, adapters and deduplicator.
+    
+    Built once per process so connections and the in-memory hash set are
+    reused across polling cycles instead of rebuilt every 60 minutes.
+    """
+    db_client = SupabaseClient(config.database_url)
+    
+    adapters = [
+        GrantsGovAdapter(attribution_header=config.grants_gov_attribution),
+        SamGovAdapter(api_key=config.sam_api_key),
+        SbirGovAdapter(),
+    ]
+    
+    # Seed dedup hashes once; each cycle adds new hashes in memory
+    deduplicator = Deduplicator(db_client.get_existing_hashes())
+    
+    return db_client, adapters, deduplicator
+
+
+async def poll_all_sources(
+    db_client: SupabaseClient,
+    adapters: list[BaseAdapter],
+    deduplicator: Deduplicator,
+):
     """Poll all three federal grant sources and ingest opportunities.
     
     Per INTAKE BLOCK 1 acceptance criteria:
     - All three federal source adapters return ≥1 GrantOpportunity record
     - Deduplicator prevents duplicates
     - Full polling cycle completes in <5 minutes locally
+    
+    Args:
+        db_client: Shared database client (see build_pipeline)
+        adapters: Shared source adapters
+        deduplicator: Deduplicator whose hash set persists across cycles
     """
-    logger.info("=" * 60)
+    logger.info(_BANNER)
     logger.info("Starting polling cycle")
-    logger.info("=" * 60)
+    logger.info(_BANNER)
     start_time = datetime.utcnow()
     
     try:
-        # Load configuration
-        config = load_config()
-        
-        # Initialize database client
-        db_client = SupabaseClient(config.database_url)
-        
-        # Load existing hashes for deduplication
-        existing_hashes = await db_client.get_existing_hashes()
-        deduplicator = Deduplicator(existing_hashes)
-        
-        # Initialize adapters
-        adapters = [
-            GrantsGovAdapter(attribution_header=config.grants_gov_attribution),
-            SamGovAdapter(api_key=config.sam_api_key),
-            SbirGovAdapter(),
-        ]
-        
-        # Fetch from all sources
-        all_opportunities = []
-        for adapter in adapters:
-            try:
-                logger.info(f"Fetching from {adapter.source_name}...")
-                opportunities = await adapter.fetch_opportunities()
-                logger.info(f"✓ {adapter.source_name}: {len(opportunities)} opportunities")
-                all_opportunities.extend(opportunities)
-            except Exception as e:
-                logger.error(f"✗ {adapter.source_name} failed: {e}", exc_info=True)
-                # Continue with other sources
-        
-        logger.info(f"Total opportunities fetched: {len(all_opportunities)}")
-        
-        # Deduplicate
-        new_opportunities = deduplicator.deduplicate(all_opportunities)
-        logger.info(f"New opportunities after deduplication: {len(new_opportunities)}")
-        
-        # Insert into database
-        if new_opportunities:
-            inserted_count = await db_client.insert_opportunities(new_opportunities)
-            logger.info(f"✓ Inserted {inserted_count} opportunities into database")
+        # Stream fetch -> dedup -> insert without materializing the full result set
+        inserted_count = await db_client.insert_opportunities(
+            deduplicator.stream(_stream_all_sources(adapters))
+        )
+        if inserted_count:
+            logger.info("✓ Inserted %d opportunities into database", inserted_count)
         else:
             logger.info("No new opportunities to insert")
         
         # Log cycle completion time
         duration = (datetime.utcnow() - start_time).total_seconds()
-        logger.info("=" * 60)
-        logger.info(f"Polling cycle completed in {duration:.2f} seconds")
-        logger.info("=" * 60)
+        logger.info(_BANNER)
+        logger.info("Polling cycle completed in %.2f seconds", duration)
+        logger.info(_BANNER)
         
     except Exception as e:
-        logger.error(f"Polling cycle failed: {e}", exc_info=True)
+        logger.error("Polling cycle failed: %s", e, exc_info=True)
+        # Hashes claimed during a failed insert may not be in the database;
+        # resync so the next cycle retries them.
+        try:
+            deduplicator.existing_hashes = db_client.get_existing_hashes()
+        except Exception as resync_error:
+            logger.warning("Could not resync dedup hashes: %s", resync_error)
         raise
 
 
 async def run_once():
     """Run polling cycle once (for testing and manual execution)."""
-    await poll_all_sources()
+    await poll_all_sources(*build_pipeline(load_config()))
 
 
 def start_scheduler():
@@ -112,7 +138,10 @@ def start_scheduler():
     logging.getLogger().setLevel(config.log_level)
     
     logger.info("Initializing Grant Ingestion Pipeline")
-    logger.info(f"Polling interval: {config.polling_interval_minutes} minutes")
+    logger.info("Polling interval: %d minutes", config.polling_interval_minutes)
+    
+    # Shared across every polling cycle
+    pipeline = build_pipeline(config)
     
     # Create scheduler
     scheduler = AsyncIOScheduler()
@@ -120,6 +149,7 @@ def start_scheduler():
     # Add polling job
     scheduler.add_job(
         poll_all_sources,
+        args=pipeline,
         trigger=IntervalTrigger(minutes=config.polling_interval_minutes),
         id="poll_grants",
         name="Poll all federal grant sources",
@@ -133,7 +163,7 @@ def start_scheduler():
     
     # Run first cycle immediately
     logger.info("Running initial polling cycle...")
-    asyncio.create_task(poll_all_sources())
+    asyncio.create_task(poll_all_sources(*pipeline))
     
     # Keep running
     try:
@@ -0,0 +1,66 @@
+-- Migration 003: verdict_report_inputs view + get_verdict_inputs RPC
+-- Collapses the scoring / eligibility / teaming / raw_text lookups made by
+-- VerdictReportGenerator.generate into a single round-trip.
+
+-- =============================================================================
+-- verdict_report_inputs — one row per opportunity, payload shaped like the
+-- ScoringResult / EligibilityResult / TeamingPartner models
+-- =============================================================================
+CREATE OR REPLACE VIEW verdict_report_inputs AS
+SELECT
+    g.source_opportunity_id AS opportunity_id,
+    g.raw_text,
+    CASE WHEN s.opportunity_id IS NOT NULL THEN jsonb_build_object(
+        'opportunity_id',          s.opportunity_id,
+        'mission_fit',             jsonb_build_object('score', s.mission_fit_score,
+                                                      'evidence_citations', s.mission_fit_citations),
+        'eligibility',             jsonb_build_object('score', s.eligibility_score,
+                                                      'evidence_citations', s.eligibility_citations),
+        'technical_alignment',     jsonb_build_object('score', s.technical_alignment_score,
+                                                      'evidence_citations', s.technical_alignment_citations),
+        'financial_viability',     jsonb_build_object('score', s.financial_viability_score,
+                                                      'evidence_citations', s.financial_viability_citations),
+        'strategic_value',         jsonb_build_object('score', s.strategic_value_score,
+                                                      'evidence_citations', s.strategic_value_citations),
+        'composite_score',         s.composite_score,
+        'verdict',                 s.verdict,
+        'scored_at',               s.scored_at,
+        'scoring_weights_version', s.scoring_weights_version,
+        'llm_model',               s.llm_model
+    ) END AS scoring,
+    CASE WHEN e.opportunity_id IS NOT NULL
+        THEN to_jsonb(e) - 'id' - 'created_at'
+    END AS eligibility,
+    tp.teaming_partners
+FROM grant_opportunities g
+LEFT JOIN LATERAL (
+    SELECT * FROM scoring_results
+    WHERE opportunity_id = g.source_opportunity_id
+    ORDER BY scored_at DESC
+    LIMIT 1
+) s ON true
+LEFT JOIN LATERAL (
+    SELECT * FROM eligibility_results
+    WHERE opportunity_id = g.source_opportunity_id
+    ORDER BY evaluated_at DESC
+    LIMIT 1
+) e ON true
+LEFT JOIN LATERAL (
+    SELECT COALESCE(jsonb_agg(to_jsonb(t) - 'id' - 'created_at'), '[]'::jsonb) AS teaming_partners
+    FROM teaming_partners t
+    WHERE t.opportunity_id = g.source_opportunity_id
+) tp ON true;
+
+-- =============================================================================
+-- get_verdict_inputs — RPC entry point used by the reporter
+-- =============================================================================
+CREATE OR REPLACE FUNCTION get_verdict_inputs(oid text)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT to_jsonb(v)
+    FROM verdict_report_inputs v
+    WHERE v.opportunity_id = oid
+    LIMIT 1;
+$$;
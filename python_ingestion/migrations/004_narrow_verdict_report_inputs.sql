@@ -0,0 +1,83 @@
+-- Migration 004: Narrow verdict_report_inputs projections
+-- Replace the whole-row to_jsonb() payloads with the columns the
+-- EligibilityResult / TeamingPartner models actually consume.
+
+CREATE OR REPLACE VIEW verdict_report_inputs AS
+SELECT
+    g.source_opportunity_id AS opportunity_id,
+    g.raw_text,
+    CASE WHEN s.opportunity_id IS NOT NULL THEN jsonb_build_object(
+        'opportunity_id',          s.opportunity_id,
+        'mission_fit',             jsonb_build_object('score', s.mission_fit_score,
+                                                      'evidence_citations', s.mission_fit_citations),
+        'eligibility',             jsonb_build_object('score', s.eligibility_score,
+                                                      'evidence_citations', s.eligibility_citations),
+        'technical_alignment',     jsonb_build_object('score', s.technical_alignment_score,
+                                                      'evidence_citations', s.technical_alignment_citations),
+        'financial_viability',     jsonb_build_object('score', s.financial_viability_score,
+                                                      'evidence_citations', s.financial_viability_citations),
+        'strategic_value',         jsonb_build_object('score', s.strategic_value_score,
+                                                      'evidence_citations', s.strategic_value_citations),
+        'composite_score',         s.composite_score,
+        'verdict',                 s.verdict,
+        'scored_at',               s.scored_at,
+        'scoring_weights_version', s.scoring_weights_version,
+        'llm_model',               s.llm_model
+    ) END AS scoring,
+    CASE WHEN e.opportunity_id IS NOT NULL THEN jsonb_build_object(
+        'opportunity_id',         e.opportunity_id,
+        'is_eligible',            e.is_eligible,
+        'participation_path',     e.participation_path,
+        'entity_type_check',      e.entity_type_check,
+        'location_check',         e.location_check,
+        'sam_active_check',       e.sam_active_check,
+        'naics_match_check',      e.naics_match_check,
+        'security_posture_check', e.security_posture_check,
+        'certification_check',    e.certification_check,
+        'blockers',               e.blockers,
+        'assets',                 e.assets,
+        'warnings',               e.warnings
+    ) END AS eligibility,
+    tp.teaming_partners
+FROM grant_opportunities g
+LEFT JOIN LATERAL (
+    SELECT
+        opportunity_id, scored_at, scoring_weights_version, llm_model,
+        composite_score, verdict,
+        mission_fit_score, mission_fit_citations,
+        eligibility_score, eligibility_citations,
+        technical_alignment_score, technical_alignment_citations,
+        financial_viability_score, financial_viability_citations,
+        strategic_value_score, strategic_value_citations
+    FROM scoring_results
+    WHERE opportunity_id = g.source_opportunity_id
+    ORDER BY scored_at DESC
+    LIMIT 1
+) s ON true
+LEFT JOIN LATERAL (
+    SELECT
+        opportunity_id, is_eligible, participation_path,
+        entity_type_check, location_check, sam_active_check,
+        naics_match_check, security_posture_check, certification_check,
+        blockers, assets, warnings
+    FROM eligibility_results
+    WHERE opportunity_id = g.source_opportunity_id
+    ORDER BY evaluated_at DESC
+    LIMIT 1
+) e ON true
+LEFT JOIN LATERAL (
+    SELECT COALESCE(
+        jsonb_agg(jsonb_build_object(
+            'opportunity_id',   t.opportunity_id,
+            'partner_name',     t.partner_name,
+            'partner_role',     t.partner_role,
+            'rationale',        t.rationale,
+            'source',           t.source,
+            'naics_codes',      t.naics_codes,
+            'past_agency_work', t.past_agency_work
+        )),
+        '[]'::jsonb
+    ) AS teaming_partners
+    FROM teaming_partners t
+    WHERE t.opportunity_id = g.source_opportunity_id
+) tp ON true;
@@ -6,9 +6,13 @@ from pydantic import BaseModel, Field
 
 
 class ConstraintCheck(BaseModel):
-    """Individual constraint check result."""
+    """Individual constraint check result.
+    
+    ``is_met`` is None when the check was not evaluated (e.g. skipped after
+    an earlier disqualifying check), so it is never mistaken for a pass.
+    """
     constraint_name: str
-    is_met: bool
+    is_met: Optional[bool]
     details: Optional[str] = None
 
 
@@ -42,6 +46,17 @@ class EligibilityResult(BaseModel):
     evaluated_at: datetime = Field(default_factory=datetime.utcnow)
     vtkl_profile_version: str = Field(default="1.0", description="VTKL profile version used")
     
+    # Joined forms used by report builders
+    @property
+    def blockers_joined(self) -> str:
+        """Blockers joined with "; "."""
+        return "; ".join(self.blockers)
+    
+    @property
+    def warnings_joined(self) -> str:
+        """Warnings joined with "; "."""
+        return "; ".join(self.warnings)
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -1,8 +1,9 @@
 """GrantOpportunity - Shared model for normalized grant data from all sources."""
 
+import sys
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class GrantOpportunity(BaseModel):
@@ -27,9 +28,9 @@ class GrantOpportunity(BaseModel):
     archive_date: Optional[datetime] = Field(None, description="Archive/close date")
     
     # Financial
-    award_amount_min: Optional[float] = Field(None, description="Minimum award amount")
-    award_amount_max: Optional[float] = Field(None, description="Maximum award amount")
-    estimated_total_program_funding: Optional[float] = Field(None, description="Total program funding")
+    award_amount_min: Optional[int] = Field(None, description="Minimum award amount (whole dollars)")
+    award_amount_max: Optional[int] = Field(None, description="Maximum award amount (whole dollars)")
+    estimated_total_program_funding: Optional[int] = Field(None, description="Total program funding (whole dollars)")
     
     # Classification
     naics_codes: list[str] = Field(default_factory=list, description="NAICS codes")
@@ -51,6 +52,20 @@ class GrantOpportunity(BaseModel):
     # SBIR-specific flag (per INTAKE BLOCK 1 acceptance criteria)
     sbir_program_active: bool = Field(default=False, description="SBIR program reauthorization status")
     
+    @field_validator(
+        "award_amount_min", "award_amount_max", "estimated_total_program_funding", mode="before"
+    )
+    @classmethod
+    def _whole_dollars(cls, v):
+        """Round float amounts (API payloads, double precision DB columns) to whole dollars."""
+        return round(v) if isinstance(v, float) else v
+    
+    @field_validator("source", "opportunity_type", "set_aside_type")
+    @classmethod
+    def _intern(cls, v: Optional[str]) -> Optional[str]:
+        """Intern low-cardinality labels so every record shares one string object."""
+        return sys.intern(v) if v is not None else v
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -62,8 +77,8 @@ class GrantOpportunity(BaseModel):
                 "opportunity_number": "HHS-OS-24-001",
                 "posted_date": "2024-01-15T00:00:00Z",
                 "response_deadline": "2024-03-18T23:59:59Z",
-                "award_amount_min": 1000000.0,
-                "award_amount_max": 2500000.0,
+                "award_amount_min": 1000000,
+                "award_amount_max": 2500000,
                 "naics_codes": ["541511", "541512"],
                 "set_aside_type": "Small Business",
                 "opportunity_type": "Grant",
@@ -6,9 +6,16 @@ from pydantic import BaseModel, Field
 
 
 class DimensionScore(BaseModel):
-    """Individual dimension score with evidence."""
+    """Individual dimension score with evidence.
+    
+    Frozen: the scorer's response cache hands the same instance to every
+    ScoringResult that re-scores identical grant text.
+    """
     score: float = Field(..., ge=0, le=100, description="0-100 score")
     evidence_citations: list[str] = Field(..., description="Direct quotes from raw_text")
+    
+    class Config:
+        frozen = True
 
 
 class ScoringResult(BaseModel):
@@ -1,8 +1,11 @@
 """VerdictReportGenerator - Generates verdict reports and executive summaries."""
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Optional
 
+from pydantic import TypeAdapter
+
 from database.client import SupabaseClient
 from models.verdict_report import VerdictReport, RoadmapPhase
 from models.scoring_result import ScoringResult
@@ -11,6 +14,27 @@ from models.teaming_partner import TeamingPartner
 
 logger = logging.getLogger(__name__)
 
+# Maximum opportunities per read/insert request in generate_batch
+REPORT_BATCH_SIZE = 100
+
+# Background writers for verdict_reports inserts issued by generate()
+_INSERT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="verdict-insert")
+
+# Validates the whole teaming_partners array in a single pydantic-core call
+_TEAMING_LIST_ADAPTER = TypeAdapter(list[TeamingPartner])
+
+
+def _log_insert_failure(future: Future) -> None:
+    """Log a failed background verdict_reports insert as soon as it happens."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background verdict report insert failed: %s", exc, exc_info=exc)
+
+
+def _first_or(items: list[str], default: str) -> str:
+    """Return the first item of a list, or ``default`` if it is empty."""
+    return items[0] if items else default
+
 
 class VerdictReportGenerator:
     """Generates verdict reports combining scoring, eligibility, and teaming data."""
@@ -22,18 +46,27 @@ class VerdictReportGenerator:
             supabase_client: Database client for querying pipeline results.
         """
         self.client = supabase_client
+        self._pending_inserts: list[Future] = []
 
-    def generate(self, opportunity_id: str) -> VerdictReport:
+    def generate(self, opportunity_id: str, background: bool = False) -> VerdictReport:
         """Generate verdict report for an opportunity.
         
-        Queries scoring_results, eligibility_results, and teaming_partners
-        to build a comprehensive VerdictReport.
+        Fetches scoring_results, eligibility_results, teaming_partners and
+        the opportunity raw_text in one get_verdict_inputs RPC call to build
+        a comprehensive VerdictReport.
         
         GO/SHAPE verdicts get full reports with all 5 sections.
         MONITOR/NO-GO get abbreviated reports (verdict card + risk assessment only).
         
+        The report is inserted into verdict_reports before returning. With
+        ``background=True`` the insert runs on a background thread instead; call
+        flush() before relying on it being stored. Background failures are
+        logged as they happen and raised again by flush().
+        
         Args:
             opportunity_id: Opportunity source ID.
+            background: Insert on a background thread instead of before
+                returning, overlapping it with generating the next report.
             
         Returns:
             Generated VerdictReport with status "awaiting_human_approval".
@@ -43,54 +76,123 @@ class VerdictReportGenerator:
         """
         logger.info(f"Generating verdict report for opportunity: {opportunity_id}")
         
-        # Query scoring results
-        scoring_response = (
+        # Single round-trip: scoring, eligibility, teaming and raw_text are
+        # joined server-side by the get_verdict_inputs RPC (migration 003).
+        response = (
             self.client._client
-            .table("scoring_results")
-            .select("*")
-            .eq("opportunity_id", opportunity_id)
-            .single()
+            .rpc("get_verdict_inputs", {"oid": opportunity_id})
             .execute()
         )
-        if not scoring_response.data:
-            raise ValueError(f"No scoring results found for {opportunity_id}")
+        inputs = response.data or {}
         
-        scoring = ScoringResult(**scoring_response.data)
+        report = self._build_report(opportunity_id, inputs)
         
-        # Query eligibility results
-        eligibility_response = (
-            self.client._client
-            .table("eligibility_results")
-            .select("*")
-            .eq("opportunity_id", opportunity_id)
-            .single()
-            .execute()
+        if background:
+            future = _INSERT_POOL.submit(self._save_report, report)
+            future.add_done_callback(_log_insert_failure)
+            self._pending_inserts.append(future)
+        else:
+            self._save_report(report)
+        
+        logger.info(
+            f"Verdict report generated: {report.verdict} ({report.composite_score:.1f})"
         )
-        if not eligibility_response.data:
-            raise ValueError(f"No eligibility results found for {opportunity_id}")
+        return report
+
+    def flush(self) -> None:
+        """Wait for all pending background inserts from generate(background=True).
         
-        eligibility = EligibilityResult(**eligibility_response.data)
+        Raises:
+            Exception: The first insert failure, after all inserts have finished.
+        """
+        pending, self._pending_inserts = self._pending_inserts, []
+        wait(pending)
         
-        # Query teaming partners (may be empty list)
-        teaming_response = (
-            self.client._client
-            .table("teaming_partners")
-            .select("*")
-            .eq("opportunity_id", opportunity_id)
-            .execute()
-        )
-        teaming_partners = [TeamingPartner(**row) for row in teaming_response.data]
+        errors = [future.exception() for future in pending if future.exception()]
+        if errors:
+            logger.error(f"{len(errors)}/{len(pending)} verdict report inserts failed")
+            raise errors[0]
+
+    def generate_batch(
+        self, opportunity_ids: list[str], batch_size: int = REPORT_BATCH_SIZE
+    ) -> list[VerdictReport]:
+        """Generate verdict reports for many opportunities with batched I/O.
         
-        # Query grant opportunity for raw_text
-        grant_response = (
-            self.client._client
-            .table("grant_opportunities")
-            .select("raw_text")
-            .eq("source_opportunity_id", opportunity_id)
-            .single()
-            .execute()
+        Reads all inputs from the verdict_report_inputs view and inserts
+        reports into verdict_reports ``batch_size`` rows per request.
+        Opportunities with missing scoring or eligibility data are skipped.
+        
+        Args:
+            opportunity_ids: Opportunity source IDs.
+            batch_size: Maximum rows per query/insert request.
+            
+        Returns:
+            Generated VerdictReports, in input order, for opportunities that had data.
+        """
+        reports = []
+        
+        for start in range(0, len(opportunity_ids), batch_size):
+            chunk = opportunity_ids[start:start + batch_size]
+            
+            response = (
+                self.client._client
+                .table("verdict_report_inputs")
+                .select("*")
+                .in_("opportunity_id", chunk)
+                .execute()
+            )
+            inputs_by_id = {row["opportunity_id"]: row for row in response.data or []}
+            
+            chunk_reports = []
+            for opportunity_id in chunk:
+                try:
+                    chunk_reports.append(
+                        self._build_report(opportunity_id, inputs_by_id.get(opportunity_id, {}))
+                    )
+                except ValueError as e:
+                    logger.warning(f"Skipping verdict report: {e}")
+            
+            if chunk_reports:
+                self.client._client.table("verdict_reports").insert(
+                    [report.model_dump(mode="json") for report in chunk_reports]
+                ).execute()
+            
+            reports.extend(chunk_reports)
+        
+        logger.info(f"Generated {len(reports)}/{len(opportunity_ids)} verdict reports")
+        return reports
+
+    def _save_report(self, report: VerdictReport) -> None:
+        """Serialize and insert one report (runs on the insert pool)."""
+        self.client._client.table("verdict_reports").insert(
+            report.model_dump(mode="json")
+        ).execute()
+        logger.info(f"Verdict report saved: {report.opportunity_id}")
+
+    def _build_report(self, opportunity_id: str, inputs: dict) -> VerdictReport:
+        """Build a VerdictReport from a verdict_report_inputs payload.
+        
+        Args:
+            opportunity_id: Opportunity source ID.
+            inputs: Row with scoring, eligibility, teaming_partners and raw_text.
+            
+        Returns:
+            Unsaved VerdictReport with status "awaiting_human_approval".
+            
+        Raises:
+            ValueError: If scoring or eligibility data is missing.
+        """
+        if not inputs.get("scoring"):
+            raise ValueError(f"No scoring results found for {opportunity_id}")
+        if not inputs.get("eligibility"):
+            raise ValueError(f"No eligibility results found for {opportunity_id}")
+        
+        scoring = ScoringResult(**inputs["scoring"])
+        eligibility = EligibilityResult(**inputs["eligibility"])
+        teaming_partners = _TEAMING_LIST_ADAPTER.validate_python(
+            inputs.get("teaming_partners") or []
         )
-        raw_text = grant_response.data.get("raw_text", "") if grant_response.data else ""
+        raw_text = inputs.get("raw_text") or ""
         
         # Build report components
         verdict = scoring.verdict
@@ -116,7 +218,7 @@ class VerdictReportGenerator:
             one_pager_pitch = self._build_one_pager_pitch(scoring, eligibility, raw_text)
         
         # Create report
-        report = VerdictReport(
+        return VerdictReport(
             opportunity_id=opportunity_id,
             verdict=verdict,
             composite_score=composite_score,
@@ -127,14 +229,6 @@ class VerdictReportGenerator:
             one_pager_pitch=one_pager_pitch,
             status="awaiting_human_approval"
         )
-        
-        # Save to database
-        self.client._client.table("verdict_reports").insert(
-            report.model_dump(mode="json")
-        ).execute()
-        
-        logger.info(f"Verdict report generated and saved: {verdict} ({composite_score:.1f})")
-        return report
 
     def _build_verdict_rationale(
         self, scoring: ScoringResult, eligibility: EligibilityResult
@@ -152,14 +246,14 @@ class VerdictReportGenerator:
         
         for name, dimension in dimensions:
             if dimension.score >= 70:
-                evidence = dimension.evidence_citations[0] if dimension.evidence_citations else "N/A"
+                evidence = _first_or(dimension.evidence_citations, "N/A")
                 rationale_parts.append(
                     f"{name}: {dimension.score:.0f}/100 - {evidence}"
                 )
         
         # Include eligibility issues
         if eligibility.blockers:
-            rationale_parts.append(f"Eligibility blockers: {'; '.join(eligibility.blockers)}")
+            rationale_parts.append(f"Eligibility blockers: {eligibility.blockers_joined}")
         
         return ". ".join(rationale_parts) if rationale_parts else "No significant findings."
 
@@ -177,20 +271,14 @@ class VerdictReportGenerator:
         sentences = []
         
         # Sentence 1: Opportunity description with mission fit evidence
-        mission_evidence = (
-            scoring.mission_fit.evidence_citations[0]
-            if scoring.mission_fit.evidence_citations
-            else "federal opportunity"
-        )
+        mission_evidence = _first_or(scoring.mission_fit.evidence_citations, "federal opportunity")
         sentences.append(
             f"This opportunity focuses on {mission_evidence.lower()}."
         )
         
         # Sentence 2: VTKL's capabilities
-        tech_evidence = (
-            scoring.technical_alignment.evidence_citations[0]
-            if scoring.technical_alignment.evidence_citations
-            else "relevant technical capabilities"
+        tech_evidence = _first_or(
+            scoring.technical_alignment.evidence_citations, "relevant technical capabilities"
         )
         sentences.append(
             f"VTKL has strong alignment with {tech_evidence.lower()}."
@@ -203,8 +291,9 @@ class VerdictReportGenerator:
                     f"Opportunity is eligible for pursuit with composite score of {scoring.composite_score:.0f}/100."
                 )
             else:
+                blocker = _first_or(eligibility.blockers, "constraints")
                 sentences.append(
-                    f"Opportunity requires shaping due to: {eligibility.blockers[0] if eligibility.blockers else 'constraints'}."
+                    f"Opportunity requires shaping due to: {blocker}."
                 )
         else:  # MONITOR or NO-GO
             if eligibility.blockers:
@@ -223,10 +312,10 @@ class VerdictReportGenerator:
         sections = []
         
         if eligibility.blockers:
-            sections.append(f"**Blockers:** {'; '.join(eligibility.blockers)}")
+            sections.append(f"**Blockers:** {eligibility.blockers_joined}")
         
         if eligibility.warnings:
-            sections.append(f"**Warnings:** {'; '.join(eligibility.warnings)}")
+            sections.append(f"**Warnings:** {eligibility.warnings_joined}")
         else:
             sections.append("**Warnings:** None identified")
         
@@ -291,7 +380,7 @@ class VerdictReportGenerator:
         pitch_sections = []
         
         # Opening: Opportunity overview
-        mission_ev = scoring.mission_fit.evidence_citations[0] if scoring.mission_fit.evidence_citations else "mission"
+        mission_ev = _first_or(scoring.mission_fit.evidence_citations, "mission")
         pitch_sections.append(
             f"**Opportunity:** {mission_ev.capitalize()}."
         )
@@ -303,21 +392,16 @@ class VerdictReportGenerator:
         )
         
         # Technical fit
-        tech_ev = scoring.technical_alignment.evidence_citations[0] if scoring.technical_alignment.evidence_citations else "technical requirements"
+        tech_ev = _first_or(scoring.technical_alignment.evidence_citations, "technical requirements")
         pitch_sections.append(
             f"**Technical Alignment:** Our team has direct experience with {tech_ev.lower()}, "
             f"scoring {scoring.technical_alignment.score:.0f}/100 on technical fit."
         )
         
         # Differentiators
-        differentiators = []
-        if eligibility.assets:
-            differentiators.extend(eligibility.assets)
-        differentiators.append("Hawaii-based small business with active SAM registration")
-        
-        pitch_sections.append(
-            f"**Differentiators:** {'; '.join(differentiators)}."
-        )
+        differentiators = [*eligibility.assets, "Hawaii-based small business with active SAM registration"]
+        diffs_joined = "; ".join(differentiators)
+        pitch_sections.append(f"**Differentiators:** {diffs_joined}.")
         
         # Call to action
         pitch_sections.append(
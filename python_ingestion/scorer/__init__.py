@@ -1,11 +1,12 @@
 """Weighted scoring engine for VTKL grant opportunities."""
 
-from .engine import score_opportunity
+from .engine import score_opportunity, score_opportunity_sync
 from .weights import DEFAULT_WEIGHTS, load_weights, ScoringWeights
 from .semantic_map import SEMANTIC_MAPPINGS, find_semantic_matches
 
 __all__ = [
     "score_opportunity",
+    "score_opportunity_sync",
     "DEFAULT_WEIGHTS",
     "load_weights",
     "ScoringWeights",
@@ -3,29 +3,193 @@
 Implements five-dimension scoring with evidence-based citations.
 """
 
-import json
+from __future__ import annotations
+
+import asyncio
+import atexit
+import hashlib
+import operator
 import os
+import re
+import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
-import anthropic
+from pydantic import BaseModel, TypeAdapter
 
 from models.grant_opportunity import GrantOpportunity
 from models.eligibility_result import EligibilityResult
 from models.scoring_result import ScoringResult, DimensionScore
-from .weights import DEFAULT_WEIGHTS, ScoringWeights
-from .prompts import get_prompt_for_dimension
+from .weights import DEFAULT_WEIGHTS, SCORE_DIMENSIONS, ScoringWeights
+from .prompts import get_prompt_blocks
+from .semantic_map import SEMANTIC_MAPPINGS
+
+if TYPE_CHECKING:
+    import anthropic
 
 
 # Model configuration
 DEFAULT_LLM_MODEL = "claude-haiku-4-5"
 
+# Output cap for dimension calls; the JSON reply ({score, <=3 citations}) is
+# well under this, and output tokens dominate per-call latency
+LLM_MAX_TOKENS = 400
+
+# Character budget for raw_text in LLM prompts. Long documents keep their
+# opening section plus capability-relevant sentences from the rest.
+RAW_TEXT_CHAR_BUDGET = 8000
+_RAW_TEXT_HEAD_CHARS = 6000
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_CAPABILITY_TERMS = re.compile(
+    r"(?<!\w)(?:"
+    + "|".join(
+        re.escape(term)
+        for term in sorted(
+            {t for key, terms in SEMANTIC_MAPPINGS.items() for t in (key, *terms)},
+            key=len,
+            reverse=True,
+        )
+    )
+    + r")(?!\w)",
+    re.IGNORECASE,
+)
+
+# Maximum rows per write request in score_and_save_batch
+SAVE_BATCH_SIZE = 100
+
+# Maximum opportunities scored at once in score_and_save_batch; each sends
+# up to four dimension calls, so this caps in-flight LLM requests at 4x
+SCORING_CONCURRENCY = 8
+
+# Dimensions scored by the LLM (eligibility is auto-calculated)
+LLM_DIMENSIONS = ("mission_fit", "technical_alignment", "financial_viability", "strategic_value")
+
+# Dimensions judged purely from description/raw_text. Stub listings with
+# neither get this baseline instead of an LLM call; financial viability and
+# strategic value still have the award amounts and agency to go on.
+TEXT_ONLY_DIMENSIONS = ("mission_fit", "technical_alignment")
+NO_TEXT_SCORE = 20.0
+
+# Anthropic clients, one per event loop; reusing one keeps its HTTP connection
+# pool warm. The async connection pool is tied to the loop it was opened on, so
+# each loop gets its own client, dropped once the loop is garbage-collected.
+# Sync entry points run on a long-lived loop per thread (_SYNC_LOCAL.loop), so
+# repeated sync calls from the same thread keep the same client.
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, anthropic.AsyncAnthropic]" = (
+    weakref.WeakKeyDictionary()
+)
+_SYNC_LOCAL = threading.local()
+_SYNC_LOOPS: list[asyncio.AbstractEventLoop] = []
+_SYNC_LOOPS_LOCK = threading.Lock()
+
+
+def _get_client() -> anthropic.AsyncAnthropic:
+    """Return the Anthropic client for the running event loop.
+    
+    Returns:
+        Shared AsyncAnthropic client instance
+    """
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None:
+        # Imported lazily: the SDK is only needed once something is actually scored
+        import anthropic
+        
+        client = anthropic.AsyncAnthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+        _CLIENTS[loop] = client
+    return client
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion on the calling thread's long-lived loop.
+    
+    Unlike asyncio.run, the loop outlives the call, so the thread's client
+    and its connection pool are reused by the next sync call. Each thread
+    gets its own loop, so sync entry points are safe to call concurrently.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+        
+    Raises:
+        RuntimeError: If called from a thread with a running event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "Sync scoring API called from a running event loop; "
+            "use 'await score_opportunity(...)' instead"
+        )
+    
+    loop = getattr(_SYNC_LOCAL, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _SYNC_LOCAL.loop = loop
+        with _SYNC_LOOPS_LOCK:
+            _SYNC_LOOPS.append(loop)
+    return loop.run_until_complete(coro)
+
+
+@atexit.register
+def _close_sync_loops() -> None:
+    """Close each sync loop's client and then the loop itself."""
+    with _SYNC_LOOPS_LOCK:
+        loops, _SYNC_LOOPS[:] = list(_SYNC_LOOPS), []
+    for loop in loops:
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            client = _CLIENTS.get(loop)
+            if client is not None:
+                loop.run_until_complete(client.close())
+        except Exception:
+            pass
+        finally:
+            loop.close()
+
+
+# In-process LRU of successful dimension scores, keyed by (dimension, model,
+# grant-text digest), so retries and re-scores skip the API call. Dimension
+# instructions are fixed per dimension, so the grant text is the only
+# variable part of a prompt and is hashed once per opportunity.
+_RESPONSE_CACHE_SIZE = 512
+_RESPONSE_CACHE: "OrderedDict[str, DimensionScore]" = OrderedDict()
+
+
+class _DimensionLLMResponse(BaseModel):
+    """JSON object each dimension prompt asks the LLM to return."""
+    score: float
+    evidence_citations: list[str]
+
+
+# Built once; validate_json parses and validates in pydantic-core
+_LLM_RESPONSE_ADAPTER = TypeAdapter(_DimensionLLMResponse)
 
-def score_opportunity(
+
+def _grant_text_digest(grant_text: str) -> str:
+    """Content hash of the prepared grant text shared by all dimension prompts."""
+    return hashlib.blake2b(grant_text.encode(), digest_size=16).hexdigest()
+
+
+def _response_cache_key(dimension: str, model: str, text_digest: str) -> str:
+    """Build the response cache key for a dimension prompt."""
+    return f"{dimension}\0{model}\0{text_digest}"
+
+
+async def score_opportunity(
     opportunity: GrantOpportunity,
     eligibility: EligibilityResult,
     weights: ScoringWeights = DEFAULT_WEIGHTS,
-    llm_model: str = DEFAULT_LLM_MODEL
+    llm_model: str = DEFAULT_LLM_MODEL,
+    scored_at: Optional[datetime] = None
 ) -> ScoringResult:
     """Score grant opportunity across five weighted dimensions using LLM.
     
@@ -41,68 +205,71 @@ def score_opportunity(
         eligibility: Eligibility assessment result
         weights: Scoring weights configuration
         llm_model: Anthropic model to use (default: claude-haiku-4-5)
+        scored_at: Timestamp to record; batch callers stamp once and share it
+            (default: now, UTC)
         
     Returns:
         ScoringResult with dimension scores and composite score
     """
     
-    # Prepare grant text for LLM
-    grant_text = _prepare_grant_text(opportunity)
-    
-    # Initialize Anthropic client
-    client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-    
     # Score eligibility dimension (auto-calculated, no LLM call)
     eligibility_score = _score_eligibility(eligibility, opportunity)
     
-    # Score other 4 dimensions via LLM (skip if ineligible to save API calls)
     if not eligibility.is_eligible:
-        # For ineligible opportunities, set eligibility score to 0 and skip LLM for efficiency
-        # Still call LLM for other dimensions but expect low scores
-        mission_fit = _score_dimension_with_llm(client, "mission_fit", grant_text, llm_model)
-        technical_alignment = _score_dimension_with_llm(client, "technical_alignment", grant_text, llm_model)
-        financial_viability = _score_dimension_with_llm(client, "financial_viability", grant_text, llm_model)
-        strategic_value = _score_dimension_with_llm(client, "strategic_value", grant_text, llm_model)
-        
-        # Apply penalty for ineligibility
-        mission_fit = _apply_ineligibility_penalty(mission_fit)
-        technical_alignment = _apply_ineligibility_penalty(technical_alignment)
-        financial_viability = _apply_ineligibility_penalty(financial_viability)
-        strategic_value = _apply_ineligibility_penalty(strategic_value)
+        # Ineligible opportunities cannot reach GO; skip the LLM entirely
+        llm_scores = {
+            dimension: DimensionScore(score=0.0, evidence_citations=["Skipped - ineligible"])
+            for dimension in LLM_DIMENSIONS
+        }
     else:
-        # Eligible - score all dimensions normally
-        mission_fit = _score_dimension_with_llm(client, "mission_fit", grant_text, llm_model)
-        technical_alignment = _score_dimension_with_llm(client, "technical_alignment", grant_text, llm_model)
-        financial_viability = _score_dimension_with_llm(client, "financial_viability", grant_text, llm_model)
-        strategic_value = _score_dimension_with_llm(client, "strategic_value", grant_text, llm_model)
-    
-    # Calculate weighted composite score
-    composite_score = (
-        mission_fit.score * weights.mission_fit +
-        eligibility_score.score * weights.eligibility +
-        technical_alignment.score * weights.technical_alignment +
-        financial_viability.score * weights.financial_viability +
-        strategic_value.score * weights.strategic_value
-    )
+        # Prepare grant text for LLM
+        grant_text = _prepare_grant_text(opportunity)
+        
+        if _has_free_text(opportunity):
+            # Score other 4 dimensions via LLM, concurrently
+            llm_scores = await _score_llm_dimensions(_get_client(), grant_text, llm_model)
+        else:
+            llm_scores = {
+                dimension: DimensionScore(
+                    score=NO_TEXT_SCORE, evidence_citations=["No description available"]
+                )
+                for dimension in TEXT_ONLY_DIMENSIONS
+            }
+            llm_scores.update(await _score_llm_dimensions(
+                _get_client(),
+                grant_text,
+                llm_model,
+                [d for d in LLM_DIMENSIONS if d not in TEXT_ONLY_DIMENSIONS]
+            ))
+    
+    dimension_scores = {"eligibility": eligibility_score, **llm_scores}
+    
+    # Weighted composite: dot product of score and weight vectors
+    score_vector = [dimension_scores[dimension].score for dimension in SCORE_DIMENSIONS]
+    composite_score = sum(map(operator.mul, score_vector, weights.as_vector()))
     
     # Determine verdict based on thresholds
     verdict = _get_verdict(composite_score)
     
     return ScoringResult(
         opportunity_id=opportunity.source_opportunity_id,
-        mission_fit=mission_fit,
-        eligibility=eligibility_score,
-        technical_alignment=technical_alignment,
-        financial_viability=financial_viability,
-        strategic_value=strategic_value,
+        **dimension_scores,
         composite_score=round(composite_score, 2),
         verdict=verdict,
-        scored_at=datetime.now(timezone.utc),
+        scored_at=scored_at or datetime.now(timezone.utc),
         scoring_weights_version=weights.version,
         llm_model=llm_model
     )
 
 
+def _has_free_text(opportunity: GrantOpportunity) -> bool:
+    """Whether the opportunity has any description or raw_text to evaluate."""
+    return bool(
+        (opportunity.description and not opportunity.description.isspace())
+        or (opportunity.raw_text and not opportunity.raw_text.isspace())
+    )
+
+
 def _prepare_grant_text(opportunity: GrantOpportunity) -> str:
     """Prepare comprehensive grant text for LLM evaluation.
     
@@ -132,62 +299,133 @@ def _prepare_grant_text(opportunity: GrantOpportunity) -> str:
             parts.append(f"Award Amount: ${award_min:,.0f}")
     
     if opportunity.raw_text:
-        parts.append(f"Full Text: {opportunity.raw_text}")
+        parts.append(f"Full Text: {_budget_raw_text(opportunity.raw_text)}")
     
     return "\n\n".join(parts)
 
 
-def _score_dimension_with_llm(
-    client: anthropic.Anthropic,
+def _budget_raw_text(raw_text: str, budget: int = RAW_TEXT_CHAR_BUDGET) -> str:
+    """Trim raw_text to roughly ``budget`` characters for the LLM prompt.
+    
+    Keeps the opening of the document, then fills the remaining budget with
+    sentences from later sections that mention VTKL capability terms.
+    
+    Args:
+        raw_text: Full opportunity text
+        budget: Approximate character budget
+        
+    Returns:
+        raw_text unchanged if within budget, otherwise a condensed excerpt
+    """
+    if len(raw_text) <= budget:
+        return raw_text
+    
+    head_chars = min(_RAW_TEXT_HEAD_CHARS, budget)
+    remaining = budget - head_chars
+    excerpts = []
+    
+    for sentence in _SENTENCE_SPLIT.split(raw_text[head_chars:]):
+        if remaining <= 0:
+            break
+        if _CAPABILITY_TERMS.search(sentence):
+            sentence = sentence.strip()[:remaining]
+            excerpts.append(sentence)
+            remaining -= len(sentence) + 1
+    
+    head = raw_text[:head_chars]
+    if not excerpts:
+        return head + " [...]"
+    return head + " [...] " + " ".join(excerpts)
+
+
+async def _score_llm_dimensions(
+    client: anthropic.AsyncAnthropic,
+    grant_text: str,
+    model: str,
+    dimensions: Sequence[str] = LLM_DIMENSIONS
+) -> dict[str, DimensionScore]:
+    """Score LLM dimensions concurrently.
+    
+    The dimension prompts are independent, so issuing them in parallel costs
+    roughly one API round-trip instead of one per dimension.
+    
+    Args:
+        client: Async Anthropic client instance
+        grant_text: Prepared grant text
+        model: Model identifier
+        dimensions: Dimensions to score (default: all LLM dimensions)
+        
+    Returns:
+        Mapping of dimension name to DimensionScore
+    """
+    text_digest = _grant_text_digest(grant_text)
+    scores = await asyncio.gather(*(
+        _score_dimension_with_llm(client, dimension, grant_text, model, text_digest)
+        for dimension in dimensions
+    ))
+    return dict(zip(dimensions, scores, strict=True))
+
+
+async def _score_dimension_with_llm(
+    client: anthropic.AsyncAnthropic,
     dimension: str,
     grant_text: str,
-    model: str
+    model: str,
+    text_digest: Optional[str] = None
 ) -> DimensionScore:
     """Score a single dimension using Anthropic LLM.
     
     Args:
-        client: Anthropic client instance
+        client: Async Anthropic client instance
         dimension: Dimension name (mission_fit, technical_alignment, etc.)
         grant_text: Prepared grant text
         model: Model identifier
+        text_digest: Precomputed _grant_text_digest(grant_text), if available
         
     Returns:
         DimensionScore with score and evidence citations
     """
     
+    # Cache hits return before any prompt is assembled
+    cache_key = _response_cache_key(dimension, model, text_digest or _grant_text_digest(grant_text))
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        _RESPONSE_CACHE.move_to_end(cache_key)
+        return cached
+    
     # Get prompt for this dimension
-    prompt = get_prompt_for_dimension(dimension, grant_text)
+    content = get_prompt_blocks(dimension, grant_text)
     
     # Call Anthropic API
     try:
-        message = client.messages.create(
+        message = await client.messages.create(
             model=model,
-            max_tokens=1024,
+            max_tokens=LLM_MAX_TOKENS,
+            temperature=0.0,
             messages=[
-                {"role": "user", "content": prompt}
+                {"role": "user", "content": content}
             ]
         )
         
-        # Parse JSON response
-        response_text = message.content[0].text
-        result = json.loads(response_text)
+        # Parse and type-check the JSON response in one pass
+        parsed = _LLM_RESPONSE_ADAPTER.validate_json(message.content[0].text)
         
-        score = float(result["score"])
-        citations = result["evidence_citations"]
+        # Clamp rather than reject out-of-range scores
+        score = max(0.0, min(100.0, parsed.score))
         
-        # Validate score range
-        score = max(0.0, min(100.0, score))
+        # Limit to 3 citations, ensuring we have at least one
+        citations = parsed.evidence_citations[:3] or ["No specific evidence provided"]
         
-        # Ensure we have at least one citation
-        if not citations:
-            citations = ["No specific evidence provided"]
+        result = DimensionScore(score=score, evidence_citations=citations)
         
-        return DimensionScore(
-            score=score,
-            evidence_citations=citations[:3]  # Limit to 3 citations
-        )
+        # Only successful parses are cached; fallbacks below are retried next time
+        _RESPONSE_CACHE[cache_key] = result
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+        
+        return result
         
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
+    except ValueError as e:
         # Fallback if LLM response is malformed
         return DimensionScore(
             score=50.0,
@@ -246,22 +484,6 @@ def _score_eligibility(eligibility: EligibilityResult, opportunity: GrantOpportu
     )
 
 
-def _apply_ineligibility_penalty(dimension_score: DimensionScore, penalty_factor: float = 0.2) -> DimensionScore:
-    """Apply penalty to dimension score for ineligible opportunities.
-    
-    Args:
-        dimension_score: Original dimension score
-        penalty_factor: Factor to multiply score by (default 0.2 = 80% penalty)
-        
-    Returns:
-        New DimensionScore with penalized score
-    """
-    return DimensionScore(
-        score=dimension_score.score * penalty_factor,
-        evidence_citations=dimension_score.evidence_citations
-    )
-
-
 def _get_verdict(composite_score: float) -> str:
     """Determine verdict based on composite score thresholds.
     
@@ -282,48 +504,24 @@ def _get_verdict(composite_score: float) -> str:
         return "NO-GO"
 
 
-def _extract_quote(text: str, keyword: str, max_length: int = 150) -> str:
-    """Extract a relevant quote containing the keyword.
+def score_opportunity_sync(
+    opportunity: GrantOpportunity,
+    eligibility: EligibilityResult,
+    weights: ScoringWeights = DEFAULT_WEIGHTS,
+    llm_model: str = DEFAULT_LLM_MODEL
+) -> ScoringResult:
+    """Blocking wrapper around score_opportunity for callers without an event loop.
     
     Args:
-        text: Full text to search
-        keyword: Keyword to find
-        max_length: Maximum quote length
+        opportunity: Grant opportunity to score
+        eligibility: Eligibility assessment result
+        weights: Scoring weights configuration
+        llm_model: Anthropic model to use
         
     Returns:
-        Extracted quote or empty string
+        ScoringResult with dimension scores and composite score
     """
-    
-    text_lower = text.lower()
-    keyword_lower = keyword.lower()
-    
-    idx = text_lower.find(keyword_lower)
-    if idx == -1:
-        return ""
-    
-    # Find sentence boundaries
-    start = max(0, idx - 75)
-    end = min(len(text), idx + 75)
-    
-    # Try to find sentence start
-    period_before = text.rfind('. ', 0, idx)
-    if period_before != -1 and period_before > start:
-        start = period_before + 2
-    
-    # Try to find sentence end
-    period_after = text.find('. ', idx)
-    if period_after != -1 and period_after < end:
-        end = period_after + 1
-    
-    quote = text[start:end].strip()
-    
-    if len(quote) > max_length:
-        quote = quote[:max_length].strip() + "..."
-    
-    if start > 0:
-        quote = "..." + quote
-    
-    return quote
+    return _run_sync(score_opportunity(opportunity, eligibility, weights, llm_model))
 
 
 # Optional: Function to save scoring result to database
@@ -350,10 +548,97 @@ def score_and_save(
     """
     
     # Score the opportunity
-    result = score_opportunity(opportunity, eligibility, weights, llm_model)
+    result = score_opportunity_sync(opportunity, eligibility, weights, llm_model)
     
     # Save to database
-    scoring_data = {
+    db_client.table("scoring_results").insert(_scoring_row(result)).execute()
+    
+    # Update grant status to "scored"
+    db_client.table("grant_opportunities").update(
+        {"status": "scored"}
+    ).eq("source_opportunity_id", opportunity.source_opportunity_id).execute()
+    
+    return result
+
+
+def score_and_save_batch(
+    opportunities: list[GrantOpportunity],
+    eligibilities: list[EligibilityResult],
+    db_client,  # Supabase client or similar
+    weights: ScoringWeights = DEFAULT_WEIGHTS,
+    llm_model: str = DEFAULT_LLM_MODEL,
+    batch_size: int = SAVE_BATCH_SIZE,
+    max_concurrency: int = SCORING_CONCURRENCY
+) -> list[ScoringResult]:
+    """Score many opportunities and save results with batched writes.
+    
+    Scoring runs concurrently on one event loop, at most ``max_concurrency``
+    opportunities (each up to four dimension calls) at a time;
+    scoring_results rows are inserted ``batch_size`` at a time and grant
+    statuses are updated in a single request per batch.
+    
+    Args:
+        opportunities: Grant opportunities to score
+        eligibilities: Eligibility results, parallel to ``opportunities``
+        db_client: Database client for saving results
+        weights: Scoring weights configuration
+        llm_model: Anthropic model to use
+        batch_size: Maximum rows per write request
+        max_concurrency: Maximum opportunities being scored at once
+        
+    Returns:
+        ScoringResults in the same order as ``opportunities``
+    """
+    
+    if len(opportunities) != len(eligibilities):
+        raise ValueError(
+            f"Got {len(opportunities)} opportunities but {len(eligibilities)} eligibility results"
+        )
+    
+    # One timestamp (and one ISO string) for the whole batch
+    scored_at = datetime.now(timezone.utc)
+    scored_at_iso = scored_at.isoformat()
+    
+    async def _score_all() -> list[ScoringResult]:
+        # Bounded so a large batch doesn't fire every dimension call at once
+        # and turn rate-limit rejections into fallback scores
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        async def _score_one(
+            opportunity: GrantOpportunity, eligibility: EligibilityResult
+        ) -> ScoringResult:
+            async with sem:
+                return await score_opportunity(
+                    opportunity, eligibility, weights, llm_model, scored_at
+                )
+        
+        return await asyncio.gather(*(
+            _score_one(opportunity, eligibility)
+            for opportunity, eligibility in zip(opportunities, eligibilities, strict=True)
+        ))
+    
+    results = _run_sync(_score_all())
+    
+    for start in range(0, len(results), batch_size):
+        chunk = results[start:start + batch_size]
+        
+        db_client.table("scoring_results").insert(
+            [_scoring_row(result, scored_at_iso) for result in chunk]
+        ).execute()
+        
+        db_client.table("grant_opportunities").update(
+            {"status": "scored"}
+        ).in_("source_opportunity_id", [result.opportunity_id for result in chunk]).execute()
+    
+    return results
+
+
+def _scoring_row(result: ScoringResult, scored_at_iso: Optional[str] = None) -> dict:
+    """Flatten a ScoringResult into a scoring_results table row.
+    
+    ``scored_at_iso`` lets batch callers reuse one pre-formatted timestamp.
+    """
+    return {
         "opportunity_id": result.opportunity_id,
         "mission_fit_score": result.mission_fit.score,
         "mission_fit_citations": result.mission_fit.evidence_citations,
@@ -369,14 +654,5 @@ def score_and_save(
         "verdict": result.verdict,
         "scoring_weights_version": result.scoring_weights_version,
         "llm_model": result.llm_model,
-        "scored_at": result.scored_at.isoformat(),
+        "scored_at": scored_at_iso or result.scored_at.isoformat(),
     }
-    
-    db_client.table("scoring_results").insert(scoring_data).execute()
-    
-    # Update grant status to "scored"
-    db_client.table("grant_opportunities").update(
-        {"status": "scored"}
-    ).eq("source_opportunity_id", opportunity.source_opportunity_id).execute()
-    
-    return result
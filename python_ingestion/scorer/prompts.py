@@ -4,8 +4,16 @@ Each dimension prompt asks the LLM to:
 1. Score 0-100 based on the grant opportunity text
 2. Extract direct evidence citations from the text
 3. Return structured JSON: {"score": int, "evidence_citations": ["quote1", "quote2"]}
+
+The grant text always leads the prompt, ahead of the dimension instructions,
+so all four dimension calls share an identical prefix that Anthropic prompt
+caching can reuse.
 """
 
+# Shared leading block for every dimension prompt
+GRANT_TEXT_TEMPLATE = """Grant opportunity text:
+{grant_text}"""
+
 # Mission Fit (25%) - Alignment with VTKL's core capabilities
 MISSION_FIT_PROMPT = """You are evaluating a government grant opportunity for VTKL, a small business specializing in:
 - AI workflows and automation
@@ -25,9 +33,6 @@ Scoring guidelines:
 
 Extract 2-3 direct quotes from the text that justify your score.
 
-Grant opportunity text:
-{grant_text}
-
 Return your response as valid JSON:
 {{"score": <int 0-100>, "evidence_citations": ["quote1", "quote2"]}}"""
 
@@ -56,9 +61,6 @@ Scoring guidelines:
 
 Extract 2-3 direct quotes about technical requirements from the text.
 
-Grant opportunity text:
-{grant_text}
-
 Return your response as valid JSON:
 {{"score": <int 0-100>, "evidence_citations": ["quote1", "quote2"]}}"""
 
@@ -80,9 +82,6 @@ Scoring guidelines:
 
 Extract 1-2 direct quotes about award amounts, funding levels, or contract value from the text.
 
-Grant opportunity text:
-{grant_text}
-
 Return your response as valid JSON:
 {{"score": <int 0-100>, "evidence_citations": ["quote1", "quote2"]}}"""
 
@@ -106,13 +105,27 @@ Scoring guidelines:
 
 Extract 1-3 direct quotes about strategic aspects (contract type, agency, duration, innovation, teaming).
 
-Grant opportunity text:
-{grant_text}
-
 Return your response as valid JSON:
 {{"score": <int 0-100>, "evidence_citations": ["quote1", "quote2"]}}"""
 
 
+# Dimension instructions with template escapes resolved once at import;
+# only the grant text varies between calls
+_DIMENSION_INSTRUCTIONS = {
+    dimension: {"type": "text", "text": template.format()}
+    for dimension, template in (
+        ("mission_fit", MISSION_FIT_PROMPT),
+        ("technical_alignment", TECHNICAL_ALIGNMENT_PROMPT),
+        ("financial_viability", FINANCIAL_VIABILITY_PROMPT),
+        ("strategic_value", STRATEGIC_VALUE_PROMPT),
+    )
+}
+
+# GRANT_TEXT_TEMPLATE pre-split around its single placeholder, so the grant
+# text is spliced in by concatenation instead of a str.format parse per call
+_GRANT_TEXT_PREFIX, _GRANT_TEXT_SUFFIX = GRANT_TEXT_TEMPLATE.split("{grant_text}")
+
+
 def get_prompt_for_dimension(dimension: str, grant_text: str) -> str:
     """Get the prompt for a specific scoring dimension.
     
@@ -126,17 +139,39 @@ def get_prompt_for_dimension(dimension: str, grant_text: str) -> str:
     Raises:
         ValueError: If dimension is invalid or is "eligibility" (handled separately)
     """
-    prompts = {
-        "mission_fit": MISSION_FIT_PROMPT,
-        "technical_alignment": TECHNICAL_ALIGNMENT_PROMPT,
-        "financial_viability": FINANCIAL_VIABILITY_PROMPT,
-        "strategic_value": STRATEGIC_VALUE_PROMPT,
-    }
+    return "\n\n".join(block["text"] for block in get_prompt_blocks(dimension, grant_text))
+
+
+def get_prompt_blocks(dimension: str, grant_text: str) -> list[dict]:
+    """Get the prompt for a dimension as Anthropic message content blocks.
     
+    The first block holds the grant text and carries an ephemeral
+    cache_control marker; the second holds the dimension instructions.
+    
+    Args:
+        dimension: One of "mission_fit", "technical_alignment", "financial_viability", "strategic_value"
+        grant_text: Full grant opportunity text to evaluate
+        
+    Returns:
+        List of two text content blocks
+        
+    Raises:
+        ValueError: If dimension is invalid or is "eligibility" (handled separately)
+    """
     if dimension == "eligibility":
         raise ValueError("Eligibility dimension does not use LLM - calculated from EligibilityResult")
     
-    if dimension not in prompts:
-        raise ValueError(f"Invalid dimension: {dimension}. Must be one of {list(prompts.keys())}")
+    instructions = _DIMENSION_INSTRUCTIONS.get(dimension)
+    if instructions is None:
+        raise ValueError(
+            f"Invalid dimension: {dimension}. Must be one of {list(_DIMENSION_INSTRUCTIONS)}"
+        )
     
-    return prompts[dimension].format(grant_text=grant_text)
+    return [
+        {
+            "type": "text",
+            "text": _GRANT_TEXT_PREFIX + grant_text + _GRANT_TEXT_SUFFIX,
+            "cache_control": {"type": "ephemeral"},
+        },
+        instructions,
+    ]
@@ -3,7 +3,7 @@
 Maps grant opportunity language to VTKL capabilities.
 """
 
-from typing import List, Dict
+from typing import Dict, List, Tuple
 
 SEMANTIC_MAPPINGS: Dict[str, List[str]] = {
     # Cyberinfrastructure & Data
@@ -166,9 +166,23 @@ SEMANTIC_MAPPINGS: Dict[str, List[str]] = {
 }
 
 
+# Flattened (category, capability, lowercase capability) rows in mapping order,
+# plus the distinct lowercase keywords so each is searched for only once
+_CAPABILITY_TABLE: List[Tuple[str, str, str]] = [
+    (category, capability, capability.lower())
+    for category, capabilities in SEMANTIC_MAPPINGS.items()
+    for capability in capabilities
+]
+_CAPABILITY_KEYWORDS: Tuple[str, ...] = tuple(dict.fromkeys(row[2] for row in _CAPABILITY_TABLE))
+
+
 def find_semantic_matches(text: str) -> List[tuple]:
     """Find semantic matches between opportunity text and VTKL capabilities.
     
+    The text is lowercased once and each distinct capability keyword is
+    located with a single ``find``. Context is extracted once per matched
+    keyword and shared by every category that lists it.
+    
     Args:
         text: Opportunity description or raw text
         
@@ -180,25 +194,17 @@ def find_semantic_matches(text: str) -> List[tuple]:
         return []
     
     text_lower = text.lower()
-    matches = []
-    
-    for category, capabilities in SEMANTIC_MAPPINGS.items():
-        # Check if category keyword appears in text
-        if category.lower() in text_lower:
-            # Find which specific capabilities match
-            for capability in capabilities:
-                if capability.lower() in text_lower:
-                    # Extract context (sentence containing the match)
-                    context = _extract_context(text, capability)
-                    matches.append((category, capability, context))
-        else:
-            # Check each capability directly
-            for capability in capabilities:
-                if capability.lower() in text_lower:
-                    context = _extract_context(text, capability)
-                    matches.append((category, capability, context))
-    
-    return matches
+    contexts = {}
+    for keyword in _CAPABILITY_KEYWORDS:
+        idx = text_lower.find(keyword)
+        if idx != -1:
+            contexts[keyword] = _context_at(text, idx, len(keyword))
+    
+    return [
+        (category, capability, contexts[keyword])
+        for category, capability, keyword in _CAPABILITY_TABLE
+        if keyword in contexts
+    ]
 
 
 def _extract_context(text: str, keyword: str, window: int = 100) -> str:
@@ -213,15 +219,18 @@ def _extract_context(text: str, keyword: str, window: int = 100) -> str:
         Context string
     """
     
-    text_lower = text.lower()
-    keyword_lower = keyword.lower()
-    
-    idx = text_lower.find(keyword_lower)
+    idx = text.lower().find(keyword.lower())
     if idx == -1:
         return ""
     
+    return _context_at(text, idx, len(keyword), window)
+
+
+def _context_at(text: str, idx: int, length: int, window: int = 100) -> str:
+    """Context window around a match already located at ``idx``."""
+    
     start = max(0, idx - window)
-    end = min(len(text), idx + len(keyword) + window)
+    end = min(len(text), idx + length + window)
     
     context = text[start:end].strip()
     
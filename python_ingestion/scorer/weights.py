@@ -4,16 +4,28 @@ Supports externalized, configurable weights for REQ-7 compatibility.
 """
 
 import json
-import yaml
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel, field_validator
 
 
-class ScoringWeights(BaseModel):
+# Canonical dimension order for weight/score vectors
+SCORE_DIMENSIONS = (
+    "mission_fit",
+    "eligibility",
+    "technical_alignment",
+    "financial_viability",
+    "strategic_value",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringWeights:
     """Configurable scoring weights for five dimensions.
     
-    All weights must sum to 1.0 for proper composite scoring.
+    All weights must sum to 1.0 for proper composite scoring. Instances are
+    immutable, so cached and default weights can be shared freely.
     """
     
     mission_fit: float = 0.25
@@ -23,24 +35,22 @@ class ScoringWeights(BaseModel):
     strategic_value: float = 0.15
     version: str = "1.0"
     
-    @field_validator('mission_fit', 'eligibility', 'technical_alignment', 
-                     'financial_viability', 'strategic_value')
-    @classmethod
-    def weight_range(cls, v: float) -> float:
-        """Ensure weights are between 0 and 1."""
-        if not 0 <= v <= 1:
-            raise ValueError(f"Weight must be between 0 and 1, got {v}")
-        return v
-    
-    def model_post_init(self, __context) -> None:
-        """Validate that weights sum to 1.0."""
-        total = (
-            self.mission_fit +
-            self.eligibility +
-            self.technical_alignment +
-            self.financial_viability +
-            self.strategic_value
-        )
+    def __post_init__(self) -> None:
+        """Coerce weights to float, check each is in [0, 1] and that they sum to 1.0."""
+        if not isinstance(self.version, str):
+            raise ValueError(f"Weights version must be a string, got {self.version!r}")
+        
+        total = 0.0
+        for dimension in SCORE_DIMENSIONS:
+            raw = getattr(self, dimension)
+            try:
+                v = float(raw)
+            except (TypeError, ValueError):
+                raise ValueError(f"Weight {dimension} must be a number, got {raw!r}") from None
+            if not 0 <= v <= 1:
+                raise ValueError(f"Weight must be between 0 and 1, got {v}")
+            object.__setattr__(self, dimension, v)
+            total += v
         
         if abs(total - 1.0) > 0.001:
             raise ValueError(
@@ -50,16 +60,17 @@ class ScoringWeights(BaseModel):
                 f"SV:{self.strategic_value})"
             )
     
+    def as_vector(self) -> tuple[float, ...]:
+        """Weights as a tuple ordered by SCORE_DIMENSIONS."""
+        return tuple(getattr(self, dimension) for dimension in SCORE_DIMENSIONS)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
-        return {
-            "mission_fit": self.mission_fit,
-            "eligibility": self.eligibility,
-            "technical_alignment": self.technical_alignment,
-            "financial_viability": self.financial_viability,
-            "strategic_value": self.strategic_value,
-            "version": self.version
-        }
+        return asdict(self)
+
+
+# Keys load_weights passes through; anything else in a weights file is ignored
+_WEIGHT_FIELDS = frozenset(f.name for f in fields(ScoringWeights))
 
 
 # Default weights as specified in contract
@@ -73,10 +84,17 @@ DEFAULT_WEIGHTS = ScoringWeights(
 )
 
 
+# Parsed weights files keyed by path, validated against (mtime_ns, size) so
+# repeat loads of an unchanged file skip the parse and validation
+_WEIGHTS_CACHE_SIZE = 32
+_WEIGHTS_CACHE: "OrderedDict[str, tuple[int, int, ScoringWeights]]" = OrderedDict()
+
+
 def load_weights(filepath: Optional[str] = None) -> ScoringWeights:
     """Load scoring weights from file or return defaults.
     
-    Supports JSON and YAML formats.
+    Supports JSON and YAML formats. Results are cached per path and reused
+    until the file's mtime or size changes.
     
     Args:
         filepath: Optional path to weights configuration file
@@ -93,20 +111,39 @@ def load_weights(filepath: Optional[str] = None) -> ScoringWeights:
         return DEFAULT_WEIGHTS
     
     path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"Weights file not found: {filepath}")
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Weights file not found: {filepath}") from None
+    
+    cache_key = str(path)
+    cached = _WEIGHTS_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _WEIGHTS_CACHE.move_to_end(cache_key)
+        return cached[2]
     
     # Load based on extension
     if path.suffix == '.json':
         with open(path, 'r') as f:
             data = json.load(f)
     elif path.suffix in ['.yaml', '.yml']:
+        # Imported lazily: PyYAML is only needed for YAML weights files
+        import yaml
+        
+        # libyaml-backed loader when PyYAML was built with it
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     else:
         raise ValueError(f"Unsupported file format: {path.suffix}. Use .json, .yaml, or .yml")
     
-    return ScoringWeights(**data)
+    weights = ScoringWeights(**{k: v for k, v in data.items() if k in _WEIGHT_FIELDS})
+    
+    _WEIGHTS_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, weights)
+    _WEIGHTS_CACHE.move_to_end(cache_key)
+    if len(_WEIGHTS_CACHE) > _WEIGHTS_CACHE_SIZE:
+        _WEIGHTS_CACHE.popitem(last=False)
+    
+    return weights
 
 
 def save_weights(weights: ScoringWeights, filepath: str) -> None:
@@ -124,8 +161,15 @@ def save_weights(weights: ScoringWeights, filepath: str) -> None:
         with open(path, 'w') as f:
             json.dump(data, f, indent=2)
     elif path.suffix in ['.yaml', '.yml']:
+        import yaml
+        
         with open(path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False)
+            yaml.dump(
+                data,
+                f,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                default_flow_style=False,
+            )
     else:
         raise ValueError(f"Unsupported file format: {path.suffix}")
 
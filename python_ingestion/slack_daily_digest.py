@@ -16,12 +16,14 @@ Usage:
     python3 slack_daily_digest.py
 """
 
-import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import httpx
+import orjson
 from supabase import create_client
 
 # ---------------------------------------------------------------------------
@@ -41,27 +43,30 @@ def fetch_new_grants() -> tuple[list[dict], int]:
 
     since = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
 
-    resp = (
+    recent_query = (
         client.table("grant_opportunities")
         .select("title, agency, response_deadline, source_url, source")
         .gte("first_detected_at", since)
         .order("response_deadline", desc=False)  # nearest deadlines first
         .limit(TOP_N)
-        .execute()
     )
-    grants = resp.data or []
+    # Total count; head=True makes PostgREST return only the Content-Range count
+    count_query = client.table("grant_opportunities").select("id", count="exact", head=True)
 
-    # Total count
-    count_resp = (
-        client.table("grant_opportunities")
-        .select("id", count="exact")
-        .execute()
-    )
-    total = count_resp.count if count_resp.count is not None else len(count_resp.data)
+    # Independent queries: run them side by side over the shared client
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        recent_future = pool.submit(recent_query.execute)
+        count_future = pool.submit(count_query.execute)
+        resp = recent_future.result()
+        count_resp = count_future.result()
+
+    grants = resp.data or []
+    total = count_resp.count or 0
 
     return grants, total
 
 
+@lru_cache(maxsize=4096)  # deadlines repeat across grants
 def fmt_date(iso: str | None) -> str:
     if not iso:
         return "TBD"
@@ -88,23 +93,23 @@ def build_blocks(grants: list[dict], total: int) -> list[dict]:
         {"type": "divider"},
     ]
 
-    for g in grants:
-        title = g.get("title", "Untitled")[:120]
-        agency = g.get("agency", "Unknown").strip()
-        deadline = fmt_date(g.get("response_deadline"))
-        url = g.get("source_url", "")
-        source = g.get("source", "").replace("_", ".")
-
-        text = f"*<{url}|{title}>*\n🏛️ {agency}  •  📅 Deadline: {deadline}  •  🔗 {source}"
-        blocks.append(
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": text},
-            }
-        )
-
-    blocks.append({"type": "divider"})
-    blocks.append(
+    blocks += [
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": (
+                    f"*<{g.get('source_url', '')}|{g.get('title', 'Untitled')[:120]}>*\n"
+                    f"🏛️ {g.get('agency', 'Unknown').strip()}  •  "
+                    f"📅 Deadline: {fmt_date(g.get('response_deadline'))}  •  "
+                    f"🔗 {g.get('source', '').replace('_', '.')}"
+                ),
+            },
+        }
+        for g in grants
+    ]
+    blocks += [
+        {"type": "divider"},
         {
             "type": "context",
             "elements": [
@@ -113,8 +118,8 @@ def build_blocks(grants: list[dict], total: int) -> list[dict]:
                     "text": f"Total in DB: *{total}* | Sources: Grants.gov, SAM.gov",
                 }
             ],
-        }
-    )
+        },
+    ]
 
     return blocks
 
@@ -151,7 +156,7 @@ def post_to_slack(blocks: list[dict]) -> None:
     else:
         # Dry run — print blocks as JSON
         print("No SLACK_BOT_TOKEN or SLACK_WEBHOOK_URL set. Dry run:")
-        print(json.dumps(blocks, indent=2, ensure_ascii=False))
+        print(orjson.dumps(blocks, option=orjson.OPT_INDENT_2).decode())
 
 
 def main():
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from apscheduler.schedulers.blocking import BlockingScheduler
@@ -48,25 +49,28 @@ def run_digest_job() -> None:
     supabase_key = os.environ["SUPABASE_KEY"]
     db = create_client(supabase_url, supabase_key)
 
-    poster = SlackPoster(supabase_client=db)
-
-    # 1. Post any unposted individual verdicts
-    unposted = _fetch_unposted_verdicts(db)
-    for report in unposted:
-        poster.post_verdict(report)
-
-    # 2. Build and post daily digest
-    recent = _fetch_recent_verdicts(db, hours=24)
-    if recent:
-        today_str = datetime.now(HST).strftime("%b %d, %Y")
-        blocks = format_digest_blocks(recent, date_str=today_str)
-        try:
-            poster.post_blocks(blocks)
-            logger.info("Daily digest posted: %d verdicts", len(recent))
-        except Exception as exc:
-            logger.error("Failed to post daily digest: %s", exc)
-    else:
-        logger.info("No recent verdicts for daily digest.")
+    # The two reads are independent; issue them together to pay one round-trip
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        unposted_future = pool.submit(_fetch_unposted_verdicts, db)
+        recent_future = pool.submit(_fetch_recent_verdicts, db, 24)
+        unposted = unposted_future.result()
+        recent = recent_future.result()
+
+    with SlackPoster(supabase_client=db) as poster:
+        # 1. Post any unposted individual verdicts
+        poster.post_verdicts(unposted)
+
+        # 2. Build and post daily digest
+        if recent:
+            today_str = datetime.now(HST).strftime("%b %d, %Y")
+            blocks = format_digest_blocks(recent, date_str=today_str)
+            try:
+                poster.post_blocks(blocks)
+                logger.info("Daily digest posted: %d verdicts", len(recent))
+            except Exception as exc:
+                logger.error("Failed to post daily digest: %s", exc)
+        else:
+            logger.info("No recent verdicts for daily digest.")
 
 
 def start_digest_cron() -> None:
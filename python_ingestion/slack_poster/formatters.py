@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 
@@ -49,6 +51,12 @@ def _fmt_date(iso: str | datetime | None) -> str:
         return "TBD"
     if isinstance(iso, datetime):
         return iso.strftime("%b %d, %Y")
+    return _fmt_iso_date(iso)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_iso_date(iso: str) -> str:
+    # Cached: deadlines repeat across reports from the same solicitation
     try:
         return datetime.fromisoformat(iso).strftime("%b %d, %Y")
     except Exception:
@@ -137,8 +145,9 @@ _FORMATTERS = {
 
 def format_verdict_blocks(report: dict) -> list[dict]:
     """Return Slack Block Kit blocks for a single VerdictReport dict."""
-    verdict = report.get("verdict", "").upper()
-    formatter = _FORMATTERS.get(verdict, _format_nogo)
+    verdict = report.get("verdict") or ""
+    # Producers emit canonical upper-case verdicts; only re-case on a miss
+    formatter = _FORMATTERS.get(verdict) or _FORMATTERS.get(verdict.upper(), _format_nogo)
     return formatter(report)
 
 
@@ -152,12 +161,19 @@ def format_digest_blocks(reports: list[dict], date_str: str | None = None) -> li
         date_str = datetime.utcnow().strftime("%b %d, %Y")
 
     counts: dict[str, int] = {"GO": 0, "SHAPE": 0, "MONITOR": 0, "NO-GO": 0}
-    top_reports: list[dict] = sorted(reports, key=lambda r: r.get("composite_score", 0), reverse=True)
-
-    for r in reports:
+    # One pass: count verdicts and keep the top 10 in a bounded min-heap.
+    # -i breaks score ties in favour of earlier reports, like a stable sort.
+    top: list[tuple[Any, int, dict]] = []
+    for i, r in enumerate(reports):
         v = r.get("verdict", "").upper()
         if v in counts:
             counts[v] += 1
+        item = (r.get("composite_score", 0), -i, r)
+        if len(top) < 10:
+            heapq.heappush(top, item)
+        else:
+            heapq.heappushpop(top, item)
+    top_reports = [r for _, _, r in sorted(top, reverse=True)]
 
     blocks: list[dict] = [
         _header(f"📊 Daily Verdict Digest — {date_str}"),
@@ -171,11 +187,13 @@ def format_digest_blocks(reports: list[dict], date_str: str | None = None) -> li
         _divider(),
     ]
 
-    for r in top_reports[:10]:
-        emoji = VERDICT_EMOJI.get(r.get("verdict", "").upper(), "❓")
-        title = r.get("title", r.get("opportunity_id", "?"))[:80]
-        score = r.get("composite_score", "?")
-        blocks.append(_section(f"{emoji} *{title}* — Score: {score}/100"))
-
+    blocks += [
+        _section(
+            f"{VERDICT_EMOJI.get(r.get('verdict', '').upper(), '❓')} "
+            f"*{r.get('title', r.get('opportunity_id', '?'))[:80]}* — "
+            f"Score: {r.get('composite_score', '?')}/100"
+        )
+        for r in top_reports
+    ]
     blocks.append(_context(f"Total reports: {len(reports)} | Generated: {date_str}"))
     return blocks
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
 from datetime import datetime, timezone
 from typing import Any
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -20,6 +21,12 @@ from .formatters import format_verdict_blocks
 
 logger = logging.getLogger(__name__)
 
+SLACK_POST_MESSAGE_URL = "https://slack.com/api/chat.postMessage"
+
+# Concurrent chat.postMessage calls in post_verdicts; kept small because
+# Slack rate-limits per channel (429s are retried)
+SLACK_POST_CONCURRENCY = 5
+
 
 class SlackRetryableError(Exception):
     """Raised on 429 / 5xx so tenacity retries."""
@@ -38,6 +45,24 @@ class SlackPoster:
         self.bot_token = bot_token or os.environ.get("SLACK_BOT_TOKEN", "")
         self.channel = channel or os.environ.get("SLACK_CHANNEL", "")
         self._db = supabase_client  # supabase Client or None
+        # One pooled client per poster: consecutive posts reuse the TLS connection
+        self._http = httpx.Client(
+            timeout=30,
+            headers={
+                "Authorization": f"Bearer {self.bot_token}",
+                "Content-Type": "application/json",
+            },
+        )
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection."""
+        self._http.close()
+
+    def __enter__(self) -> SlackPoster:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Retry-wrapped HTTP post
@@ -50,16 +75,29 @@ class SlackPoster:
     )
     def _post_blocks(self, blocks: list[dict]) -> dict:
         """Post blocks to Slack. Raises SlackRetryableError on 429/5xx."""
-        resp = httpx.post(
-            "https://slack.com/api/chat.postMessage",
-            headers={
-                "Authorization": f"Bearer {self.bot_token}",
-                "Content-Type": "application/json",
-            },
+        resp = self._http.post(
+            SLACK_POST_MESSAGE_URL,
             json={"channel": self.channel, "blocks": blocks},
-            timeout=30,
         )
+        return self._check_response(resp)
 
+    @retry(
+        retry=retry_if_exception_type(SlackRetryableError),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        reraise=True,
+    )
+    async def _post_blocks_async(self, client: httpx.AsyncClient, blocks: list[dict]) -> dict:
+        """Async variant of _post_blocks over a caller-owned AsyncClient."""
+        resp = await client.post(
+            SLACK_POST_MESSAGE_URL,
+            json={"channel": self.channel, "blocks": blocks},
+        )
+        return self._check_response(resp)
+
+    @staticmethod
+    def _check_response(resp: httpx.Response) -> dict:
+        """Return the Slack payload, raising on retryable or API errors."""
         if resp.status_code == 429 or resp.status_code >= 500:
             raise SlackRetryableError(
                 f"Slack returned {resp.status_code}: {resp.text[:200]}"
@@ -90,6 +128,56 @@ class SlackPoster:
             self._write_dead_letter(report, str(exc))
             return False
 
+    # ------------------------------------------------------------------
+    # Public: post many verdict reports concurrently
+    # ------------------------------------------------------------------
+    def post_verdicts(
+        self, reports: list[dict], max_concurrency: int = SLACK_POST_CONCURRENCY
+    ) -> list[bool]:
+        """Post several VerdictReport dicts concurrently.
+
+        Up to ``max_concurrency`` posts are in flight at once over a single
+        AsyncClient, so N posts take about N / max_concurrency round-trips
+        instead of N. Returns one success flag per report, in order.
+        """
+        if not reports:
+            return []
+        return asyncio.run(self._post_verdicts_async(reports, max_concurrency))
+
+    async def _post_verdicts_async(self, reports: list[dict], max_concurrency: int) -> list[bool]:
+        sem = asyncio.Semaphore(max_concurrency)
+        # One timestamp for every posted / dead-lettered row in this run
+        run_ts = datetime.now(timezone.utc).isoformat()
+        async with httpx.AsyncClient(timeout=30, headers=self._http.headers) as client:
+            return await asyncio.gather(
+                *(self._post_verdict_async(report, client, sem, run_ts) for report in reports)
+            )
+
+    async def _post_verdict_async(
+        self,
+        report: dict,
+        client: httpx.AsyncClient,
+        sem: asyncio.Semaphore,
+        timestamp: str | None = None,
+    ) -> bool:
+        blocks = format_verdict_blocks(report)
+        opportunity_id = report.get("opportunity_id", "unknown")
+
+        try:
+            async with sem:
+                data = await self._post_blocks_async(client, blocks)
+        # Transport errors and timeouts are dead-lettered per report so one
+        # failed post doesn't escape gather and cancel the rest of the run
+        except (SlackRetryableError, RuntimeError, httpx.HTTPError) as exc:
+            logger.error("Failed to post verdict for %s: %s", opportunity_id, exc)
+            await asyncio.to_thread(self._write_dead_letter, report, str(exc), timestamp)
+            return False
+
+        logger.info("Posted verdict for %s: ts=%s", opportunity_id, data.get("ts"))
+        # Supabase client is synchronous; keep its round-trip off the event loop
+        await asyncio.to_thread(self._mark_posted, opportunity_id, timestamp)
+        return True
+
     # ------------------------------------------------------------------
     # Post a set of blocks directly (used by digest)
     # ------------------------------------------------------------------
@@ -100,28 +188,31 @@ class SlackPoster:
     # ------------------------------------------------------------------
     # DB helpers
     # ------------------------------------------------------------------
-    def _mark_posted(self, opportunity_id: str) -> None:
+    def _mark_posted(self, opportunity_id: str, timestamp: str | None = None) -> None:
         if self._db is None:
             return
         try:
             self._db.table("verdict_reports").update(
-                {"posted_to_slack_at": datetime.now(timezone.utc).isoformat()}
+                {"posted_to_slack_at": timestamp or datetime.now(timezone.utc).isoformat()}
             ).eq("opportunity_id", opportunity_id).execute()
         except Exception as exc:
             logger.warning("Could not mark posted_to_slack_at for %s: %s", opportunity_id, exc)
 
-    def _write_dead_letter(self, report: dict, error_message: str) -> None:
+    def _write_dead_letter(
+        self, report: dict, error_message: str, timestamp: str | None = None
+    ) -> None:
         if self._db is None:
             return
+        timestamp = timestamp or datetime.now(timezone.utc).isoformat()
         try:
             self._db.table("dead_letter_posts").insert({
                 "opportunity_id": report.get("opportunity_id", "unknown"),
                 "verdict": report.get("verdict", "unknown"),
-                "payload": json.dumps(report, default=str),
+                "payload": orjson.dumps(report, default=str).decode(),
                 "error_message": error_message[:1000],
                 "attempts": 3,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "last_attempted_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": timestamp,
+                "last_attempted_at": timestamp,
             }).execute()
         except Exception as exc:
             logger.error("Could not write dead letter for %s: %s", report.get("opportunity_id"), exc)
@@ -11,18 +11,35 @@ Source: BRD Section 3C, Section 5
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Sequence
+
+import httpx
 
 from models.grant_opportunity import GrantOpportunity
 from models.scoring_result import ScoringResult
 from models.teaming_partner import TeamingPartner
-from teaming.hardcoded_partners import PartnerSourceError, get_matching_partners
+from teaming.hardcoded_partners import (
+    PartnerSourceError,
+    get_matching_partners,
+    partners_with_config_fallback,
+)
+from teaming.usaspending_lookup import (
+    VTKL_NAICS,
+    USAspendingPartner,
+    lookup_partners_async,
+    open_async_client,
+)
 
 logger = logging.getLogger(__name__)
 
 # Verdicts that trigger teaming suggestions
 ACTIONABLE_VERDICTS = {"GO", "SHAPE"}
 
+# Maximum concurrent USAspending lookups in generate_teaming_suggestions_batch
+TEAMING_LOOKUP_CONCURRENCY = 8
+
 
 def generate_teaming_suggestions(
     opportunity: GrantOpportunity,
@@ -53,31 +70,12 @@ def generate_teaming_suggestions(
         )
         return []
 
-    partners: list[TeamingPartner] = []
-
     try:
         matched = get_matching_partners(
             agency=opportunity.agency,
             opportunity_type=opportunity.opportunity_type,
             naics_codes=opportunity.naics_codes or None,
         )
-        for p in matched:
-            source = "usaspending" if p.award_count > 0 else "config"
-            partners.append(
-                TeamingPartner(
-                    opportunity_id=opportunity.source_opportunity_id,
-                    partner_name=p.name,
-                    partner_role="Potential Teaming Partner",
-                    rationale=(
-                        f"Past awardee in NAICS {', '.join(p.naics_codes)} with {p.agency}"
-                        if p.naics_codes
-                        else f"Config-sourced partner for {p.agency}"
-                    ),
-                    source=source,
-                    naics_codes=p.naics_codes,
-                    past_agency_work=f"Prior awards from {p.agency}" if p.award_count > 0 else None,
-                )
-            )
     except PartnerSourceError:
         logger.warning(
             "No partner source available for %s (agency=%s)",
@@ -86,4 +84,134 @@ def generate_teaming_suggestions(
         )
         raise
 
-    return partners
+    return _to_teaming_partners(opportunity, matched)
+
+
+async def generate_teaming_suggestions_batch(
+    opportunities: Sequence[GrantOpportunity],
+    scoring_results: Sequence[ScoringResult],
+    max_concurrency: int = TEAMING_LOOKUP_CONCURRENCY,
+) -> list[list[TeamingPartner]]:
+    """Generate teaming suggestions for many opportunities concurrently.
+
+    Actionable opportunities sharing an agency and NAICS set share one
+    USAspending lookup; the distinct lookups run on one event loop, at most
+    ``max_concurrency`` at a time. Config fallback is then applied per
+    opportunity, since it also matches on opportunity type.
+
+    Args:
+        opportunities: Grant opportunities.
+        scoring_results: Scoring results, parallel to ``opportunities``.
+        max_concurrency: Maximum USAspending requests in flight.
+
+    Returns:
+        Suggestion lists in the same order as ``opportunities``.
+
+    Raises:
+        ValueError: If the two sequences differ in length.
+        PartnerSourceError: If no partner data source is available.
+    """
+    if len(opportunities) != len(scoring_results):
+        raise ValueError(
+            f"Got {len(opportunities)} opportunities but {len(scoring_results)} scoring results"
+        )
+
+    lookup_keys: list[tuple[str, tuple[str, ...]] | None] = []
+    for opportunity, scoring_result in zip(opportunities, scoring_results, strict=True):
+        if scoring_result.verdict not in ACTIONABLE_VERDICTS:
+            logger.info(
+                "Skipping teaming — verdict is %s for %s",
+                scoring_result.verdict,
+                opportunity.source_opportunity_id,
+            )
+            lookup_keys.append(None)
+        else:
+            naics = tuple(sorted(opportunity.naics_codes or VTKL_NAICS))
+            lookup_keys.append((opportunity.agency, naics))
+
+    unique_keys = list(dict.fromkeys(key for key in lookup_keys if key is not None))
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _lookup(
+        client: httpx.AsyncClient, key: tuple[str, tuple[str, ...]]
+    ) -> list[USAspendingPartner]:
+        async with sem:
+            return await lookup_partners_async(agency=key[0], naics_codes=key[1], client=client)
+
+    # One pooled client for the batch, closed when the lookups finish.
+    # lookup_partners_async logs and returns [] on API errors, so nothing
+    # here raises before config fallback is applied
+    async with open_async_client() as client:
+        fetched = await asyncio.gather(*(_lookup(client, key) for key in unique_keys))
+    api_partners = dict(zip(unique_keys, fetched, strict=True))
+
+    suggestions: list[list[TeamingPartner]] = []
+    for opportunity, key in zip(opportunities, lookup_keys, strict=True):
+        if key is None:
+            suggestions.append([])
+            continue
+        try:
+            matched = partners_with_config_fallback(
+                list(api_partners[key]), opportunity.agency, opportunity.opportunity_type
+            )
+        except PartnerSourceError:
+            logger.warning(
+                "No partner source available for %s (agency=%s)",
+                opportunity.source_opportunity_id,
+                opportunity.agency,
+            )
+            raise
+        suggestions.append(_to_teaming_partners(opportunity, matched))
+
+    return suggestions
+
+
+def generate_teaming_suggestions_parallel(
+    opportunities: Sequence[GrantOpportunity],
+    scoring_results: Sequence[ScoringResult],
+    max_concurrency: int = TEAMING_LOOKUP_CONCURRENCY,
+) -> list[list[TeamingPartner]]:
+    """Synchronous entry point for generate_teaming_suggestions_batch.
+
+    Runs the batch on its own event loop, so must not be called from code
+    already running inside one.
+
+    Args:
+        opportunities: Grant opportunities.
+        scoring_results: Scoring results, parallel to ``opportunities``.
+        max_concurrency: Maximum USAspending requests in flight.
+
+    Returns:
+        Suggestion lists in the same order as ``opportunities``.
+
+    Raises:
+        ValueError: If the two sequences differ in length.
+        PartnerSourceError: If no partner data source is available.
+    """
+    return asyncio.run(
+        generate_teaming_suggestions_batch(opportunities, scoring_results, max_concurrency)
+    )
+
+
+def _to_teaming_partners(
+    opportunity: GrantOpportunity,
+    matched: list[USAspendingPartner],
+) -> list[TeamingPartner]:
+    """Turn matched partners into TeamingPartner suggestions."""
+    opportunity_id = opportunity.source_opportunity_id
+    return [
+        TeamingPartner(
+            opportunity_id=opportunity_id,
+            partner_name=p.name,
+            partner_role="Potential Teaming Partner",
+            rationale=(
+                f"Past awardee in NAICS {', '.join(p.naics_codes)} with {p.agency}"
+                if p.naics_codes
+                else f"Config-sourced partner for {p.agency}"
+            ),
+            source="usaspending" if p.award_count > 0 else "config",
+            naics_codes=p.naics_codes,
+            past_agency_work=f"Prior awards from {p.agency}" if p.award_count > 0 else None,
+        )
+        for p in matched
+    ]
@@ -8,11 +8,14 @@ Fail-fast if neither source is available.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Sequence
+
+import orjson
 
 from teaming.usaspending_lookup import (
     USAspendingPartner,
@@ -35,6 +38,21 @@ class ConfigPartner:
     rationale: str
     agency_patterns: list[str] = field(default_factory=list)
     opportunity_type_patterns: list[str] = field(default_factory=list)
+    agency_patterns_lower: tuple[str, ...] = field(init=False, repr=False)
+    opportunity_type_patterns_lower: tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Lowercased once here rather than on every match
+        self.agency_patterns_lower = tuple(p.lower() for p in self.agency_patterns)
+        self.opportunity_type_patterns_lower = tuple(
+            p.lower() for p in self.opportunity_type_patterns
+        )
+
+
+# Parsed partner config files keyed by path, validated against
+# (mtime_ns, size) so each opportunity doesn't re-read and re-parse the JSON
+_CONFIG_CACHE_SIZE = 8
+_CONFIG_CACHE: "OrderedDict[str, tuple[int, int, tuple[ConfigPartner, ...]]]" = OrderedDict()
 
 
 def _load_config_partners() -> list[ConfigPartner] | None:
@@ -51,8 +69,14 @@ def _load_config_partners() -> list[ConfigPartner] | None:
         logger.warning("PARTNER_CONFIG_PATH set but file not found: %s", config_path)
         return None
 
+    stat = path.stat()
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _CONFIG_CACHE.move_to_end(config_path)
+        return list(cached[2])
+
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = orjson.loads(path.read_bytes())
         partners = []
         for entry in data:
             partners.append(
@@ -64,11 +88,17 @@ def _load_config_partners() -> list[ConfigPartner] | None:
                     opportunity_type_patterns=entry.get("opportunity_type_patterns", []),
                 )
             )
-        return partners
-    except (json.JSONDecodeError, KeyError, TypeError) as exc:
+    except (orjson.JSONDecodeError, KeyError, TypeError) as exc:
         logger.warning("Failed to parse partner config at %s: %s", config_path, exc)
         return None
 
+    _CONFIG_CACHE[config_path] = (stat.st_mtime_ns, stat.st_size, tuple(partners))
+    _CONFIG_CACHE.move_to_end(config_path)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+
+    return partners
+
 
 def _match_config_partners(
     partners: list[ConfigPartner],
@@ -81,17 +111,12 @@ def _match_config_partners(
 
     results: list[ConfigPartner] = []
     for partner in partners:
-        agency_match = any(p.lower() in agency_lower for p in partner.agency_patterns)
-        if not agency_match:
-            agency_match = any(agency_lower in p.lower() for p in partner.agency_patterns)
-        if not agency_match:
+        if not any(p in agency_lower or agency_lower in p for p in partner.agency_patterns_lower):
             continue
 
-        if partner.opportunity_type_patterns and opp_lower:
-            type_match = any(p.lower() in opp_lower for p in partner.opportunity_type_patterns)
-            if not type_match:
-                type_match = any(opp_lower in p.lower() for p in partner.opportunity_type_patterns)
-            if not type_match:
+        type_patterns = partner.opportunity_type_patterns_lower
+        if type_patterns and opp_lower:
+            if not any(p in opp_lower or opp_lower in p for p in type_patterns):
                 continue
 
         results.append(partner)
@@ -101,7 +126,7 @@ def _match_config_partners(
 def get_matching_partners(
     agency: str,
     opportunity_type: str | None = None,
-    naics_codes: list[str] | None = None,
+    naics_codes: Sequence[str] | None = None,
     timeout: float = 15.0,
 ) -> list[USAspendingPartner]:
     """Return partners matching agency/opportunity, using USASpending API with config fallback.
@@ -128,6 +153,19 @@ def get_matching_partners(
         naics_codes=naics_codes,
         timeout=timeout,
     )
+    return partners_with_config_fallback(api_partners, agency, opportunity_type)
+
+
+def partners_with_config_fallback(
+    api_partners: list[USAspendingPartner],
+    agency: str,
+    opportunity_type: str | None,
+) -> list[USAspendingPartner]:
+    """Return API partners, or config-file matches when the API had none.
+
+    Raises:
+        PartnerSourceError: If the API had none and no config file is available.
+    """
     if api_partners:
         logger.info("Got %d partners from USASpending API for agency=%s", len(api_partners), agency)
         return api_partners
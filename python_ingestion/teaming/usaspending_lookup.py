@@ -8,18 +8,38 @@ Source: BRD Section 3C
 
 from __future__ import annotations
 
+import atexit
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple, Sequence
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.usaspending.gov/api/v2"
+SEARCH_URL = f"{BASE_URL}/search/spending_by_award/"
 
 # VTKL-relevant NAICS codes
-VTKL_NAICS = ["541511", "541512", "541990"]
+VTKL_NAICS = ("541511", "541512", "541990")
+
+# Static parts of the spending_by_award request body, shared by every payload
+_TIME_PERIOD = ({"start_date": "2020-01-01", "end_date": "2026-12-31"},)
+_AWARD_FIELDS = ("Recipient Name", "Award Amount", "NAICS Code", "Awarding Agency")
+
+# Shared keep-alive client: lookups after the first reuse the pooled
+# connection instead of paying DNS + TCP + TLS to api.usaspending.gov each time
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+_CLIENT_HEADERS = {"User-Agent": "vtkl-grant-pipeline"}
+_CLIENT = httpx.Client(timeout=15.0, limits=_CLIENT_LIMITS, headers=_CLIENT_HEADERS)
+atexit.register(_CLIENT.close)
+
+# In-process LRU of successful lookups keyed by (agency, sorted NAICS, limit).
+# Batch runs repeat the same agency/NAICS pairs; failed requests are not cached.
+_LOOKUP_CACHE_SIZE = 512
+_LOOKUP_CACHE: "OrderedDict[tuple, tuple[USAspendingPartner, ...]]" = OrderedDict()
 
 
 @dataclass
@@ -32,87 +52,203 @@ class USAspendingPartner:
     award_count: int = 0
 
 
-def lookup_partners_by_naics_and_agency(
-    agency: str,
-    naics_codes: list[str] | None = None,
-    limit: int = 5,
-    timeout: float = 15.0,
-) -> list[USAspendingPartner]:
-    """Query USAspending.gov for past awardees matching NAICS + agency.
-
-    Uses the /search/spending_by_award/ endpoint to find organizations
-    that have received awards in relevant NAICS codes from the specified agency.
+def open_async_client() -> httpx.AsyncClient:
+    """Return a new pooled AsyncClient for a batch of lookups.
 
-    Args:
-        agency: Agency name or abbreviation to search.
-        naics_codes: NAICS codes to filter by. Defaults to VTKL_NAICS.
-        limit: Max results to return.
-        timeout: HTTP request timeout in seconds.
-
-    Returns:
-        List of USAspendingPartner with name and metadata.
+    The caller owns it and should close it (``async with``) when the batch
+    is done; lookup_partners_async opens a throwaway one when none is given.
     """
-    if naics_codes is None:
-        naics_codes = VTKL_NAICS
+    return httpx.AsyncClient(timeout=15.0, limits=_CLIENT_LIMITS, headers=_CLIENT_HEADERS)
+
 
-    payload: dict[str, Any] = {
+def _build_payload(agency: str, naics_codes: Sequence[str], limit: int) -> dict[str, Any]:
+    """Build the /search/spending_by_award/ request body."""
+    return {
         "filters": {
             "naics_codes": naics_codes,
-            "agencies": [
-                {
-                    "type": "awarding",
-                    "tier": "toptier",
-                    "name": agency,
-                }
-            ],
-            "time_period": [
-                {
-                    "start_date": "2020-01-01",
-                    "end_date": "2026-12-31",
-                }
-            ],
+            "agencies": [{"type": "awarding", "tier": "toptier", "name": agency}],
+            "time_period": _TIME_PERIOD,
         },
-        "fields": [
-            "Recipient Name",
-            "Award Amount",
-            "NAICS Code",
-            "Awarding Agency",
-        ],
+        "fields": _AWARD_FIELDS,
         "limit": limit,
         "page": 1,
         "sort": "Award Amount",
         "order": "desc",
     }
 
-    try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(f"{BASE_URL}/search/spending_by_award/", json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-    except httpx.HTTPStatusError as exc:
-        logger.warning("USAspending API HTTP error %s: %s", exc.response.status_code, exc)
-        return []
-    except (httpx.RequestError, Exception) as exc:
-        logger.warning("USAspending API request error: %s", exc)
-        return []
 
+def _parse_partners(data: dict[str, Any]) -> list[USAspendingPartner]:
+    """Turn a spending_by_award response into de-duplicated partners."""
     results: list[USAspendingPartner] = []
     seen_names: set[str] = set()
+    seen_add = seen_names.add
 
-    for row in data.get("results", []):
-        name = row.get("Recipient Name", "").strip()
-        if not name or name.upper() in seen_names:
+    for row in data.get("results") or ():
+        # Fields can come back as JSON null, not just missing
+        name = (row.get("Recipient Name") or "").strip()
+        if not name:
+            continue
+        key = name.upper()
+        if key in seen_names:
             continue
-        seen_names.add(name.upper())
+        seen_add(key)
 
-        naics = row.get("NAICS Code", "")
+        naics = row.get("NAICS Code") or ""
         results.append(
             USAspendingPartner(
                 name=name,
                 naics_codes=[naics] if naics else [],
-                agency=row.get("Awarding Agency", ""),
+                agency=row.get("Awarding Agency") or "",
                 award_count=1,
             )
         )
 
     return results
+
+
+def _cache_get(cache_key: tuple) -> list[USAspendingPartner] | None:
+    """Return a fresh list for a cached lookup, or None on a miss."""
+    cached = _LOOKUP_CACHE.get(cache_key)
+    if cached is None:
+        return None
+    _LOOKUP_CACHE.move_to_end(cache_key)
+    return list(cached)
+
+
+def _cache_put(cache_key: tuple, results: list[USAspendingPartner]) -> None:
+    """Store a successful lookup, evicting the least recently used entry."""
+    _LOOKUP_CACHE[cache_key] = tuple(results)
+    if len(_LOOKUP_CACHE) > _LOOKUP_CACHE_SIZE:
+        _LOOKUP_CACHE.popitem(last=False)
+
+
+class _PendingLookup(NamedTuple):
+    """A lookup that missed the cache and needs an HTTP request."""
+
+    cache_key: tuple
+    payload: dict[str, Any]
+
+
+def _start_lookup(
+    agency: str, naics_codes: Sequence[str] | None, limit: int
+) -> list[USAspendingPartner] | _PendingLookup:
+    """Answer a lookup without HTTP when possible, else describe the request."""
+    # The agency filter needs a name; without one there is nothing to look up
+    if not agency or not agency.strip():
+        return []
+
+    naics = tuple(naics_codes) if naics_codes else VTKL_NAICS
+
+    cache_key = (agency, tuple(sorted(naics)), limit)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    return _PendingLookup(cache_key, _build_payload(agency, naics, limit))
+
+
+def _finish_lookup(pending: _PendingLookup, resp: httpx.Response) -> list[USAspendingPartner]:
+    """Decode, parse and cache a response; [] on HTTP status or decode errors."""
+    try:
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    except (httpx.HTTPStatusError, ValueError) as exc:
+        # ValueError covers undecodable bodies and non-object JSON
+        return _lookup_failed(exc)
+
+    results = _parse_partners(data)
+    _cache_put(pending.cache_key, results)
+    return results
+
+
+def _lookup_failed(exc: Exception) -> list[USAspendingPartner]:
+    """Log a failed lookup; failures are reported as no partners and not cached."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        logger.warning("USAspending API HTTP error %s: %s", exc.response.status_code, exc)
+    else:
+        logger.warning("USAspending API request error: %s", exc)
+    return []
+
+
+def lookup_partners_by_naics_and_agency(
+    agency: str,
+    naics_codes: Sequence[str] | None = None,
+    limit: int = 5,
+    timeout: float = 15.0,
+) -> list[USAspendingPartner]:
+    """Query USAspending.gov for past awardees matching NAICS + agency.
+
+    Uses the /search/spending_by_award/ endpoint to find organizations
+    that have received awards in relevant NAICS codes from the specified agency.
+
+    Args:
+        agency: Agency name or abbreviation to search.
+        naics_codes: NAICS codes to filter by. Defaults to VTKL_NAICS when
+            None or empty.
+        limit: Max results to return.
+        timeout: HTTP request timeout in seconds.
+
+    Returns:
+        List of USAspendingPartner with name and metadata. Empty, without
+        an HTTP request, when agency is blank.
+    """
+    pending = _start_lookup(agency, naics_codes, limit)
+    if not isinstance(pending, _PendingLookup):
+        return pending
+
+    try:
+        resp = _CLIENT.post(SEARCH_URL, json=pending.payload, timeout=timeout)
+    except httpx.HTTPError as exc:
+        return _lookup_failed(exc)
+    return _finish_lookup(pending, resp)
+
+
+async def lookup_partners_async(
+    agency: str,
+    naics_codes: Sequence[str] | None = None,
+    limit: int = 5,
+    timeout: float = 15.0,
+    client: httpx.AsyncClient | None = None,
+) -> list[USAspendingPartner]:
+    """Async variant of lookup_partners_by_naics_and_agency.
+
+    Shares the lookup cache and error handling with the sync version, so
+    batches can fan out many lookups concurrently on one event loop.
+
+    Args:
+        agency: Agency name or abbreviation to search.
+        naics_codes: NAICS codes to filter by. Defaults to VTKL_NAICS when
+            None or empty.
+        limit: Max results to return.
+        timeout: HTTP request timeout in seconds.
+        client: Pooled client from open_async_client(), shared across a
+            batch. A short-lived client is used when omitted.
+
+    Returns:
+        List of USAspendingPartner with name and metadata.
+    """
+    pending = _start_lookup(agency, naics_codes, limit)
+    if not isinstance(pending, _PendingLookup):
+        return pending
+
+    try:
+        if client is None:
+            async with open_async_client() as owned:
+                resp = await owned.post(SEARCH_URL, json=pending.payload, timeout=timeout)
+        else:
+            resp = await client.post(SEARCH_URL, json=pending.payload, timeout=timeout)
+    except httpx.HTTPError as exc:
+        return _lookup_failed(exc)
+    return _finish_lookup(pending, resp)
+
+
+def clear_lookup_cache() -> None:
+    """Drop all cached USAspending lookups."""
+    _LOOKUP_CACHE.clear()
+
+
+def close() -> None:
+    """Close the shared USAspending HTTP client."""
+    _CLIENT.close()
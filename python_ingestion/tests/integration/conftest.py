@@ -51,17 +51,19 @@ def _load_json(name: str):
         return json.load(f)
 
 
-@pytest.fixture
+# Snapshots are parsed once per session and shared; tests must treat them as
+# read-only (they are only handed to respx as response bodies)
+@pytest.fixture(scope="session")
 def grants_gov_snapshot():
     return _load_json("grants_gov_snapshots.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sam_gov_snapshot():
     return _load_json("sam_gov_snapshots.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sbir_gov_snapshot():
     return _load_json("sbir_gov_snapshots.json")
 
@@ -75,8 +77,8 @@ def make_opportunity(
     raw_text: str = "",
     naics_codes: list | None = None,
     set_aside_type: str | None = None,
-    award_min: float | None = None,
-    award_max: float | None = None,
+    award_min: int | None = None,
+    award_max: int | None = None,
     **kwargs,
 ) -> GrantOpportunity:
     dedup_hash = hashlib.sha256(f"{source}:{source_id}".encode()).hexdigest()
@@ -3,10 +3,11 @@
 AC-4: ineligible grant is filtered out before scoring.
 """
 
+import asyncio
+import itertools
 import sys
 from pathlib import Path
 
-import httpx
 import pytest
 import respx
 
@@ -29,27 +30,19 @@ async def test_ineligible_grant_filtered_before_scoring(
 ):
     """Ineligible grants (academic-only, 8(a)) never reach scorer or DB."""
 
-    all_opps = []
+    adapters = [
+        GrantsGovAdapter(attribution_header="test"),
+        SamGovAdapter(api_key="test"),
+        SbirGovAdapter(),
+    ]
 
-    with respx.mock:
-        respx.post(GrantsGovAdapter.API_URL).mock(
-            return_value=httpx.Response(200, json=grants_gov_snapshot)
-        )
-        all_opps.extend(await GrantsGovAdapter(attribution_header="test").fetch_opportunities())
+    with respx.mock() as rx:
+        rx.post(GrantsGovAdapter.API_URL).respond(200, json=grants_gov_snapshot)
+        rx.get(SamGovAdapter.API_URL).respond(200, json=sam_gov_snapshot)
+        rx.get(SbirGovAdapter.API_URL).respond(200, json=sbir_gov_snapshot)
+        results = await asyncio.gather(*(adapter.fetch_opportunities() for adapter in adapters))
 
-    sam = SamGovAdapter(api_key="test")
-    with respx.mock:
-        respx.get(SamGovAdapter.API_URL).mock(
-            return_value=httpx.Response(200, json=sam_gov_snapshot)
-        )
-        all_opps.extend(await sam.fetch_opportunities())
-
-    sbir = SbirGovAdapter()
-    with respx.mock:
-        respx.get(SbirGovAdapter.API_URL).mock(
-            return_value=httpx.Response(200, json=sbir_gov_snapshot)
-        )
-        all_opps.extend(await sbir.fetch_opportunities())
+    all_opps = list(itertools.chain.from_iterable(results))
 
     dedup = Deduplicator(set())
     new_opps = dedup.deduplicate(all_opps)
@@ -72,7 +65,7 @@ async def test_ineligible_grant_filtered_before_scoring(
 
     scored_ids = set()
     for opp, elig_result in eligible:
-        score = score_opportunity(opp, elig_result, DEFAULT_WEIGHTS)
+        score = await score_opportunity(opp, elig_result, DEFAULT_WEIGHTS)
         scored_ids.add(opp.source_opportunity_id)
         assert score.composite_score > 0
 
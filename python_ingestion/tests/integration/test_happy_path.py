@@ -3,6 +3,7 @@
 AC-2: adapter fetch → normalize → dedup → eligibility → score → DB insert succeeds.
 """
 
+import asyncio
 import hashlib
 import sys
 from pathlib import Path
@@ -28,33 +29,21 @@ from tests.integration.conftest import MockDBClient
 async def test_full_pipeline_happy_path(grants_gov_snapshot, sam_gov_snapshot, sbir_gov_snapshot, mock_db):
     """Full end-to-end: fetch → normalize → dedup → eligibility → score → DB insert."""
 
-    all_opportunities = []
-
-    # Grants.gov
-    with respx.mock:
-        respx.post(GrantsGovAdapter.API_URL).mock(
-            return_value=httpx.Response(200, json=grants_gov_snapshot)
-        )
-        opps = await GrantsGovAdapter(attribution_header="test").fetch_opportunities()
-        assert len(opps) >= 1
-        all_opportunities.extend(opps)
+    adapters = [
+        GrantsGovAdapter(attribution_header="test"),
+        SamGovAdapter(api_key="test-key"),
+        SbirGovAdapter(),
+    ]
 
-    # SAM.gov
-    sam_adapter = SamGovAdapter(api_key="test-key")
-    with respx.mock:
-        respx.get(SamGovAdapter.API_URL).mock(
-            return_value=httpx.Response(200, json=sam_gov_snapshot)
-        )
-        opps = await sam_adapter.fetch_opportunities()
-        assert len(opps) >= 1
-        all_opportunities.extend(opps)
+    # All three sources behind one respx mock, fetched concurrently
+    with respx.mock() as rx:
+        rx.post(GrantsGovAdapter.API_URL).respond(200, json=grants_gov_snapshot)
+        rx.get(SamGovAdapter.API_URL).respond(200, json=sam_gov_snapshot)
+        rx.get(SbirGovAdapter.API_URL).respond(200, json=sbir_gov_snapshot)
+        results = await asyncio.gather(*(adapter.fetch_opportunities() for adapter in adapters))
 
-    # SBIR.gov
-    with respx.mock:
-        respx.get(SbirGovAdapter.API_URL).mock(
-            return_value=httpx.Response(200, json=sbir_gov_snapshot)
-        )
-        opps = await SbirGovAdapter().fetch_opportunities()
+    all_opportunities = []
+    for opps in results:
         assert len(opps) >= 1
         all_opportunities.extend(opps)
 
@@ -79,7 +68,7 @@ async def test_full_pipeline_happy_path(grants_gov_snapshot, sam_gov_snapshot, s
     # Score
     scored = []
     for opp, elig in eligible_opps:
-        score_result = score_opportunity(opp, elig, DEFAULT_WEIGHTS)
+        score_result = await score_opportunity(opp, elig, DEFAULT_WEIGHTS)
         scored.append((opp, score_result))
         assert score_result.composite_score >= 0
         assert score_result.verdict in ("GO", "SHAPE", "MONITOR", "NO-GO")
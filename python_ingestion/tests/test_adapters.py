@@ -12,6 +12,7 @@ import pytest
 import respx
 import httpx
 from adapters import GrantsGovAdapter, SamGovAdapter, SbirGovAdapter
+from models import GrantOpportunity
 
 
 # ---------------------------------------------------------------------------
@@ -83,11 +84,32 @@ SBIR_GOV_MOCK = [
 ]
 
 
-def _mock_all_sources_success():
-    """Set up respx mocks for all three sources returning valid data."""
-    respx.post(GRANTS_GOV_URL).mock(return_value=httpx.Response(200, json=GRANTS_GOV_MOCK))
-    respx.get(SAM_GOV_URL).mock(return_value=httpx.Response(200, json=SAM_GOV_MOCK))
-    respx.get(SBIR_GOV_URL).mock(return_value=httpx.Response(200, json=SBIR_GOV_MOCK))
+@pytest.fixture(scope="module")
+def _respx_router():
+    """One respx router for the module; routes are registered once, not per test."""
+    with respx.mock(assert_all_called=False) as router:
+        router.post(GRANTS_GOV_URL, name="grants")
+        router.get(SAM_GOV_URL, name="sam")
+        router.get(SBIR_GOV_URL, name="sbir")
+        yield router
+
+
+@pytest.fixture
+def respx_routes(_respx_router):
+    """The module's routes, with responses and call history cleared for this test."""
+    routes = {name: _respx_router[name] for name in ("grants", "sam", "sbir")}
+    for route in routes.values():
+        route.return_value = None
+        route.side_effect = None
+    _respx_router.reset()
+    return routes
+
+
+def _mock_all_sources_success(routes):
+    """Point all three routes at valid data."""
+    routes["grants"].respond(200, json=GRANTS_GOV_MOCK)
+    routes["sam"].respond(200, json=SAM_GOV_MOCK)
+    routes["sbir"].respond(200, json=SBIR_GOV_MOCK)
 
 
 # ---------------------------------------------------------------------------
@@ -95,13 +117,11 @@ def _mock_all_sources_success():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_grants_gov_adapter_returns_opportunities():
+async def test_grants_gov_adapter_returns_opportunities(respx_routes):
     """AC #1: Grants.gov adapter returns ≥1 GrantOpportunity record.
     AC #6: Grants.gov requests include attribution header per ToS.
     """
-    route = respx.post(GRANTS_GOV_URL)
-    route.return_value = httpx.Response(200, json=GRANTS_GOV_MOCK)
+    route = respx_routes["grants"].respond(200, json=GRANTS_GOV_MOCK)
 
     adapter = GrantsGovAdapter(attribution_header="VTKL Test")
     opportunities = await adapter.fetch_opportunities()
@@ -125,11 +145,9 @@ async def test_grants_gov_adapter_returns_opportunities():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_sam_gov_adapter_returns_opportunities():
+async def test_sam_gov_adapter_returns_opportunities(respx_routes):
     """AC #1: SAM.gov adapter returns ≥1 GrantOpportunity record."""
-    route = respx.get(SAM_GOV_URL)
-    route.return_value = httpx.Response(200, json=SAM_GOV_MOCK)
+    respx_routes["sam"].respond(200, json=SAM_GOV_MOCK)
 
     adapter = SamGovAdapter(api_key="test-key")
     opportunities = await adapter.fetch_opportunities()
@@ -144,11 +162,9 @@ async def test_sam_gov_adapter_returns_opportunities():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_sbir_gov_adapter_returns_opportunities():
+async def test_sbir_gov_adapter_returns_opportunities(respx_routes):
     """AC #1 & AC #5: SBIR.gov adapter returns ≥1 GrantOpportunity, sbir_program_active=False."""
-    route = respx.get(SBIR_GOV_URL)
-    route.return_value = httpx.Response(200, json=SBIR_GOV_MOCK)
+    respx_routes["sbir"].respond(200, json=SBIR_GOV_MOCK)
 
     adapter = SbirGovAdapter()
     opportunities = await adapter.fetch_opportunities()
@@ -162,14 +178,13 @@ async def test_sbir_gov_adapter_returns_opportunities():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_all_pydantic_fields_populated_or_none():
+async def test_all_pydantic_fields_populated_or_none(respx_routes):
     """AC #3: All GrantOpportunity fields populated or explicitly None."""
     mock_response = {
         "hitCount": 1,
         "oppHits": [{"id": "MINIMAL-001", "title": "Minimal Opportunity", "agencyName": "Test Agency"}]
     }
-    respx.post(GRANTS_GOV_URL).mock(return_value=httpx.Response(200, json=mock_response))
+    respx_routes["grants"].respond(200, json=mock_response)
 
     adapter = GrantsGovAdapter()
     opportunities = await adapter.fetch_opportunities()
@@ -185,12 +200,11 @@ async def test_all_pydantic_fields_populated_or_none():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_polling_cycle_completes_under_5_minutes():
+async def test_polling_cycle_completes_under_5_minutes(respx_routes):
     """AC #4: Full polling cycle across all three sources completes quickly."""
     import time
 
-    _mock_all_sources_success()
+    _mock_all_sources_success(respx_routes)
 
     adapters = [GrantsGovAdapter(), SamGovAdapter(api_key="test-key"), SbirGovAdapter()]
 
@@ -207,10 +221,9 @@ async def test_polling_cycle_completes_under_5_minutes():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_adapter_timeout_returns_empty_list():
+async def test_adapter_timeout_returns_empty_list(respx_routes):
     """VTK-96: Adapter returns [] on timeout instead of raising."""
-    respx.post(GRANTS_GOV_URL).mock(side_effect=httpx.ConnectTimeout("connect timed out"))
+    respx_routes["grants"].side_effect = httpx.ConnectTimeout("connect timed out")
 
     adapter = GrantsGovAdapter()
     result = await adapter.fetch_opportunities()
@@ -218,10 +231,9 @@ async def test_adapter_timeout_returns_empty_list():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_adapter_timeout_returns_empty_list_sam():
+async def test_adapter_timeout_returns_empty_list_sam(respx_routes):
     """VTK-96: SAM.gov adapter returns [] on timeout."""
-    respx.get(SAM_GOV_URL).mock(side_effect=httpx.ConnectTimeout("connect timed out"))
+    respx_routes["sam"].side_effect = httpx.ConnectTimeout("connect timed out")
 
     adapter = SamGovAdapter(api_key="test-key")
     result = await adapter.fetch_opportunities()
@@ -229,10 +241,9 @@ async def test_adapter_timeout_returns_empty_list_sam():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_adapter_timeout_returns_empty_list_sbir():
+async def test_adapter_timeout_returns_empty_list_sbir(respx_routes):
     """VTK-96: SBIR.gov adapter returns [] on timeout."""
-    respx.get(SBIR_GOV_URL).mock(side_effect=httpx.ConnectTimeout("connect timed out"))
+    respx_routes["sbir"].side_effect = httpx.ConnectTimeout("connect timed out")
 
     adapter = SbirGovAdapter()
     result = await adapter.fetch_opportunities()
@@ -240,10 +251,9 @@ async def test_adapter_timeout_returns_empty_list_sbir():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_adapter_retry_exhaustion():
+async def test_adapter_retry_exhaustion(respx_routes):
     """VTK-96: After 3 consecutive failures (500s), adapter returns [] after retries."""
-    respx.post(GRANTS_GOV_URL).mock(return_value=httpx.Response(500, text="Internal Server Error"))
+    respx_routes["grants"].respond(500, text="Internal Server Error")
 
     adapter = GrantsGovAdapter()
     result = await adapter.fetch_opportunities()
@@ -251,11 +261,10 @@ async def test_adapter_retry_exhaustion():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_adapter_malformed_response():
+async def test_adapter_malformed_response(respx_routes):
     """VTK-96: Adapter returns [] gracefully on malformed JSON response."""
-    respx.post(GRANTS_GOV_URL).mock(
-        return_value=httpx.Response(200, content=b"not json at all", headers={"content-type": "application/json"})
+    respx_routes["grants"].respond(
+        200, content=b"not json at all", headers={"content-type": "application/json"}
     )
 
     adapter = GrantsGovAdapter()
@@ -264,11 +273,10 @@ async def test_adapter_malformed_response():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_adapter_malformed_response_sam():
+async def test_adapter_malformed_response_sam(respx_routes):
     """VTK-96: SAM.gov adapter returns [] on malformed JSON."""
-    respx.get(SAM_GOV_URL).mock(
-        return_value=httpx.Response(200, content=b"<<<garbage>>>", headers={"content-type": "application/json"})
+    respx_routes["sam"].respond(
+        200, content=b"<<<garbage>>>", headers={"content-type": "application/json"}
     )
 
     adapter = SamGovAdapter(api_key="test-key")
@@ -277,14 +285,13 @@ async def test_adapter_malformed_response_sam():
 
 
 @pytest.mark.asyncio
-@respx.mock
-async def test_partial_failure_pipeline_continues():
+async def test_partial_failure_pipeline_continues(respx_routes):
     """VTK-96: When 1 adapter fails, the other 2 still return results."""
     # Grants.gov fails
-    respx.post(GRANTS_GOV_URL).mock(side_effect=httpx.ConnectTimeout("timeout"))
+    respx_routes["grants"].side_effect = httpx.ConnectTimeout("timeout")
     # SAM.gov and SBIR.gov succeed
-    respx.get(SAM_GOV_URL).mock(return_value=httpx.Response(200, json=SAM_GOV_MOCK))
-    respx.get(SBIR_GOV_URL).mock(return_value=httpx.Response(200, json=SBIR_GOV_MOCK))
+    respx_routes["sam"].respond(200, json=SAM_GOV_MOCK)
+    respx_routes["sbir"].respond(200, json=SBIR_GOV_MOCK)
 
     adapters = [GrantsGovAdapter(), SamGovAdapter(api_key="test-key"), SbirGovAdapter()]
 
@@ -302,3 +309,47 @@ async def test_partial_failure_pipeline_continues():
     assert "sam_gov" in sources
     assert "sbir_gov" in sources
     assert "grants_gov" not in sources
+
+
+def test_low_cardinality_fields_are_interned():
+    """Source and type labels from parsed payloads share one string object."""
+    source_a, source_b = "".join(["sam", "_gov"]), "".join(["sam", "_gov"])
+    type_a, type_b = "".join(["Solic", "itation"]), "".join(["Solic", "itation"])
+    assert source_a is not source_b
+
+    opps = [
+        GrantOpportunity(
+            source=source,
+            source_opportunity_id=f"ID-{i}",
+            dedup_hash=f"hash-{i}",
+            title="Test",
+            agency="Test Agency",
+            opportunity_type=opp_type,
+            source_url="https://example.com",
+        )
+        for i, (source, opp_type) in enumerate([(source_a, type_a), (source_b, type_b)])
+    ]
+
+    assert opps[0].source is opps[1].source
+    assert opps[0].opportunity_type is opps[1].opportunity_type
+    assert opps[0].set_aside_type is None
+
+
+def test_award_amounts_quantized_to_whole_dollars():
+    """Float amounts from payloads or the DB are stored as int dollars."""
+    opp = GrantOpportunity(
+        source="grants_gov",
+        source_opportunity_id="AMT-001",
+        dedup_hash="hash-amt",
+        title="Test",
+        agency="Test Agency",
+        award_amount_min=100000.0,
+        award_amount_max=499999.6,
+        estimated_total_program_funding=None,
+        source_url="https://example.com",
+    )
+
+    assert opp.award_amount_min == 100_000
+    assert isinstance(opp.award_amount_min, int)
+    assert opp.award_amount_max == 500_000
+    assert opp.estimated_total_program_funding is None
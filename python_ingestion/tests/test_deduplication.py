@@ -110,3 +110,21 @@ def test_dedup_hash_unique_per_source():
     opp2 = create_test_opportunity("sam_gov", "001", "Test")
     
     assert opp1.dedup_hash != opp2.dedup_hash, "Same ID from different sources must produce different hashes"
+
+
+@pytest.mark.asyncio
+async def test_deduplicator_stream_yields_only_new():
+    """Streaming dedup yields survivors lazily and records their hashes."""
+    
+    async def source():
+        yield create_test_opportunity("grants_gov", "HHS-2024-001", "AI for Healthcare")
+        yield create_test_opportunity("sam_gov", "W911NF-24-001", "Army AI Research")
+        yield create_test_opportunity("grants_gov", "HHS-2024-001", "AI for Healthcare")  # duplicate
+    
+    existing = create_test_opportunity("sam_gov", "W911NF-24-001", "Army AI Research")
+    deduplicator = Deduplicator(existing_hashes={existing.dedup_hash})
+    
+    new_opps = [opp async for opp in deduplicator.stream(source())]
+    
+    assert [opp.source_opportunity_id for opp in new_opps] == ["HHS-2024-001"]
+    assert new_opps[0].dedup_hash in deduplicator.existing_hashes
@@ -4,9 +4,10 @@ import os
 import pytest
 import json
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 from models.grant_opportunity import GrantOpportunity
+from models.eligibility_result import ConstraintCheck, EligibilityResult
 from eligibility import assess_eligibility, persist_result, VTKL_PROFILE
 
 
@@ -92,6 +93,54 @@ def test_naics_mismatch(test_opportunities):
     assert result.naics_match_check.is_met is False
 
 
+
+def test_naics_mismatch_short_circuits_other_checks():
+    """NAICS mismatch returns immediately with a single blocker."""
+    opp = GrantOpportunity(
+        source="sam_gov",
+        source_opportunity_id="TEST-NAICS-SC",
+        dedup_hash="naics-sc",
+        title="Construction Services",
+        agency="Test Agency",
+        source_url="https://test.gov",
+        naics_codes=["236220"],
+        set_aside_type="8(a) Set-Aside",
+    )
+    
+    with patch("eligibility.filter._check_certifications") as cert_check:
+        result = assess_eligibility(opp)
+    
+    cert_check.assert_not_called()
+    assert result.is_eligible is False
+    assert result.participation_path is None
+    assert result.blockers == ["NAICS Match: Required NAICS 236220 not in VTKL profile"]
+    assert "Not evaluated" in result.certification_check.details
+
+
+def test_naics_mismatch_does_not_report_skipped_checks_as_passed():
+    """Checks skipped after a NAICS mismatch are stored as not evaluated."""
+    opp = GrantOpportunity(
+        source="sam_gov",
+        source_opportunity_id="TEST-NAICS-SKIP",
+        dedup_hash="naics-skip",
+        title="Construction Services",
+        agency="Test Agency",
+        source_url="https://test.gov",
+        naics_codes=["236220"],
+        set_aside_type="8(a) only",
+        description="Excluding Hawaii. Top Secret clearance required.",
+    )
+    supabase = MagicMock()
+    
+    result = assess_eligibility(opp)
+    persist_result(result, supabase_client=supabase)
+    
+    payload = supabase.table.return_value.upsert.call_args.args[0]
+    for field in ("certification_check", "location_check", "security_posture_check"):
+        assert getattr(result, field).is_met is None
+        assert payload[field]["is_met"] is None
+    assert payload["naics_match_check"]["is_met"] is False
+
 def test_entity_type_academic_blocked(test_opportunities):
     """Test that academic-only opportunities are blocked."""
     # Find academic test case
@@ -314,6 +363,55 @@ def test_env_var_overrides_profile():
         assert profile["financial_capacity"]["max_award"] == 10_000_000
 
 
+
+def test_vtkl_profile_env_overrides():
+    """Every VTKL_ env var maps onto its profile field, including naics_optional."""
+    with patch.dict(os.environ, {
+        "VTKL_ENTITY_TYPE": "nonprofit",
+        "VTKL_SAM_ENTITY_ID": "TESTENTITY01",
+        "VTKL_SAM_CAGE_CODE": "ABCDE",
+        "VTKL_SAM_STATUS": "inactive",
+        "VTKL_SAM_EXPIRY": "2030-01-31",
+        "VTKL_NAICS_OPTIONAL": "111111, 222222",
+        "VTKL_SECURITY_POSTURE": "IL2",
+        "VTKL_CITY": "Hilo",
+        "VTKL_NHO_ELIGIBLE": "false",
+        "VTKL_CERT_HUBZONE": "yes",
+        "VTKL_CERT_SDVOSB": "1",
+        "VTKL_CERT_WOSB": "true",
+        "VTKL_MIN_AWARD": "50000",
+        "VTKL_PREF_AWARD_MIN": "250000",
+        "VTKL_PREF_AWARD_MAX": "750000",
+    }):
+        from eligibility.vtkl_profile import _build_profile
+        profile = _build_profile()
+
+    assert profile["entity_type"] == "nonprofit"
+    assert profile["sam_registration"]["entity_id"] == "TESTENTITY01"
+    assert profile["sam_registration"]["cage_code"] == "ABCDE"
+    assert profile["sam_registration"]["status"] == "inactive"
+    assert profile["sam_registration"]["expiry_date"] == datetime(2030, 1, 31, tzinfo=timezone.utc)
+    assert profile["naics_optional"] == ["111111", "222222"]
+    assert profile["security_posture"] == ["IL2"]
+    assert profile["location"]["city"] == "Hilo"
+    assert profile["location"]["nho_eligible"] is False
+    assert profile["certifications"]["HUBZone"] is True
+    assert profile["certifications"]["hubzone"] is True
+    assert profile["certifications"]["sdvosb"] is True
+    assert profile["certifications"]["wosb"] is True
+    assert profile["financial_capacity"]["min_award"] == 50_000
+    assert profile["financial_capacity"]["preferred_range"] == (250_000, 750_000)
+
+
+def test_vtkl_profile_default_sam_expiry():
+    """Without VTKL_SAM_EXPIRY the profile uses the registered 2026-11-11 expiry."""
+    env = {k: v for k, v in os.environ.items() if k != "VTKL_SAM_EXPIRY"}
+    with patch.dict(os.environ, env, clear=True):
+        from eligibility.vtkl_profile import _build_profile
+        profile = _build_profile()
+
+    assert profile["sam_registration"]["expiry_date"] == datetime(2026, 11, 11, tzinfo=timezone.utc)
+
 def test_persist_result_writes_and_updates_status():
     """Test that persist_result upserts result and updates grant status."""
     from datetime import timezone
@@ -354,3 +452,58 @@ def test_nho_asset_detected(test_opportunities):
     result = assess_eligibility(opp)
     assert result.is_eligible is True
     assert any("NHO" in a for a in result.assets)
+
+
+def test_eligibility_result_joined_accessors():
+    """blockers_joined / warnings_joined track the lists and are excluded from dumps."""
+    check = ConstraintCheck(constraint_name="X", is_met=True)
+    result = EligibilityResult(
+        opportunity_id="JOIN-001",
+        is_eligible=False,
+        entity_type_check=check,
+        location_check=check,
+        sam_active_check=check,
+        naics_match_check=check,
+        security_posture_check=check,
+        certification_check=check,
+        blockers=["Requires 8(a)", "HUBZone only"],
+        warnings=[],
+    )
+
+    assert result.blockers_joined == "Requires 8(a); HUBZone only"
+    assert result.warnings_joined == ""
+    assert "blockers_joined" not in result.model_dump()
+    
+    updated = result.model_copy(update={"blockers": ["Top Secret"], "warnings": ["Short deadline"]})
+    assert updated.blockers_joined == "Top Secret"
+    assert updated.warnings_joined == "Short deadline"
+
+
+def test_opportunity_text_lowercased_once(test_opportunities):
+    """assess_eligibility lowercases description + raw_text once for every check."""
+    import eligibility.filter as filter_module
+
+    test_case = next(tc for tc in test_opportunities if tc["id"] == "GO-002")
+    opp = GrantOpportunity(**test_case["opportunity"])
+
+    with patch.object(
+        filter_module, "_opportunity_text_lower", wraps=filter_module._opportunity_text_lower
+    ) as text_lower:
+        result = assess_eligibility(opp)
+
+    text_lower.assert_called_once_with(opp)
+    assert result.is_eligible is True
+    assert any("NHO" in a for a in result.assets)
+
+
+def test_assess_eligibility_uses_given_timestamp(test_opportunities):
+    """A caller-supplied evaluated_at is stamped on both eligible and NAICS-rejected results."""
+    stamp = datetime(2026, 1, 15, tzinfo=timezone.utc)
+    
+    eligible = GrantOpportunity(**next(tc for tc in test_opportunities if tc["id"] == "GO-002")["opportunity"])
+    assert assess_eligibility(eligible, stamp).evaluated_at == stamp
+    
+    rejected = eligible.model_copy(update={"naics_codes": ["111110"]})
+    result = assess_eligibility(rejected, stamp)
+    assert result.is_eligible is False
+    assert result.evaluated_at == stamp
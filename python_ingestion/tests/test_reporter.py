@@ -1,5 +1,8 @@
 """Tests for VerdictReportGenerator."""
 
+import logging
+import time
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
@@ -191,6 +194,23 @@ def sample_teaming_partners():
     ]
 
 
+def _wire_rpc(client, scoring, eligibility, teaming_partners, raw_text):
+    """Point the client's get_verdict_inputs RPC at a canned payload."""
+    rpc_response = Mock()
+    rpc_response.data = {
+        "opportunity_id": scoring["opportunity_id"],
+        "scoring": scoring,
+        "eligibility": eligibility,
+        "teaming_partners": teaming_partners,
+        "raw_text": raw_text,
+    }
+    client._client.rpc.return_value.execute.return_value = rpc_response
+    
+    insert_response = Mock()
+    insert_response.data = [{"id": 1}]
+    client._client.table.return_value.insert.return_value.execute.return_value = insert_response
+
+
 def test_go_verdict_produces_full_report(
     mock_supabase_client,
     go_scoring_result,
@@ -198,54 +218,13 @@ def test_go_verdict_produces_full_report(
     sample_teaming_partners
 ):
     """Test that GO verdict produces full report with all 5 sections."""
-    # Setup mocks
-    mock_table = Mock()
-    mock_supabase_client._client.table.return_value = mock_table
-    
-    # Mock scoring results query
-    scoring_mock = Mock()
-    scoring_mock.data = go_scoring_result
-    
-    # Mock eligibility results query
-    eligibility_mock = Mock()
-    eligibility_mock.data = eligible_result
-    
-    # Mock teaming partners query
-    teaming_mock = Mock()
-    teaming_mock.data = sample_teaming_partners
-    
-    # Mock grant opportunity query
-    grant_mock = Mock()
-    grant_mock.data = {"raw_text": "Sample opportunity seeking AI solutions"}
-    
-    # Mock insert
-    insert_mock = Mock()
-    insert_mock.data = [{"id": 1}]
-    
-    # Setup query chain
-    def mock_query_chain(*args, **kwargs):
-        query = Mock()
-        query.select = Mock(return_value=query)
-        query.eq = Mock(return_value=query)
-        query.single = Mock(return_value=query)
-        
-        # Determine which query based on table name
-        table_name = args[0] if args else None
-        if table_name == "scoring_results":
-            query.execute = Mock(return_value=scoring_mock)
-        elif table_name == "eligibility_results":
-            query.execute = Mock(return_value=eligibility_mock)
-        elif table_name == "teaming_partners":
-            query.execute = Mock(return_value=teaming_mock)
-        elif table_name == "grant_opportunities":
-            query.execute = Mock(return_value=grant_mock)
-        elif table_name == "verdict_reports":
-            query.insert = Mock(return_value=query)
-            query.execute = Mock(return_value=insert_mock)
-        
-        return query
-    
-    mock_supabase_client._client.table = mock_query_chain
+    _wire_rpc(
+        mock_supabase_client,
+        go_scoring_result,
+        eligible_result,
+        sample_teaming_partners,
+        "Sample opportunity seeking AI solutions",
+    )
     
     # Generate report
     generator = VerdictReportGenerator(mock_supabase_client)
@@ -268,49 +247,13 @@ def test_no_go_verdict_produces_abbreviated_report(
     blocked_result
 ):
     """Test that NO-GO verdict produces abbreviated report."""
-    # Setup mocks
-    mock_table = Mock()
-    mock_supabase_client._client.table.return_value = mock_table
-    
-    # Mock responses
-    scoring_mock = Mock()
-    scoring_mock.data = no_go_scoring_result
-    
-    eligibility_mock = Mock()
-    eligibility_mock.data = blocked_result
-    
-    teaming_mock = Mock()
-    teaming_mock.data = []
-    
-    grant_mock = Mock()
-    grant_mock.data = {"raw_text": "Defense opportunity"}
-    
-    insert_mock = Mock()
-    insert_mock.data = [{"id": 2}]
-    
-    # Setup query chain
-    def mock_query_chain(*args, **kwargs):
-        query = Mock()
-        query.select = Mock(return_value=query)
-        query.eq = Mock(return_value=query)
-        query.single = Mock(return_value=query)
-        
-        table_name = args[0] if args else None
-        if table_name == "scoring_results":
-            query.execute = Mock(return_value=scoring_mock)
-        elif table_name == "eligibility_results":
-            query.execute = Mock(return_value=eligibility_mock)
-        elif table_name == "teaming_partners":
-            query.execute = Mock(return_value=teaming_mock)
-        elif table_name == "grant_opportunities":
-            query.execute = Mock(return_value=grant_mock)
-        elif table_name == "verdict_reports":
-            query.insert = Mock(return_value=query)
-            query.execute = Mock(return_value=insert_mock)
-        
-        return query
-    
-    mock_supabase_client._client.table = mock_query_chain
+    _wire_rpc(
+        mock_supabase_client,
+        no_go_scoring_result,
+        blocked_result,
+        [],
+        "Defense opportunity",
+    )
     
     # Generate report
     generator = VerdictReportGenerator(mock_supabase_client)
@@ -334,44 +277,13 @@ def test_evidence_traceability_in_executive_summary(
     sample_teaming_partners
 ):
     """Test that executive summary contains text from evidence_citations."""
-    # Setup mocks (similar to test_go_verdict)
-    scoring_mock = Mock()
-    scoring_mock.data = go_scoring_result
-    
-    eligibility_mock = Mock()
-    eligibility_mock.data = eligible_result
-    
-    teaming_mock = Mock()
-    teaming_mock.data = sample_teaming_partners
-    
-    grant_mock = Mock()
-    grant_mock.data = {"raw_text": "Sample opportunity"}
-    
-    insert_mock = Mock()
-    insert_mock.data = [{"id": 3}]
-    
-    def mock_query_chain(*args, **kwargs):
-        query = Mock()
-        query.select = Mock(return_value=query)
-        query.eq = Mock(return_value=query)
-        query.single = Mock(return_value=query)
-        
-        table_name = args[0] if args else None
-        if table_name == "scoring_results":
-            query.execute = Mock(return_value=scoring_mock)
-        elif table_name == "eligibility_results":
-            query.execute = Mock(return_value=eligibility_mock)
-        elif table_name == "teaming_partners":
-            query.execute = Mock(return_value=teaming_mock)
-        elif table_name == "grant_opportunities":
-            query.execute = Mock(return_value=grant_mock)
-        elif table_name == "verdict_reports":
-            query.insert = Mock(return_value=query)
-            query.execute = Mock(return_value=insert_mock)
-        
-        return query
-    
-    mock_supabase_client._client.table = mock_query_chain
+    _wire_rpc(
+        mock_supabase_client,
+        go_scoring_result,
+        eligible_result,
+        sample_teaming_partners,
+        "Sample opportunity",
+    )
     
     # Generate report
     generator = VerdictReportGenerator(mock_supabase_client)
@@ -398,44 +310,13 @@ def test_brand_messaging_in_one_pager(
     sample_teaming_partners
 ):
     """Test that one_pager_pitch contains required brand messaging."""
-    # Setup mocks
-    scoring_mock = Mock()
-    scoring_mock.data = go_scoring_result
-    
-    eligibility_mock = Mock()
-    eligibility_mock.data = eligible_result
-    
-    teaming_mock = Mock()
-    teaming_mock.data = sample_teaming_partners
-    
-    grant_mock = Mock()
-    grant_mock.data = {"raw_text": "Sample opportunity"}
-    
-    insert_mock = Mock()
-    insert_mock.data = [{"id": 4}]
-    
-    def mock_query_chain(*args, **kwargs):
-        query = Mock()
-        query.select = Mock(return_value=query)
-        query.eq = Mock(return_value=query)
-        query.single = Mock(return_value=query)
-        
-        table_name = args[0] if args else None
-        if table_name == "scoring_results":
-            query.execute = Mock(return_value=scoring_mock)
-        elif table_name == "eligibility_results":
-            query.execute = Mock(return_value=eligibility_mock)
-        elif table_name == "teaming_partners":
-            query.execute = Mock(return_value=teaming_mock)
-        elif table_name == "grant_opportunities":
-            query.execute = Mock(return_value=grant_mock)
-        elif table_name == "verdict_reports":
-            query.insert = Mock(return_value=query)
-            query.execute = Mock(return_value=insert_mock)
-        
-        return query
-    
-    mock_supabase_client._client.table = mock_query_chain
+    _wire_rpc(
+        mock_supabase_client,
+        go_scoring_result,
+        eligible_result,
+        sample_teaming_partners,
+        "Sample opportunity",
+    )
     
     # Generate report
     generator = VerdictReportGenerator(mock_supabase_client)
@@ -448,3 +329,130 @@ def test_brand_messaging_in_one_pager(
     
     # Verify pitch contains score
     assert "85" in report.one_pager_pitch or "85.0" in report.one_pager_pitch
+
+
+def test_generate_fetches_inputs_in_single_rpc(
+    mock_supabase_client,
+    go_scoring_result,
+    eligible_result,
+    sample_teaming_partners
+):
+    """Test that all report inputs come from one get_verdict_inputs call."""
+    _wire_rpc(
+        mock_supabase_client,
+        go_scoring_result,
+        eligible_result,
+        sample_teaming_partners,
+        "Sample opportunity",
+    )
+    
+    generator = VerdictReportGenerator(mock_supabase_client)
+    generator.generate("TEST-GO-001")
+    
+    mock_supabase_client._client.rpc.assert_called_once_with(
+        "get_verdict_inputs", {"oid": "TEST-GO-001"}
+    )
+    # Only the verdict_reports insert goes through .table()
+    mock_supabase_client._client.table.assert_called_once_with("verdict_reports")
+
+
+def test_generate_raises_when_scoring_missing(mock_supabase_client):
+    """Test that a missing scoring payload raises ValueError."""
+    rpc_response = Mock()
+    rpc_response.data = {"opportunity_id": "TEST-MISSING", "scoring": None}
+    mock_supabase_client._client.rpc.return_value.execute.return_value = rpc_response
+    
+    generator = VerdictReportGenerator(mock_supabase_client)
+    with pytest.raises(ValueError, match="No scoring results"):
+        generator.generate("TEST-MISSING")
+
+
+def test_generate_batch_reads_and_inserts_once_per_batch(
+    mock_supabase_client,
+    go_scoring_result,
+    no_go_scoring_result,
+    eligible_result,
+    blocked_result,
+    sample_teaming_partners
+):
+    """Test that generate_batch uses one view query and one insert per batch."""
+    view_response = Mock()
+    view_response.data = [
+        {
+            "opportunity_id": "TEST-GO-001",
+            "scoring": go_scoring_result,
+            "eligibility": eligible_result,
+            "teaming_partners": sample_teaming_partners,
+            "raw_text": "Sample opportunity",
+        },
+        {
+            "opportunity_id": "TEST-NOGO-001",
+            "scoring": no_go_scoring_result,
+            "eligibility": blocked_result,
+            "teaming_partners": [],
+            "raw_text": "Defense opportunity",
+        },
+    ]
+    view_query = Mock()
+    view_query.select.return_value.in_.return_value.execute.return_value = view_response
+    reports_table = Mock()
+    mock_supabase_client._client.table.side_effect = lambda name: {
+        "verdict_report_inputs": view_query,
+        "verdict_reports": reports_table,
+    }[name]
+    
+    generator = VerdictReportGenerator(mock_supabase_client)
+    reports = generator.generate_batch(["TEST-GO-001", "TEST-MISSING", "TEST-NOGO-001"])
+    
+    assert [r.verdict for r in reports] == ["GO", "NO-GO"]
+    view_query.select.return_value.in_.assert_called_once_with(
+        "opportunity_id", ["TEST-GO-001", "TEST-MISSING", "TEST-NOGO-001"]
+    )
+    reports_table.insert.assert_called_once()
+    inserted = reports_table.insert.call_args.args[0]
+    assert [row["opportunity_id"] for row in inserted] == ["TEST-GO-001", "TEST-NOGO-001"]
+
+
+def test_flush_waits_for_background_insert_and_surfaces_errors(
+    caplog,
+    mock_supabase_client,
+    go_scoring_result,
+    eligible_result,
+    sample_teaming_partners
+):
+    """Test that generate() inserts inline by default, and background inserts log and flush failures."""
+    _wire_rpc(
+        mock_supabase_client,
+        go_scoring_result,
+        eligible_result,
+        sample_teaming_partners,
+        "Sample opportunity",
+    )
+    insert_execute = mock_supabase_client._client.table.return_value.insert.return_value.execute
+    insert_execute.side_effect = RuntimeError("insert failed")
+    
+    generator = VerdictReportGenerator(mock_supabase_client)
+    
+    # Default: the insert happens inline and its failure propagates
+    with pytest.raises(RuntimeError, match="insert failed"):
+        generator.generate("TEST-GO-001")
+    insert_execute.reset_mock()
+    
+    with caplog.at_level(logging.ERROR, logger="reporter.generator"):
+        report = generator.generate("TEST-GO-001", background=True)
+        generator._pending_inserts[0].exception()  # wait for the insert to finish
+        
+        # Logged by the done callback before anyone calls flush()
+        for _ in range(100):
+            if "Background verdict report insert failed" in caplog.text:
+                break
+            time.sleep(0.01)
+        assert "Background verdict report insert failed" in caplog.text
+        
+        assert report.verdict == "GO"
+        with pytest.raises(RuntimeError, match="insert failed"):
+            generator.flush()
+    insert_execute.assert_called_once()
+    
+    # Pending work is cleared once flushed
+    generator.flush()
@@ -1,19 +1,24 @@
 """Unit tests for LLM-based weighted scoring engine."""
 
+import asyncio
 import json
-from unittest.mock import Mock, patch, MagicMock
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import pytest
+from pydantic import ValidationError
 
 from models.grant_opportunity import GrantOpportunity
 from models.eligibility_result import EligibilityResult, ConstraintCheck
-from scorer import score_opportunity, DEFAULT_WEIGHTS, ScoringWeights
+from scorer import score_opportunity, score_opportunity_sync, DEFAULT_WEIGHTS, ScoringWeights
 from scorer.engine import _get_verdict, _score_eligibility
 
 
 @pytest.fixture
 def mock_anthropic_client():
     """Mock Anthropic client to avoid real API calls."""
-    with patch('scorer.engine.anthropic.Anthropic') as mock_client_class:
+    with patch('anthropic.AsyncAnthropic') as mock_client_class, \
+            patch.dict('scorer.engine._CLIENTS', clear=True), \
+            patch.dict('scorer.engine._RESPONSE_CACHE', clear=True):
         mock_client = Mock()
         mock_client_class.return_value = mock_client
         yield mock_client
@@ -77,7 +82,7 @@ def ineligible_result():
     )
 
 
-def test_go_verdict_high_scores(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+async def test_go_verdict_high_scores(mock_anthropic_client, high_scoring_opportunity, eligible_result):
     """Test GO verdict when all dimensions score high (≥80)."""
     
     # Mock LLM responses for high scores
@@ -94,10 +99,10 @@ def test_go_verdict_high_scores(mock_anthropic_client, high_scoring_opportunity,
             }))]
         )
     
-    mock_anthropic_client.messages.create = Mock(side_effect=lambda **kwargs: mock_llm_response(kwargs['messages'][0]['content']))
+    mock_anthropic_client.messages.create = AsyncMock(side_effect=lambda **kwargs: mock_llm_response(kwargs['messages'][0]['content']))
     
     # Score the opportunity
-    result = score_opportunity(high_scoring_opportunity, eligible_result)
+    result = await score_opportunity(high_scoring_opportunity, eligible_result)
     
     # Verify GO verdict
     assert result.verdict == "GO", f"Expected GO verdict but got {result.verdict}"
@@ -111,7 +116,7 @@ def test_go_verdict_high_scores(mock_anthropic_client, high_scoring_opportunity,
     assert result.strategic_value.score > 0
 
 
-def test_nogo_verdict_ineligible(mock_anthropic_client, high_scoring_opportunity, ineligible_result):
+async def test_nogo_verdict_ineligible(mock_anthropic_client, high_scoring_opportunity, ineligible_result):
     """Test NO-GO verdict when is_eligible=False (eligibility score=0, composite ≤39)."""
     
     # Mock LLM responses - even if other dimensions score high, composite should be NO-GO
@@ -124,10 +129,10 @@ def test_nogo_verdict_ineligible(mock_anthropic_client, high_scoring_opportunity
             }))]
         )
     
-    mock_anthropic_client.messages.create = Mock(side_effect=lambda **kwargs: mock_llm_response(kwargs['messages'][0]['content']))
+    mock_anthropic_client.messages.create = AsyncMock(side_effect=lambda **kwargs: mock_llm_response(kwargs['messages'][0]['content']))
     
     # Score the opportunity with ineligible status
-    result = score_opportunity(high_scoring_opportunity, ineligible_result)
+    result = await score_opportunity(high_scoring_opportunity, ineligible_result)
     
     # Verify eligibility score is 0
     assert result.eligibility.score == 0.0, f"Expected eligibility=0 for ineligible opportunity but got {result.eligibility.score}"
@@ -137,7 +142,7 @@ def test_nogo_verdict_ineligible(mock_anthropic_client, high_scoring_opportunity
     assert result.composite_score <= 39, f"Expected composite ≤39 but got {result.composite_score}"
 
 
-def test_evidence_citations_present(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+async def test_evidence_citations_present(mock_anthropic_client, high_scoring_opportunity, eligible_result):
     """Test that all dimensions include evidence citations."""
     
     # Mock LLM responses with citations
@@ -153,10 +158,10 @@ def test_evidence_citations_present(mock_anthropic_client, high_scoring_opportun
             }))]
         )
     
-    mock_anthropic_client.messages.create = Mock(side_effect=lambda **kwargs: mock_llm_response(kwargs['messages'][0]['content']))
+    mock_anthropic_client.messages.create = AsyncMock(side_effect=lambda **kwargs: mock_llm_response(kwargs['messages'][0]['content']))
     
     # Score the opportunity
-    result = score_opportunity(high_scoring_opportunity, eligible_result)
+    result = await score_opportunity(high_scoring_opportunity, eligible_result)
     
     # Verify all dimensions have citations
     assert len(result.mission_fit.evidence_citations) > 0, "Mission fit should have evidence citations"
@@ -252,11 +257,11 @@ def test_custom_weights():
     assert abs(total - 1.0) < 0.001, "Weights should sum to 1.0"
 
 
-def test_llm_model_recorded(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+async def test_llm_model_recorded(mock_anthropic_client, high_scoring_opportunity, eligible_result):
     """Test that LLM model is recorded in result."""
     
     # Mock LLM response
-    mock_anthropic_client.messages.create = Mock(
+    mock_anthropic_client.messages.create = AsyncMock(
         return_value=Mock(
             content=[Mock(text=json.dumps({
                 "score": 80,
@@ -266,7 +271,7 @@ def test_llm_model_recorded(mock_anthropic_client, high_scoring_opportunity, eli
     )
     
     # Score with specific model
-    result = score_opportunity(
+    result = await score_opportunity(
         high_scoring_opportunity,
         eligible_result,
         llm_model="claude-haiku-4-5"
@@ -275,11 +280,11 @@ def test_llm_model_recorded(mock_anthropic_client, high_scoring_opportunity, eli
     assert result.llm_model == "claude-haiku-4-5", "LLM model should be recorded"
 
 
-def test_composite_score_calculation(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+async def test_composite_score_calculation(mock_anthropic_client, high_scoring_opportunity, eligible_result):
     """Test that composite score is correctly calculated from weighted dimensions."""
     
     # Mock LLM to return fixed scores
-    mock_anthropic_client.messages.create = Mock(
+    mock_anthropic_client.messages.create = AsyncMock(
         return_value=Mock(
             content=[Mock(text=json.dumps({
                 "score": 80,
@@ -288,7 +293,7 @@ def test_composite_score_calculation(mock_anthropic_client, high_scoring_opportu
         )
     )
     
-    result = score_opportunity(high_scoring_opportunity, eligible_result)
+    result = await score_opportunity(high_scoring_opportunity, eligible_result)
     
     # Calculate expected composite manually
     # Eligibility will be high (eligible with assets = 100)
@@ -310,41 +315,41 @@ def test_composite_score_calculation(mock_anthropic_client, high_scoring_opportu
     assert abs(result.composite_score - expected) < 0.1, "Composite should match weighted calculation"
 
 
-def test_llm_error_handling(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+async def test_llm_error_handling(mock_anthropic_client, high_scoring_opportunity, eligible_result):
     """Test graceful handling of LLM API errors."""
     
     # Mock LLM to raise an exception
-    mock_anthropic_client.messages.create = Mock(side_effect=Exception("API Error"))
+    mock_anthropic_client.messages.create = AsyncMock(side_effect=Exception("API Error"))
     
     # Should still return a result with fallback scores
-    result = score_opportunity(high_scoring_opportunity, eligible_result)
+    result = await score_opportunity(high_scoring_opportunity, eligible_result)
     
     assert result is not None, "Should return result even with LLM errors"
     assert result.composite_score >= 0, "Should have valid composite score"
 
 
-def test_llm_malformed_json_handling(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+async def test_llm_malformed_json_handling(mock_anthropic_client, high_scoring_opportunity, eligible_result):
     """Test handling of malformed JSON from LLM."""
     
     # Mock LLM to return invalid JSON
-    mock_anthropic_client.messages.create = Mock(
+    mock_anthropic_client.messages.create = AsyncMock(
         return_value=Mock(
             content=[Mock(text="This is not valid JSON")]
         )
     )
     
     # Should still return a result with fallback scores
-    result = score_opportunity(high_scoring_opportunity, eligible_result)
+    result = await score_opportunity(high_scoring_opportunity, eligible_result)
     
     assert result is not None, "Should return result even with malformed JSON"
     assert result.composite_score >= 0, "Should have valid composite score"
 
 
-def test_shape_verdict_range(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+async def test_shape_verdict_range(mock_anthropic_client, high_scoring_opportunity, eligible_result):
     """Test SHAPE verdict (60-79 range)."""
     
     # Mock LLM to return scores that should yield SHAPE
-    mock_anthropic_client.messages.create = Mock(
+    mock_anthropic_client.messages.create = AsyncMock(
         return_value=Mock(
             content=[Mock(text=json.dumps({
                 "score": 65,
@@ -353,18 +358,18 @@ def test_shape_verdict_range(mock_anthropic_client, high_scoring_opportunity, el
         )
     )
     
-    result = score_opportunity(high_scoring_opportunity, eligible_result)
+    result = await score_opportunity(high_scoring_opportunity, eligible_result)
     
     # Should be SHAPE if composite is 60-79
     if 60 <= result.composite_score < 80:
         assert result.verdict == "SHAPE", f"Score {result.composite_score} should be SHAPE"
 
 
-def test_monitor_verdict_range(mock_anthropic_client, high_scoring_opportunity, ineligible_result):
+async def test_monitor_verdict_range(mock_anthropic_client, high_scoring_opportunity, ineligible_result):
     """Test MONITOR verdict (40-59 range)."""
     
     # Mock LLM to return moderate scores
-    mock_anthropic_client.messages.create = Mock(
+    mock_anthropic_client.messages.create = AsyncMock(
         return_value=Mock(
             content=[Mock(text=json.dumps({
                 "score": 55,
@@ -373,8 +378,478 @@ def test_monitor_verdict_range(mock_anthropic_client, high_scoring_opportunity,
         )
     )
     
-    result = score_opportunity(high_scoring_opportunity, ineligible_result)
+    result = await score_opportunity(high_scoring_opportunity, ineligible_result)
     
     # With ineligibility, should likely be in MONITOR or NO-GO range
     if 40 <= result.composite_score < 60:
         assert result.verdict == "MONITOR", f"Score {result.composite_score} should be MONITOR"
+
+
+async def test_llm_dimensions_each_scored_once(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Each LLM dimension gets exactly one call and its own score back."""
+    
+    dimension_scores = {
+        "MISSION FIT": 91,
+        "TECHNICAL ALIGNMENT": 82,
+        "FINANCIAL VIABILITY": 73,
+        "STRATEGIC VALUE": 64,
+    }
+    
+    def mock_llm_response(**kwargs):
+        prompt = "".join(block["text"] for block in kwargs['messages'][0]['content'])
+        score = next(v for k, v in dimension_scores.items() if k in prompt)
+        return Mock(content=[Mock(text=json.dumps({"score": score, "evidence_citations": ["quote"]}))])
+    
+    mock_anthropic_client.messages.create = AsyncMock(side_effect=mock_llm_response)
+    
+    result = await score_opportunity(high_scoring_opportunity, eligible_result)
+    
+    assert mock_anthropic_client.messages.create.call_count == 4
+    assert result.mission_fit.score == 91
+    assert result.technical_alignment.score == 82
+    assert result.financial_viability.score == 73
+    assert result.strategic_value.score == 64
+
+
+async def test_ineligible_skips_llm_calls(mock_anthropic_client, high_scoring_opportunity, ineligible_result):
+    """Ineligible opportunities are scored without any LLM call."""
+    
+    mock_anthropic_client.messages.create = AsyncMock()
+    
+    result = await score_opportunity(high_scoring_opportunity, ineligible_result)
+    
+    mock_anthropic_client.messages.create.assert_not_called()
+    assert result.composite_score == 0.0
+    assert result.verdict == "NO-GO"
+    assert result.mission_fit.evidence_citations == ["Skipped - ineligible"]
+
+
+async def test_anthropic_client_reused_across_calls(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """The Anthropic client is constructed once and shared across scoring runs."""
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))]
+    ))
+    
+    with patch('anthropic.AsyncAnthropic', return_value=mock_anthropic_client) as mock_client_class:
+        await score_opportunity(high_scoring_opportunity, eligible_result)
+        await score_opportunity(high_scoring_opportunity, eligible_result)
+    
+    mock_client_class.assert_called_once()
+
+
+def test_score_opportunity_sync_wrapper(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """The sync shim drives the async scorer to completion for legacy callers."""
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))]
+    ))
+    
+    result = score_opportunity_sync(high_scoring_opportunity, eligible_result)
+    
+    assert mock_anthropic_client.messages.create.await_count == 4
+    assert result.mission_fit.score == 80
+
+
+def test_sync_calls_reuse_one_client(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Repeated sync calls share one loop, so the client is built once."""
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))]
+    ))
+    opportunities = [
+        high_scoring_opportunity.model_copy(update={"raw_text": f"{high_scoring_opportunity.raw_text} Lot {i}."})
+        for i in range(3)
+    ]
+    
+    with patch('anthropic.AsyncAnthropic', return_value=mock_anthropic_client) as mock_client_class:
+        for opportunity in opportunities:
+            score_opportunity_sync(opportunity, eligible_result)
+    
+    mock_client_class.assert_called_once()
+    assert mock_anthropic_client.messages.create.await_count == 12
+
+
+def test_sync_calls_from_concurrent_threads(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Each thread scores on its own loop, so concurrent sync calls don't collide."""
+    
+    import threading
+    
+    barrier = threading.Barrier(2)
+    
+    async def create(**kwargs):
+        await asyncio.sleep(0.01)
+        return Mock(content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))])
+    
+    mock_anthropic_client.messages.create = create
+    results, errors = [], []
+    
+    def worker(i):
+        opportunity = high_scoring_opportunity.model_copy(
+            update={"raw_text": f"{high_scoring_opportunity.raw_text} Thread {i}."}
+        )
+        barrier.wait()
+        try:
+            results.append(score_opportunity_sync(opportunity, eligible_result))
+        except Exception as exc:
+            errors.append(exc)
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    assert len(results) == 2
+
+
+def test_sync_call_inside_running_loop_raises(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Calling the sync API from async code points the caller at the async API."""
+    
+    async def call_sync():
+        score_opportunity_sync(high_scoring_opportunity, eligible_result)
+    
+    with pytest.raises(RuntimeError, match="await score_opportunity"):
+        asyncio.run(call_sync())
+
+
+def test_weights_as_vector_order():
+    """Weight vector follows SCORE_DIMENSIONS order."""
+    
+    from scorer.weights import SCORE_DIMENSIONS
+    
+    weights = ScoringWeights(
+        mission_fit=0.30,
+        eligibility=0.25,
+        technical_alignment=0.20,
+        financial_viability=0.15,
+        strategic_value=0.10
+    )
+    
+    assert weights.as_vector() == (0.30, 0.25, 0.20, 0.15, 0.10)
+    assert len(SCORE_DIMENSIONS) == len(weights.as_vector())
+
+
+def test_scoring_weights_validated_and_frozen():
+    """Weights are range/sum checked on construction and immutable afterwards."""
+    
+    import dataclasses
+    
+    weights = ScoringWeights(mission_fit=0.3, eligibility=0.2)
+    assert weights.to_dict()["mission_fit"] == 0.3
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        weights.mission_fit = 0.5
+    
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        ScoringWeights(mission_fit=1.5)
+    with pytest.raises(ValueError, match="sum to 1.0"):
+        ScoringWeights(mission_fit=0.5)
+    with pytest.raises(ValueError, match="mission_fit must be a number"):
+        ScoringWeights(mission_fit=None)
+    with pytest.raises(ValueError, match="eligibility must be a number"):
+        ScoringWeights(eligibility="high")
+    with pytest.raises(ValueError, match="version must be a string"):
+        ScoringWeights(version=1.0)
+
+def test_load_weights_cached_until_file_changes(tmp_path):
+    """Unchanged weights files are parsed once; edits are picked up."""
+    
+    import os
+    from scorer import load_weights
+    from scorer.weights import EQUAL_WEIGHTS, MISSION_FOCUSED, save_weights
+    
+    path = tmp_path / "weights.yaml"
+    save_weights(EQUAL_WEIGHTS, str(path))
+    
+    with patch.dict('scorer.weights._WEIGHTS_CACHE', clear=True):
+        first = load_weights(str(path))
+        with patch('yaml.load') as yaml_load:
+            assert load_weights(str(path)) is first
+        yaml_load.assert_not_called()
+        
+        save_weights(MISSION_FOCUSED, str(path))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_weights(str(path)).version == "mission_focused_1.0"
+    
+    with pytest.raises(FileNotFoundError):
+        load_weights(str(tmp_path / "missing.yaml"))
+
+
+async def test_rescoring_hits_response_cache(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Re-scoring the same grant reuses cached dimension scores."""
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))]
+    ))
+    
+    first = await score_opportunity(high_scoring_opportunity, eligible_result)
+    second = await score_opportunity(high_scoring_opportunity, eligible_result)
+    
+    assert mock_anthropic_client.messages.create.await_count == 4
+    assert second.composite_score == first.composite_score
+    
+    # Cached DimensionScores are shared between results, so they are frozen
+    assert second.mission_fit is first.mission_fit
+    with pytest.raises(ValidationError):
+        first.mission_fit.score = 0.0
+
+
+async def test_response_cache_hit_skips_prompt_assembly(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Cached dimensions are found by grant-text digest before prompts are built."""
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))]
+    ))
+    
+    await score_opportunity(high_scoring_opportunity, eligible_result)
+    with patch('scorer.engine.get_prompt_blocks') as get_blocks:
+        await score_opportunity(high_scoring_opportunity, eligible_result)
+    get_blocks.assert_not_called()
+    
+    # Different grant text is a different key
+    changed = high_scoring_opportunity.model_copy(update={"raw_text": "Different solicitation text."})
+    await score_opportunity(changed, eligible_result)
+    assert mock_anthropic_client.messages.create.await_count == 8
+
+
+async def test_stub_opportunity_skips_text_only_dimensions(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """With no description or raw_text, only award/agency dimensions go to the LLM."""
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))]
+    ))
+    stub = high_scoring_opportunity.model_copy(update={"description": "  ", "raw_text": None})
+    
+    result = await score_opportunity(stub, eligible_result)
+    
+    assert mock_anthropic_client.messages.create.await_count == 2
+    assert result.mission_fit.score == result.technical_alignment.score == 20.0
+    assert result.mission_fit.evidence_citations == ["No description available"]
+    assert result.financial_viability.score == result.strategic_value.score == 80.0
+
+async def test_failed_llm_responses_not_cached(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Fallback scores from malformed responses are retried, not cached."""
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text="not json")]
+    ))
+    
+    await score_opportunity(high_scoring_opportunity, eligible_result)
+    await score_opportunity(high_scoring_opportunity, eligible_result)
+    
+    assert mock_anthropic_client.messages.create.await_count == 8
+
+
+def test_score_and_save_batch_writes_in_batches(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Batch save issues one insert and one status update per batch."""
+    
+    from scorer.engine import score_and_save_batch
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))]
+    ))
+    opportunities = [
+        high_scoring_opportunity.model_copy(update={"source_opportunity_id": f"GO-TEST-{i}"})
+        for i in range(3)
+    ]
+    db_client = MagicMock()
+    
+    results = score_and_save_batch(opportunities, [eligible_result] * 3, db_client, batch_size=2)
+    
+    assert [r.opportunity_id for r in results] == ["GO-TEST-0", "GO-TEST-1", "GO-TEST-2"]
+    insert_calls = db_client.table.return_value.insert.call_args_list
+    assert [len(call.args[0]) for call in insert_calls] == [2, 1]
+    update_in_calls = db_client.table.return_value.update.return_value.in_.call_args_list
+    assert [call.args[1] for call in update_in_calls] == [["GO-TEST-0", "GO-TEST-1"], ["GO-TEST-2"]]
+    assert len({r.scored_at for r in results}) == 1
+    rows = [row for call in insert_calls for row in call.args[0]]
+    assert {row["scored_at"] for row in rows} == {results[0].scored_at.isoformat()}
+
+
+def test_score_and_save_batch_bounds_in_flight_llm_calls(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Batch scoring never has more than max_concurrency opportunities' calls in flight."""
+    
+    import asyncio
+    from scorer.engine import score_and_save_batch
+    
+    in_flight = peak = 0
+    
+    async def _create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Mock(content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))])
+    
+    mock_anthropic_client.messages.create = AsyncMock(side_effect=_create)
+    opportunities = [
+        high_scoring_opportunity.model_copy(update={
+            "source_opportunity_id": f"GO-TEST-{i}",
+            "raw_text": f"{high_scoring_opportunity.raw_text} Lot {i}.",
+        })
+        for i in range(10)
+    ]
+    
+    results = score_and_save_batch(
+        opportunities, [eligible_result] * 10, MagicMock(), max_concurrency=2
+    )
+    
+    assert mock_anthropic_client.messages.create.await_count == 40
+    assert peak == 8
+    assert all(r.mission_fit.score == 80 for r in results)
+
+
+async def test_llm_calls_are_deterministic_and_capped(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Dimension calls use temperature 0 and the compact output cap."""
+    
+    from scorer.engine import LLM_MAX_TOKENS
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))]
+    ))
+    
+    await score_opportunity(high_scoring_opportunity, eligible_result)
+    
+    for call in mock_anthropic_client.messages.create.await_args_list:
+        assert call.kwargs["temperature"] == 0.0
+        assert call.kwargs["max_tokens"] == LLM_MAX_TOKENS
+
+
+def test_long_raw_text_trimmed_to_budget(high_scoring_opportunity):
+    """Long raw_text keeps its opening plus capability-relevant sentences."""
+    
+    from scorer.engine import RAW_TEXT_CHAR_BUDGET, _prepare_grant_text
+    
+    filler = "Offerors shall comply with standard clauses. " * 400
+    opportunity = high_scoring_opportunity.model_copy(update={
+        "raw_text": filler + "The program needs machine learning for claims triage. " + filler
+    })
+    
+    grant_text = _prepare_grant_text(opportunity)
+    full_text = grant_text.split("Full Text: ", 1)[1]
+    
+    assert len(full_text) <= RAW_TEXT_CHAR_BUDGET + len(" [...] ")
+    assert full_text.startswith("Offerors shall comply")
+    assert "machine learning for claims triage" in full_text
+
+
+def test_short_raw_text_passed_through(high_scoring_opportunity):
+    """raw_text within budget reaches the prompt unchanged."""
+    
+    from scorer.engine import _prepare_grant_text
+    
+    grant_text = _prepare_grant_text(high_scoring_opportunity)
+    
+    assert grant_text.endswith(f"Full Text: {high_scoring_opportunity.raw_text}")
+
+
+async def test_grant_text_sent_as_shared_cached_prefix(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """Every dimension call leads with the same cache-marked grant text block."""
+    
+    mock_anthropic_client.messages.create = AsyncMock(return_value=Mock(
+        content=[Mock(text=json.dumps({"score": 80, "evidence_citations": ["quote"]}))]
+    ))
+    
+    await score_opportunity(high_scoring_opportunity, eligible_result)
+    
+    first_blocks = [
+        call.kwargs["messages"][0]["content"][0]
+        for call in mock_anthropic_client.messages.create.await_args_list
+    ]
+    assert len(first_blocks) == 4
+    assert all(block == first_blocks[0] for block in first_blocks)
+    assert first_blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert high_scoring_opportunity.raw_text in first_blocks[0]["text"]
+
+
+async def test_llm_response_validation(mock_anthropic_client, high_scoring_opportunity, eligible_result):
+    """LLM JSON is validated: scores clamp, citations cap at 3, bad shapes fall back."""
+    
+    responses = {
+        "MISSION FIT": {"score": 140, "evidence_citations": ["a", "b", "c", "d"]},
+        "TECHNICAL ALIGNMENT": {"score": "75", "evidence_citations": []},
+        "FINANCIAL VIABILITY": {"score": 60},
+        "STRATEGIC VALUE": {"score": "high", "evidence_citations": ["x"]},
+    }
+    
+    def mock_llm_response(**kwargs):
+        prompt = "".join(block["text"] for block in kwargs['messages'][0]['content'])
+        body = next(v for k, v in responses.items() if k in prompt)
+        return Mock(content=[Mock(text=json.dumps(body))])
+    
+    mock_anthropic_client.messages.create = AsyncMock(side_effect=mock_llm_response)
+    
+    result = await score_opportunity(high_scoring_opportunity, eligible_result)
+    
+    assert result.mission_fit.score == 100.0
+    assert result.mission_fit.evidence_citations == ["a", "b", "c"]
+    assert result.technical_alignment.score == 75.0
+    assert result.technical_alignment.evidence_citations == ["No specific evidence provided"]
+    assert result.financial_viability.score == 50.0
+    assert "parsing error" in result.financial_viability.evidence_citations[0]
+    assert result.strategic_value.score == 50.0
+    assert "parsing error" in result.strategic_value.evidence_citations[0]
+
+
+def test_prompt_blocks_reuse_static_instructions():
+    """Only the grant text block is rebuilt per call; instructions are precomputed."""
+    
+    from scorer.prompts import get_prompt_blocks
+    
+    first = get_prompt_blocks("mission_fit", "Grant A")
+    second = get_prompt_blocks("mission_fit", "Grant B")
+    
+    assert first[1] is second[1]
+    assert '{"score": <int 0-100>' in first[1]["text"]
+    assert first[0]["text"].endswith("Grant A")
+    
+    with pytest.raises(ValueError):
+        get_prompt_blocks("eligibility", "Grant A")
+    with pytest.raises(ValueError):
+        get_prompt_blocks("unknown", "Grant A")
+
+
+def test_scorer_import_does_not_load_anthropic_or_yaml():
+    """Importing the scorer package leaves the Anthropic SDK and PyYAML unloaded."""
+    
+    import subprocess
+    import sys
+    
+    code = "import sys, scorer; sys.exit('anthropic' in sys.modules or 'yaml' in sys.modules)"
+    completed = subprocess.run([sys.executable, "-c", code], cwd=str(Path(__file__).parent.parent))
+    
+    assert completed.returncode == 0
+
+
+def test_find_semantic_matches_reports_every_category_hit():
+    """Each (category, capability) hit is reported with surrounding context."""
+    
+    from scorer import find_semantic_matches
+    
+    text = "Build Machine Learning models and enforce Data Governance across systems."
+    matches = find_semantic_matches(text)
+    
+    hits = {(category, capability) for category, capability, _ in matches}
+    assert ("data science", "machine learning") in hits
+    assert ("artificial intelligence", "machine learning") in hits
+    assert ("decision support", "machine learning models") in hits
+    assert ("cyberinfrastructure", "data governance") in hits
+    assert all("Machine Learning" in context or "Data Governance" in context for _, _, context in matches)
+    assert find_semantic_matches("") == []
+
+
+def test_find_semantic_matches_extracts_context_once_per_keyword():
+    """A keyword listed under several categories has its context extracted once."""
+    
+    from scorer import semantic_map
+    
+    text = "Applied machine learning for grant triage."
+    with patch.object(semantic_map, "_context_at", wraps=semantic_map._context_at) as context_at:
+        matches = semantic_map.find_semantic_matches(text)
+    
+    ml_contexts = [context for _, capability, context in matches if capability == "machine learning"]
+    assert len(ml_contexts) >= 2
+    assert context_at.call_count == 1
@@ -33,6 +33,20 @@ SAM_GOV_OPP = _make_opportunity("sam.gov", "SAM-001", "SAM.gov Opp")
 SBIR_GOV_OPP = _make_opportunity("sbir.gov", "SBIR-001", "SBIR.gov Opp")
 
 
+def _mock_adapter(source_name: str, opportunities: list[GrantOpportunity]) -> AsyncMock:
+    """Build an adapter mock whose stream_fetch yields its fetch_opportunities result."""
+    adapter = AsyncMock()
+    adapter.source_name = source_name
+    adapter.fetch_opportunities = AsyncMock(return_value=opportunities)
+
+    async def stream_fetch():
+        for opp in await adapter.fetch_opportunities():
+            yield opp
+
+    adapter.stream_fetch = stream_fetch
+    return adapter
+
+
 @pytest.mark.asyncio
 async def test_full_pipeline_smoke():
     """End-to-end smoke: adapters → dedup → db insert, all external deps mocked."""
@@ -44,45 +58,45 @@ async def test_full_pipeline_smoke():
     fake_config.polling_interval_minutes = 60
     fake_config.log_level = "WARNING"
 
-    mock_db = AsyncMock()
-    mock_db.get_existing_hashes = AsyncMock(return_value=set())
-    mock_db.insert_opportunities = AsyncMock(return_value=3)
+    inserted: list[GrantOpportunity] = []
 
-    mock_grants = AsyncMock()
-    mock_grants.source_name = "grants.gov"
-    mock_grants.fetch_opportunities = AsyncMock(return_value=[GRANTS_GOV_OPP])
+    async def _collect(stream):
+        async for opp in stream:
+            inserted.append(opp)
+        return len(inserted)
 
-    mock_sam = AsyncMock()
-    mock_sam.source_name = "sam.gov"
-    mock_sam.fetch_opportunities = AsyncMock(return_value=[SAM_GOV_OPP])
+    mock_db = AsyncMock()
+    mock_db.get_existing_hashes = MagicMock(return_value=set())
+    mock_db.insert_opportunities = AsyncMock(side_effect=_collect)
 
-    mock_sbir = AsyncMock()
-    mock_sbir.source_name = "sbir.gov"
-    mock_sbir.fetch_opportunities = AsyncMock(return_value=[SBIR_GOV_OPP])
+    mock_grants = _mock_adapter("grants.gov", [GRANTS_GOV_OPP])
+    mock_sam = _mock_adapter("sam.gov", [SAM_GOV_OPP])
+    mock_sbir = _mock_adapter("sbir.gov", [SBIR_GOV_OPP])
 
     # python_ingestion.main uses relative imports, so we patch via package path
     # First ensure the package is importable
     import python_ingestion.main as _main_mod
 
     with (
-        patch.object(_main_mod, "load_config", return_value=fake_config),
         patch.object(_main_mod, "SupabaseClient", return_value=mock_db),
         patch.object(_main_mod, "GrantsGovAdapter", return_value=mock_grants),
         patch.object(_main_mod, "SamGovAdapter", return_value=mock_sam),
         patch.object(_main_mod, "SbirGovAdapter", return_value=mock_sbir),
     ):
-        await _main_mod.poll_all_sources()
+        pipeline = _main_mod.build_pipeline(fake_config)
+        await _main_mod.poll_all_sources(*pipeline)
+        await _main_mod.poll_all_sources(*pipeline)
 
-    # DB was queried for existing hashes
-    mock_db.get_existing_hashes.assert_awaited_once()
+    # DB was queried for existing hashes only once, when the pipeline was built
+    mock_db.get_existing_hashes.assert_called_once()
 
-    # All three adapters fetched
-    mock_grants.fetch_opportunities.assert_awaited_once()
-    mock_sam.fetch_opportunities.assert_awaited_once()
-    mock_sbir.fetch_opportunities.assert_awaited_once()
+    # All three adapters fetched on each cycle
+    assert mock_grants.fetch_opportunities.await_count == 2
+    assert mock_sam.fetch_opportunities.await_count == 2
+    assert mock_sbir.fetch_opportunities.await_count == 2
 
-    # 3 new opportunities inserted (none deduped since hash set was empty)
-    mock_db.insert_opportunities.assert_awaited_once()
-    inserted = mock_db.insert_opportunities.call_args[0][0]
+    # 3 new opportunities streamed in on the first cycle; the second cycle
+    # dedups all of them against the in-memory hash set
+    assert mock_db.insert_opportunities.await_count == 2
     assert len(inserted) == 3, f"Expected 3, got {len(inserted)}"
     assert {opp.source for opp in inserted} == {"grants.gov", "sam.gov", "sbir.gov"}
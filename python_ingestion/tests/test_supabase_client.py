@@ -130,3 +130,23 @@ class TestSavePipelineRun:
         insert_data = mock_sb.table.return_value.insert.call_args[0][0]
         assert insert_data["errors"] == []
         assert insert_data["status"] == "completed"
+
+
+class TestInsertOpportunities:
+    @pytest.mark.asyncio
+    async def test_buffers_stream_into_batches(self, mock_supabase_client, sample_grant):
+        client, mock_sb = mock_supabase_client
+        mock_sb.table.return_value.insert.return_value.execute.side_effect = (
+            lambda: MagicMock(data=mock_sb.table.return_value.insert.call_args[0][0])
+        )
+
+        async def grants():
+            for _ in range(5):
+                yield sample_grant
+
+        inserted = await client.insert_opportunities(grants(), batch_size=2)
+
+        assert inserted == 5
+        batch_sizes = [len(c[0][0]) for c in mock_sb.table.return_value.insert.call_args_list]
+        assert batch_sizes == [2, 2, 1]
+        mock_sb.table.assert_called_with("grant_opportunities")
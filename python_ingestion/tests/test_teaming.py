@@ -8,28 +8,49 @@ Tests verify:
 5. No automated outreach
 """
 
+import asyncio
 import json
 import os
 import tempfile
+from unittest.mock import patch
 
 import httpx
+import orjson
 import pytest
 import respx
 
 from models.grant_opportunity import GrantOpportunity
 from models.scoring_result import ScoringResult, DimensionScore
 from models.teaming_partner import TeamingPartner
-from teaming.engine import generate_teaming_suggestions, ACTIONABLE_VERDICTS
+from teaming.engine import (
+    ACTIONABLE_VERDICTS,
+    generate_teaming_suggestions,
+    generate_teaming_suggestions_batch,
+    generate_teaming_suggestions_parallel,
+)
 from teaming.hardcoded_partners import (
     PartnerSourceError,
     get_matching_partners,
     _load_config_partners,
 )
-from teaming.usaspending_lookup import USAspendingPartner
+from teaming.usaspending_lookup import (
+    USAspendingPartner,
+    clear_lookup_cache,
+    lookup_partners_async,
+    lookup_partners_by_naics_and_agency,
+)
 
 
 # --- Fixtures ---
 
+@pytest.fixture(autouse=True)
+def _fresh_lookup_cache():
+    """Each test sees its own mocked USAspending responses."""
+    clear_lookup_cache()
+    yield
+    clear_lookup_cache()
+
+
 def _dim(score: float) -> DimensionScore:
     return DimensionScore(score=score, evidence_citations=["test"])
 
@@ -127,6 +148,147 @@ class TestUSASpendingAPIPartners:
         assert partners[0].naics_codes == ["541511"]
         assert partners[0].award_count == 1
 
+    @respx.mock
+    def test_repeat_lookups_are_cached(self):
+        """Same agency + NAICS set hits the API once; failures are retried."""
+        route = respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            side_effect=[
+                httpx.Response(500),
+                httpx.Response(200, json=USA_SPENDING_RESPONSE),
+            ]
+        )
+
+        assert lookup_partners_by_naics_and_agency("NSF", ["541512", "541511"]) == []
+        first = lookup_partners_by_naics_and_agency("NSF", ["541512", "541511"])
+        second = lookup_partners_by_naics_and_agency("NSF", ["541511", "541512"])
+
+        assert route.call_count == 2
+        assert [p.name for p in second] == [p.name for p in first] == ["TechCorp Inc.", "DataSystems LLC"]
+        assert second is not first
+
+    @respx.mock
+    def test_lookups_share_pooled_client(self):
+        """Distinct lookups go through the one module-level client."""
+        from teaming import usaspending_lookup
+
+        route = respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json=USA_SPENDING_RESPONSE)
+        )
+
+        with patch.object(usaspending_lookup.httpx, "Client", side_effect=AssertionError("new client")):
+            lookup_partners_by_naics_and_agency("NSF", ["541511"])
+            lookup_partners_by_naics_and_agency("DOE", ["541512"])
+
+        assert route.call_count == 2
+        assert not usaspending_lookup._CLIENT.is_closed
+
+    @respx.mock
+    def test_malformed_response_is_not_cached(self):
+        """A non-JSON body is logged and treated as no results."""
+        route = respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            side_effect=[
+                httpx.Response(200, content=b"<html>maintenance</html>"),
+                httpx.Response(200, json=USA_SPENDING_RESPONSE),
+            ]
+        )
+
+        assert lookup_partners_by_naics_and_agency("NSF") == []
+        assert len(lookup_partners_by_naics_and_agency("NSF")) == 2
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_non_object_json_is_not_cached(self):
+        """Valid JSON that isn't an object (null, a list) is treated as no results."""
+        route = respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            side_effect=[
+                httpx.Response(200, content=b"null"),
+                httpx.Response(200, json=[{"Recipient Name": "TechCorp Inc."}]),
+                httpx.Response(200, json=USA_SPENDING_RESPONSE),
+            ]
+        )
+
+        assert lookup_partners_by_naics_and_agency("NSF") == []
+        assert lookup_partners_by_naics_and_agency("NSF") == []
+        assert len(lookup_partners_by_naics_and_agency("NSF")) == 2
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_null_fields_and_duplicate_names_are_skipped(self):
+        """Null recipients are dropped and names dedupe case-insensitively."""
+        respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json={"results": [
+                {"Recipient Name": None, "NAICS Code": "541511"},
+                {"Recipient Name": " TechCorp Inc. ", "NAICS Code": None, "Awarding Agency": None},
+                {"Recipient Name": "TECHCORP INC.", "NAICS Code": "541512"},
+            ]})
+        )
+
+        partners = lookup_partners_by_naics_and_agency("NSF")
+        assert [(p.name, p.naics_codes, p.agency) for p in partners] == [("TechCorp Inc.", [], "")]
+
+    @respx.mock
+    def test_request_body_shape(self):
+        """Payload carries the agency, NAICS codes and the fixed search window."""
+        route = respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json=USA_SPENDING_RESPONSE)
+        )
+
+        lookup_partners_by_naics_and_agency("NSF", ["541511"], limit=3)
+
+        body = json.loads(route.calls.last.request.content)
+        assert body["filters"] == {
+            "naics_codes": ["541511"],
+            "agencies": [{"type": "awarding", "tier": "toptier", "name": "NSF"}],
+            "time_period": [{"start_date": "2020-01-01", "end_date": "2026-12-31"}],
+        }
+        assert body["fields"] == ["Recipient Name", "Award Amount", "NAICS Code", "Awarding Agency"]
+        assert body["limit"] == 3
+
+    @respx.mock
+    def test_network_errors_are_swallowed_but_bugs_are_not(self):
+        """Transport failures return []; unexpected exceptions propagate."""
+        respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            side_effect=httpx.ConnectTimeout("timed out")
+        )
+        assert lookup_partners_by_naics_and_agency("NSF") == []
+
+        respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json=USA_SPENDING_RESPONSE)
+        )
+        with patch("teaming.usaspending_lookup.orjson.loads", side_effect=KeyError("bug")):
+            with pytest.raises(KeyError):
+                lookup_partners_by_naics_and_agency("NSF")
+
+    @respx.mock
+    def test_naics_accepts_any_sequence_and_empty_means_default(self):
+        """Tuples, lists and the default all share one cache entry; [] means VTKL_NAICS."""
+        route = respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json=USA_SPENDING_RESPONSE)
+        )
+
+        lookup_partners_by_naics_and_agency("NSF", [])
+        lookup_partners_by_naics_and_agency("NSF")
+        lookup_partners_by_naics_and_agency("NSF", ("541990", "541512", "541511"))
+
+        assert route.call_count == 1
+        body = json.loads(route.calls.last.request.content)
+        assert body["filters"]["naics_codes"] == ["541511", "541512", "541990"]
+
+    @respx.mock
+    def test_blank_agency_skips_api(self):
+        """Blank agency never reaches USAspending and goes straight to config fallback."""
+        route = respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json=USA_SPENDING_RESPONSE)
+        )
+
+        assert lookup_partners_by_naics_and_agency("") == []
+        assert lookup_partners_by_naics_and_agency("   ") == []
+        assert asyncio.run(lookup_partners_async("")) == []
+        os.environ.pop("PARTNER_CONFIG_PATH", None)
+        with pytest.raises(PartnerSourceError):
+            get_matching_partners(agency="  ")
+        assert route.call_count == 0
+
 
 # --- Test 2: Config file fallback ---
 
@@ -169,6 +331,30 @@ class TestConfigFallback:
             os.environ.pop("PARTNER_CONFIG_PATH", None)
             os.unlink(config_path)
 
+    def test_config_parsed_once_until_file_changes(self):
+        """Config is re-parsed only when the file changes; patterns are pre-lowercased."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(SAMPLE_CONFIG, f)
+            config_path = f.name
+
+        try:
+            os.environ["PARTNER_CONFIG_PATH"] = config_path
+            with patch("teaming.hardcoded_partners.orjson.loads", wraps=orjson.loads) as loads:
+                first = _load_config_partners()
+                second = _load_config_partners()
+                assert loads.call_count == 1
+                assert [p.name for p in second] == [p.name for p in first]
+                assert first[0].agency_patterns_lower == ("nsf", "national science foundation")
+
+                with open(config_path, "w") as f:
+                    json.dump(SAMPLE_CONFIG[:1], f)
+                os.utime(config_path, ns=(0, 0))
+                assert len(_load_config_partners()) == 1
+                assert loads.call_count == 2
+        finally:
+            os.environ.pop("PARTNER_CONFIG_PATH", None)
+            os.unlink(config_path)
+
 
 # --- Test 3: Error when neither source available ---
 
@@ -229,6 +415,108 @@ class TestEngineIntegration:
         partners = generate_teaming_suggestions(opp, scoring)
         assert partners == []
 
+    @respx.mock
+    def test_batch_runs_lookups_concurrently_in_order(self):
+        """Batch suggestions overlap lookups and keep input order."""
+        in_flight = peak = 0
+
+        async def _respond(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json=USA_SPENDING_RESPONSE)
+
+        route = respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            side_effect=_respond
+        )
+        os.environ.pop("PARTNER_CONFIG_PATH", None)
+
+        agencies = ["NSF", "DOE", "DOD", "USDA"]
+        opps = [_make_opportunity(source_opportunity_id=f"OPP-{a}", agency=a) for a in agencies]
+        scorings = [_make_scoring("GO"), _make_scoring("MONITOR"), _make_scoring("SHAPE"), _make_scoring("GO")]
+
+        batches = asyncio.run(generate_teaming_suggestions_batch(opps, scorings))
+
+        assert route.call_count == 3
+        assert peak == 3
+        assert batches[1] == []
+        for opp, partners in zip(opps, batches, strict=True):
+            assert all(p.opportunity_id == opp.source_opportunity_id for p in partners)
+        assert [p.partner_name for p in batches[0]] == ["TechCorp Inc.", "DataSystems LLC"]
+
+    @respx.mock
+    def test_batch_coalesces_identical_lookups(self):
+        """One request per distinct agency + NAICS set, fanned out to each opportunity."""
+        route = respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json=USA_SPENDING_RESPONSE)
+        )
+        os.environ.pop("PARTNER_CONFIG_PATH", None)
+
+        opps = [
+            _make_opportunity(source_opportunity_id="A", agency="NSF", naics_codes=["541512", "541511"]),
+            _make_opportunity(source_opportunity_id="B", agency="NSF", naics_codes=["541511", "541512"]),
+            _make_opportunity(source_opportunity_id="C", agency="NSF"),
+            _make_opportunity(source_opportunity_id="D", agency="NSF", naics_codes=["541511", "541512", "541990"]),
+            _make_opportunity(source_opportunity_id="E", agency="DOE"),
+        ]
+
+        batches = asyncio.run(generate_teaming_suggestions_batch(opps, [_make_scoring("GO")] * len(opps)))
+
+        assert route.call_count == 3
+        assert [{p.opportunity_id for p in partners} for partners in batches] == [{o} for o in "ABCDE"]
+
+    @respx.mock
+    def test_parallel_wrapper_runs_batch_from_sync_code(self):
+        """The sync wrapper returns the same per-opportunity lists as the batch."""
+        respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json=USA_SPENDING_RESPONSE)
+        )
+        os.environ.pop("PARTNER_CONFIG_PATH", None)
+
+        opps = [_make_opportunity(source_opportunity_id="A"), _make_opportunity(source_opportunity_id="B")]
+        batches = generate_teaming_suggestions_parallel(opps, [_make_scoring("GO"), _make_scoring("NO-GO")])
+
+        assert [p.opportunity_id for p in batches[0]] == ["A", "A"]
+        assert batches[1] == []
+
+    @respx.mock
+    def test_batch_uses_one_client_and_closes_it(self):
+        """Each batch opens one pooled AsyncClient and closes it afterwards."""
+        from teaming import engine, usaspending_lookup
+
+        respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json=USA_SPENDING_RESPONSE)
+        )
+        os.environ.pop("PARTNER_CONFIG_PATH", None)
+        opened = []
+
+        def _open():
+            client = usaspending_lookup.open_async_client()
+            opened.append(client)
+            return client
+
+        opps = [_make_opportunity(source_opportunity_id=a, agency=a) for a in ("NSF", "DOE")]
+        with patch.object(engine, "open_async_client", side_effect=_open):
+            generate_teaming_suggestions_parallel(opps, [_make_scoring("GO")] * 2)
+            clear_lookup_cache()
+            generate_teaming_suggestions_parallel(opps, [_make_scoring("GO")] * 2)
+
+        assert len(opened) == 2
+        assert all(client.is_closed for client in opened)
+
+    @respx.mock
+    def test_batch_raises_when_no_source_available(self):
+        """Batch suggestions surface PartnerSourceError like the sync path."""
+        respx.post("https://api.usaspending.gov/api/v2/search/spending_by_award/").mock(
+            return_value=httpx.Response(200, json={"results": []})
+        )
+        os.environ.pop("PARTNER_CONFIG_PATH", None)
+
+        with pytest.raises(PartnerSourceError):
+            asyncio.run(generate_teaming_suggestions_batch([_make_opportunity()], [_make_scoring("GO")]))
+
 
 # --- Test 5: No automated outreach ---
 
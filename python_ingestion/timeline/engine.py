@@ -114,63 +114,69 @@ def generate_timeline(
     )
 
 
+# Milestone templates: (LeadTimeConfig field, name, owner_type, description)
+_MILESTONE_TEMPLATES: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "go_no_go_days",
+        "Internal Go/No-Go Decision",
+        "human",
+        "Team reviews verdict card and commits resources",
+    ),
+    (
+        "partner_outreach_days",
+        "Partner Outreach & LOI Collection",
+        "human",
+        "Contact teaming partners, collect letters of intent/support",
+    ),
+    (
+        "draft_narrative_days",
+        "Draft Narrative Generation",
+        "automated",
+        "AI generates first draft from opportunity requirements and VTKL profile",
+    ),
+    (
+        "human_review_days",
+        "Human Review & Revision",
+        "human",
+        "Subject matter expert reviews, revises narrative, adds domain expertise",
+    ),
+    (
+        "budget_compliance_days",
+        "Budget & Compliance Check",
+        "human",
+        "Financial review, compliance verification, cost documentation",
+    ),
+    (
+        "final_package_days",
+        "Final Submission Package",
+        "automated",
+        "Automated formatting, attachment assembly, portal upload preparation",
+    ),
+)
+
+
 def _build_milestones(deadline: date, config: LeadTimeConfig) -> list[Milestone]:
-    """Build milestone list from lead-time config, ordered earliest first."""
+    """Build milestone list from lead-time config, ordered earliest first.
 
-    raw: list[tuple[int, str, str, str]] = [
-        # (days_before, name, owner_type, description)
-        (
-            config.go_no_go_days,
-            "Internal Go/No-Go Decision",
-            "human",
-            "Team reviews verdict card and commits resources",
-        ),
-        (
-            config.partner_outreach_days,
-            "Partner Outreach & LOI Collection",
-            "human",
-            "Contact teaming partners, collect letters of intent/support",
-        ),
-        (
-            config.draft_narrative_days,
-            "Draft Narrative Generation",
-            "automated",
-            "AI generates first draft from opportunity requirements and VTKL profile",
-        ),
-        (
-            config.human_review_days,
-            "Human Review & Revision",
-            "human",
-            "Subject matter expert reviews, revises narrative, adds domain expertise",
-        ),
-        (
-            config.budget_compliance_days,
-            "Budget & Compliance Check",
-            "human",
-            "Financial review, compliance verification, cost documentation",
-        ),
+    Templates are trusted internal data, so milestones are built with
+    ``model_construct`` to skip per-field validation.
+    """
+    raw = sorted(
         (
-            config.final_package_days,
-            "Final Submission Package",
-            "automated",
-            "Automated formatting, attachment assembly, portal upload preparation",
+            (getattr(config, field_name), name, owner, desc)
+            for field_name, name, owner, desc in _MILESTONE_TEMPLATES
         ),
-    ]
+        key=lambda x: x[0],
+        reverse=True,
+    )
 
-    # Sort by days_before descending (earliest milestone first)
-    raw.sort(key=lambda x: x[0], reverse=True)
-
-    milestones: list[Milestone] = []
-    for days_before, name, owner, desc in raw:
-        due = deadline - timedelta(days=days_before)
-        milestones.append(
-            Milestone(
-                name=name,
-                due_date=due,
-                days_before_deadline=days_before,
-                owner_type=owner,
-                description=desc,
-            )
+    return [
+        Milestone.model_construct(
+            name=name,
+            due_date=deadline - timedelta(days=days_before),
+            days_before_deadline=days_before,
+            owner_type=owner,
+            description=desc,
         )
-
-    return milestones
+        for days_before, name, owner, desc in raw
+    ]